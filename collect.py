@@ -1,13 +1,17 @@
 import argparse
 import asyncio
+import contextlib
 import getpass
 import logging
 from pathlib import Path
 
 from src.config import Settings
 from src.core import ResourceCollector
+from src.query.search import SEARCH_INDEX_FILE, SearchIndexBuilder
 from src.services.auto_downloader import AutoDownloader
+from src.services.instrumentation import REPORT_FILE, Instrumentation, span
 from src.services.item_formatter import ItemFormatterService
+from src.services.profiling import PROFILE_DIR, StageProfiler
 
 
 def setup_logging() -> None:
@@ -38,6 +42,68 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--save-raw", action="store_true", help="Save raw game files to static/ directory when using remote mode"
     )
+    parser.add_argument(
+        "--formatted-format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Output format of the formatted items file (default: json)",
+    )
+    parser.add_argument(
+        "--compact-items",
+        action="store_true",
+        help="Also write items.compact.json with factored-out image URL prefixes",
+    )
+    parser.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Do not write schema.bin, the memory-mappable binary snapshot of the schema",
+    )
+    parser.add_argument(
+        "--no-search-index",
+        action="store_true",
+        help="Do not write search_index.json, the name search index built from the formatted items",
+    )
+    parser.add_argument(
+        "--columnar",
+        choices=["auto", "npy", "parquet"],
+        help="Also export items, paints and definitions as column arrays (auto: parquet if pyarrow is installed)",
+    )
+    parser.add_argument(
+        "--compress",
+        metavar="FORMATS",
+        default="",
+        help="Comma-separated precompressed siblings to write next to outputs: gz, br, zst (default: none)",
+    )
+    parser.add_argument(
+        "--instrument",
+        nargs="?",
+        const=REPORT_FILE,
+        metavar="REPORT",
+        help=f"Time every stage, track its memory peak and write a run report (default: {REPORT_FILE})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile every pipeline stage with cProfile: pstats and flamegraph collapsed-stack files",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Write the top tracemalloc allocation sites of every pipeline stage",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path(PROFILE_DIR),
+        help=f"Output directory of --profile and --profile-memory (default: {PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--format-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of processes used to format items (default: 1)",
+    )
 
     return parser.parse_args()
 
@@ -71,7 +137,13 @@ if __name__ == "__main__":
                 exit(1)
 
     # Create settings with local file support
-    settings = Settings()
+    settings = Settings(
+        compact_items=args.compact_items,
+        columnar_format=args.columnar,
+        write_snapshot=not args.no_snapshot,
+        write_search_index=not args.no_search_index,
+        compress_formats=tuple(fmt.strip() for fmt in args.compress.split(",") if fmt.strip()),
+    )
 
     # Create collector with local file support if requested
     if args.local:
@@ -100,17 +172,52 @@ if __name__ == "__main__":
         else:
             logging.info("Using remote URLs for data fetching")
 
-    try:
-        asyncio.run(collector.collect())
+    instrumentation = None
+    profiler = None
+    if args.instrument or args.profile or args.profile_memory:
+        # Memory tracing slows every allocation down, so a plain --profile runs without it
+        instrumentation = Instrumentation(track_memory=bool(args.instrument or args.profile_memory))
+    if args.profile or args.profile_memory:
+        profiler = StageProfiler(args.profile_dir, cpu=args.profile, memory=args.profile_memory)
+        profiler.attach(instrumentation)
 
-        # 数据收集完成后，自动格式化物品数据
-        logging.info("Starting item formatting...")
-        formatter = ItemFormatterService(schemas_dir="schemas")
-        formatted_items = formatter.save_formatted_items()
-        logging.info(f"Item formatting completed. {len(formatted_items)} items processed.")
+    try:
+        with instrumentation.activate() if instrumentation else contextlib.nullcontext():
+            processed_data = asyncio.run(collector.collect())
+
+            # 数据收集完成后，自动格式化物品数据
+            logging.info("Starting item formatting...")
+            with span("format") as stage:
+                formatter = ItemFormatterService.from_processed_data(
+                    processed_data, schemas_dir=settings.resource_dir, workers=args.format_workers
+                )
+                search_index = SearchIndexBuilder() if settings.write_search_index else None
+                formatted_count = formatter.save_formatted_items(
+                    output_format=args.formatted_format,
+                    items=search_index.collect(formatter.iter_items()) if search_index else None,
+                )
+                stage.set_records(formatted_count)
+            logging.info(f"Item formatting completed. {formatted_count} items processed.")
+
+            if search_index:
+                logging.info("Saving search index...")
+                with span("search_index") as stage:
+                    index = search_index.build()
+                    collector.file_manager.save_json_files((SEARCH_INDEX_FILE, index.to_dict()), compact=True)
+                    collector.file_manager.save_manifest()
+                    stage.set_records(len(index))
 
     except KeyboardInterrupt:
         logging.info("Collection interrupted by user")
     except Exception as e:
         logging.error(f"Collection failed: {e}")
         raise
+    finally:
+        # Failed runs get a report too, covering the stages up to the failure
+        if args.instrument:
+            report_path = instrumentation.save_report(args.instrument)
+            print(instrumentation.format_summary())
+            logging.info(f"Run report saved to {report_path}")
+        if profiler:
+            profile_paths = profiler.close()
+            logging.info(f"Saved {len(profile_paths)} profile files to {args.profile_dir}")
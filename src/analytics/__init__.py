@@ -0,0 +1,9 @@
+"""Vectorized analytics over the generated schema (requires numpy).
+
+The inventory enricher lives in ``src.analytics.enrich``, which doubles as its command line entry point.
+"""
+
+from .tradeup import TradeUpEngine, TradeUpResult
+from .wear import WearClassifier, WearResult
+
+__all__ = ["TradeUpEngine", "TradeUpResult", "WearClassifier", "WearResult"]
@@ -0,0 +1,333 @@
+"""Batch enrichment of inventory records with schema names, rarity, images, wear and containers.
+
+Records are ``(defindex, paintindex, float, quality, origin)`` tuples, with paint index 0 for unpainted
+items. Every lookup goes through arrays built once from the schema: items are found by binary search
+over the sorted ``defindex * PAINT_STRIDE + paintindex`` keys, and rarities, qualities and origins are
+dense arrays indexed by their id, so a batch is enriched with a handful of NumPy gathers.
+
+Command line (streams CSV or NDJSON with ``defindex,paintindex,float,quality,origin`` fields, other
+fields are passed through, records with unparseable fields get an ``error`` and are not matched)::
+
+    python -m src.analytics.enrich inventory.csv -o enriched.ndjson --schemas-dir schemas
+"""
+
+import argparse
+import csv
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, TextIO
+
+from ..exceptions import ConfigurationError
+from ..query import CS2Schema
+from ..services.serializer import JsonSerializer
+from .wear import WearClassifier, np, require_numpy
+
+PAINT_STRIDE = 1 << 20
+
+INPUT_FIELDS = ("defindex", "paintindex", "float", "quality", "origin")
+OUTPUT_FIELDS = (
+    "found",
+    "item_id",
+    "name",
+    "name_zh",
+    "image",
+    "containers",
+    "rarity",
+    "rarity_name",
+    "rarity_color",
+    "wear",
+    "wear_valid",
+    "wear_percentile",
+    "quality_name",
+    "quality_name_zh",
+    "origin_name",
+)
+# rarities.json name variant per item type name, "weapon" for the rest
+RARITY_NAME_OF_TYPE = {
+    "Agent": "character",
+    "Collectible": "nonweapon",
+    "Gloves": "nonweapon",
+    "Graffiti": "nonweapon",
+    "Key": "nonweapon",
+    "Music Kit": "nonweapon",
+    "Patch": "nonweapon",
+    "Sticker": "nonweapon",
+}
+RARITY_NAME_KEYS = ("weapon", "nonweapon", "character")
+
+
+def _dense(table: Mapping[str, Any], value_of: Any) -> "np.ndarray":
+    """Object array indexed by the integer keys of a table, with an empty string at index -1."""
+    size = max((int(key) for key in table), default=-1) + 2
+    values = np.full(size, "", dtype=object)
+    for key, entry in table.items():
+        values[int(key)] = value_of(entry)
+    return values
+
+
+class InventoryEnricher:
+    """
+    Enrich inventory columns or record streams through precomputed lookup arrays.
+
+    ``types`` (types.json) picks the weapon, nonweapon or character rarity name of every item, so
+    stickers read "Exotic" and agents "Master Agent"; without it every item gets the weapon name.
+
+    Example:
+        enricher = InventoryEnricher.load("schemas")
+        columns = enricher.enrich_columns(defindex, paintindex, floats, quality, origin)
+        columns["name"], columns["wear"], columns["rarity_color"]
+    """
+
+    def __init__(
+        self,
+        schema: CS2Schema,
+        wears: list[dict[str, Any]],
+        qualities: Mapping[str, dict[str, Any]],
+        origins: Mapping[str, str],
+        types: Mapping[str, str] | None = None,
+    ):
+        require_numpy()
+        self.schema = schema
+        self.wear_classifier = WearClassifier(schema.paints, wears)
+
+        items = sorted(schema, key=lambda item: int(item.defindex) * PAINT_STRIDE + int(item.paintindex or 0))
+        self.item_keys = np.array(
+            [int(item.defindex) * PAINT_STRIDE + int(item.paintindex or 0) for item in items], dtype=np.int64
+        )
+        # Row -1 (one past the items) is the "not found" row
+        self.item_ids = np.array([item.id for item in items] + [""], dtype=object)
+        self.item_names = np.array([item.name for item in items] + [""], dtype=object)
+        self.item_names_zh = np.array([item.name_zh for item in items] + [""], dtype=object)
+        self.item_images = np.array([item.image or "" for item in items] + [""], dtype=object)
+        self.item_containers = np.array([",".join(item.containers) for item in items] + [""], dtype=object)
+        self.item_rarities = np.array(
+            [int(item.rarity) if item.rarity is not None else -1 for item in items] + [-1], dtype=np.int16
+        )
+        types = types or {}
+        name_keys = [
+            RARITY_NAME_OF_TYPE.get(types.get(schema.definitions.get(item.defindex, {}).get("type", ""), ""), "weapon")
+            for item in items
+        ]
+        self.item_rarity_variants = np.array([RARITY_NAME_KEYS.index(key) for key in name_keys] + [0], dtype=np.int8)
+
+        # One row per RARITY_NAME_KEYS entry, character names fall back to the nonweapon ones
+        self.rarity_names = np.stack(
+            [
+                _dense(schema.rarities, lambda rarity: rarity.get("weapon", "")),
+                _dense(schema.rarities, lambda rarity: rarity.get("nonweapon", "")),
+                _dense(schema.rarities, lambda rarity: rarity.get("character") or rarity.get("nonweapon", "")),
+            ]
+        )
+        self.rarity_colors = _dense(schema.rarities, lambda rarity: rarity.get("color", ""))
+        self.quality_names = _dense(qualities, lambda quality: quality.get("name", ""))
+        self.quality_names_zh = _dense(qualities, lambda quality: quality.get("name_zh", ""))
+        self.origin_names = _dense(origins, lambda origin: origin)
+        self.wear_names = np.append(self.wear_classifier.band_names.astype(object), "")
+
+    @classmethod
+    def load(cls, schemas_dir: str | Path = "schemas", serializer: JsonSerializer | None = None) -> "InventoryEnricher":
+        """Load the schema tables from a directory of generated JSON files."""
+        schemas_dir = Path(schemas_dir)
+        serializer = serializer or JsonSerializer()
+        tables = {}
+        for table in ("wears", "qualities", "origins", "types"):
+            file_path = schemas_dir / f"{table}.json"
+            try:
+                tables[table] = serializer.load_file(file_path)
+            except (OSError, ValueError) as e:
+                raise ConfigurationError(
+                    f"Failed to load schema file {file_path.name}: {e}", details={"path": str(file_path)}
+                ) from e
+        return cls(CS2Schema.load(schemas_dir, serializer), **tables)
+
+    def lookup_rows(self, defindex: "np.ndarray", paintindex: "np.ndarray") -> "np.ndarray":
+        """Row of every (defindex, paintindex) pair in the item arrays, -1 for unknown pairs."""
+        keys = np.asarray(defindex, dtype=np.int64) * PAINT_STRIDE + np.asarray(paintindex, dtype=np.int64)
+        rows = np.searchsorted(self.item_keys, keys)
+        rows[rows == len(self.item_keys)] = 0
+        if len(self.item_keys):
+            rows[self.item_keys[rows] != keys] = -1
+        else:
+            rows[:] = -1
+        return rows
+
+    def enrich_columns(
+        self,
+        defindex: "np.ndarray",
+        paintindex: "np.ndarray",
+        floats: "np.ndarray",
+        quality: "np.ndarray",
+        origin: "np.ndarray",
+    ) -> dict[str, "np.ndarray"]:
+        """
+        Enrich parallel input columns.
+
+        Returns:
+            OUTPUT_FIELDS columns; strings are empty and ids -1 where nothing matched
+        """
+        rows = self.lookup_rows(defindex, paintindex)
+        rarity = self.item_rarities[rows]
+        wear = self.wear_classifier.classify(np.asarray(paintindex), floats)
+
+        return {
+            "found": rows >= 0,
+            "item_id": self.item_ids[rows],
+            "name": self.item_names[rows],
+            "name_zh": self.item_names_zh[rows],
+            "image": self.item_images[rows],
+            "containers": self.item_containers[rows],
+            "rarity": rarity,
+            "rarity_name": self.rarity_names[self.item_rarity_variants[rows], self._clip(rarity, self.rarity_names[0])],
+            "rarity_color": self.rarity_colors[self._clip(rarity, self.rarity_colors)],
+            "wear": self.wear_names[wear.band],
+            "wear_valid": wear.valid,
+            "wear_percentile": wear.percentile,
+            "quality_name": self.quality_names[self._clip(quality, self.quality_names)],
+            "quality_name_zh": self.quality_names_zh[self._clip(quality, self.quality_names_zh)],
+            "origin_name": self.origin_names[self._clip(origin, self.origin_names)],
+        }
+
+    def enrich_records(self, records: Iterable[Mapping[str, Any]], batch_size: int = 65536) -> Iterator[dict]:
+        """
+        Enrich a stream of records in batches, yielding each record extended with OUTPUT_FIELDS.
+
+        Records are mappings with INPUT_FIELDS keys; numeric strings (as read from CSV) are accepted.
+        Missing or empty fields count as 0, or NaN for the float. Records with a field that is not a
+        number get an ``error`` naming it and are enriched as not found; ``error`` is None otherwise.
+        """
+        batch: list[Mapping[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield from self._enrich_batch(batch)
+                batch = []
+        if batch:
+            yield from self._enrich_batch(batch)
+
+    def _enrich_batch(self, batch: list[Mapping[str, Any]]) -> Iterator[dict]:
+        errors: list[str | None] = [None] * len(batch)
+        columns = {}
+        for field in INPUT_FIELDS:
+            values = []
+            for i, record in enumerate(batch):
+                value = _parse_number(record.get(field), integer=field != "float")
+                if value is None:
+                    errors[i] = errors[i] or f"invalid {field}: {record.get(field)!r}"
+                values.append(value)
+            columns[field] = values
+
+        ints = {
+            field: np.array([-1 if value is None else value for value in columns[field]], dtype=np.int64)
+            for field in INPUT_FIELDS
+            if field != "float"
+        }
+        floats = np.array([np.nan if value is None else value for value in columns["float"]], dtype=np.float64)
+        # A negative defindex with paint 0 never matches and a NaN float has no wear, so invalid records
+        # come out as not found
+        invalid = np.array([error is not None for error in errors], dtype=bool)
+        ints["defindex"][invalid] = -1
+        ints["paintindex"][invalid] = 0
+        floats[invalid] = np.nan
+        enriched = self.enrich_columns(ints["defindex"], ints["paintindex"], floats, ints["quality"], ints["origin"])
+        # One tolist() per column converts the NumPy scalars to Python values in bulk
+        values = [enriched[field].tolist() for field in OUTPUT_FIELDS]
+        for record, row, error in zip(batch, zip(*values, strict=True), errors, strict=True):
+            yield {**record, **dict(zip(OUTPUT_FIELDS, row, strict=True)), "error": error}
+
+    @staticmethod
+    def _clip(ids: "np.ndarray", table: "np.ndarray") -> "np.ndarray":
+        """Map ids outside a dense table to its trailing empty entry."""
+        ids = np.asarray(ids, dtype=np.int64)
+        return np.where((ids >= 0) & (ids < len(table) - 1), ids, -1)
+
+
+def _parse_number(value: Any, integer: bool) -> int | float | None:
+    """An input field as a number: missing or empty is 0 (NaN for floats), None if it is not a number."""
+    if value is None or value == "":
+        return 0 if integer else np.nan
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not integer:
+        return number
+    # "9.0" and 9.0 are accepted as 9, fractions, inf/nan and ids beyond int32 are not
+    return int(number) if number.is_integer() and abs(number) < 2**31 else None
+
+
+def _read_records(f: TextIO, input_format: str, serializer: JsonSerializer) -> Iterator[Mapping[str, Any]]:
+    if input_format == "csv":
+        yield from csv.DictReader(f)
+    else:
+        for line in f:
+            if line.strip():
+                yield serializer.loads(line)
+
+
+def _write_records(records: Iterable[dict], f: TextIO, output_format: str, serializer: JsonSerializer) -> int:
+    count = 0
+    if output_format == "csv":
+        writer: csv.DictWriter | None = None
+        for record in records:
+            if writer is None:
+                # The header is fixed by the first record, input fields only later records have are dropped
+                fieldnames = [*record, *(field for field in (*OUTPUT_FIELDS, "error") if field not in record)]
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+                writer.writeheader()
+            writer.writerow(_without_nan(record))
+            count += 1
+    else:
+        for record in records:
+            f.write(serializer.dumps(_without_nan(record)).decode("utf-8"))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def _without_nan(record: dict) -> dict:
+    """Blank out the NaN percentile of invalid wears, which has no JSON (or useful CSV) representation."""
+    percentile = record.get("wear_percentile")
+    if percentile is not None and percentile != percentile:
+        return {**record, "wear_percentile": None}
+    return record
+
+
+def _format_of(path: Path | None, default: str) -> str:
+    if path is None:
+        return default
+    return "csv" if path.suffix.lower() == ".csv" else "ndjson"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Enrich inventory records (CSV or NDJSON) with schema data")
+    parser.add_argument("input", type=Path, nargs="?", help="Input file (default: stdin)")
+    parser.add_argument("-o", "--output", type=Path, help="Output file (default: stdout)")
+    parser.add_argument("--input-format", choices=["csv", "ndjson"], help="Default: from the file extension")
+    parser.add_argument("--output-format", choices=["csv", "ndjson"], help="Default: from the file extension")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--batch-size", type=int, default=65536)
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or _format_of(args.input, "ndjson")
+    output_format = args.output_format or _format_of(args.output, "ndjson")
+    serializer = JsonSerializer(indent=None, sort_keys=False)
+    enricher = InventoryEnricher.load(args.schemas_dir)
+
+    source = args.input.open(encoding="utf-8", newline="") if args.input else sys.stdin
+    target = args.output.open("w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        records = enricher.enrich_records(_read_records(source, input_format, serializer), args.batch_size)
+        count = _write_records(records, target, output_format, serializer)
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            target.close()
+
+    print(f"Enriched {count} records", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
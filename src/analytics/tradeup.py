@@ -0,0 +1,187 @@
+"""Vectorized trade-up contract evaluation.
+
+A contract trades ten skins of one rarity for one skin of the next rarity, drawn from the collections
+of the inputs. Collections are the distinct item lists of containers.json (a case and its souvenir
+packages share one). An item's tier is its rarity within its collection, taken from the drop tables
+of container_drops.json; the paint kit rarity of paints.json often differs from it and is only used
+for items no drop table lists.
+
+Outcome probabilities follow the per-collection ticket rule: every input adds one ticket for each
+next-rarity skin of its collection, so an outcome's probability is the number of inputs from its
+collection divided by the total number of tickets. The output float is the inputs' average float
+remapped into the outcome's ``[wear_min, wear_max]`` range; with ``normalize_inputs`` every input
+float is first normalized into its own paint's range before averaging.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..query import CS2Schema, SchemaItem
+from ..services.serializer import JsonSerializer
+from .wear import np, require_numpy
+
+CONTRACT_SIZE = 10
+
+
+@dataclass(frozen=True, slots=True)
+class TradeUpResult:
+    """
+    Outcomes of a batch of contracts, padded to the largest number of outcomes in the batch.
+
+    ``outcomes`` holds engine item numbers (-1 for padding and for invalid contracts), sorted by
+    descending probability.
+    """
+
+    valid: "np.ndarray"  # (contracts,) bool
+    outcomes: "np.ndarray"  # (contracts, k) int32
+    probabilities: "np.ndarray"  # (contracts, k) float64, 0 for padding
+    floats: "np.ndarray"  # (contracts, k) float64, NaN for padding
+
+
+class TradeUpEngine:
+    """
+    Precomputed collection x rarity tables and batch evaluation of 10-input contracts.
+
+    Items are addressed by their engine number, see ``item_numbers``.
+
+    Example:
+        engine = TradeUpEngine.load("schemas")
+        inputs = engine.item_numbers([["[282]7"] * 10])
+        result = engine.evaluate(inputs, np.full((1, 10), 0.2))
+        [engine.items[n].name for n in result.outcomes[0] if n >= 0]
+    """
+
+    def __init__(self, schema: CS2Schema, drops: dict[str, dict[str, Any]] | None = None):
+        """
+        Args:
+            schema: Loaded schema
+            drops: Drop tables of container_drops.json, the source of the items' collection tiers
+        """
+        require_numpy()
+        self.schema = schema
+
+        # Tier of every item in its collection; a case and its souvenir packages agree on it
+        tier_of: dict[str, int] = {}
+        for drop in (drops or {}).values():
+            for rarity, group in drop.get("rarities", {}).items():
+                for item_id in group.get("items", ()):
+                    tier_of.setdefault(item_id, int(rarity))
+
+        # Collections: distinct item lists of the containers, items belong to the first one listing them
+        collection_of: dict[str, int] = {}
+        self.collections: list[str] = []  # container id representing each collection
+        seen: dict[frozenset[str], int] = {}
+        for container_id, container in schema.containers.items():
+            key = frozenset(container.get("items", ()))
+            if not key or key in seen:
+                continue
+            seen[key] = len(self.collections)
+            for item in schema.by_container(container_id):
+                collection_of.setdefault(item.id, len(self.collections))
+            self.collections.append(container_id)
+
+        for item in schema:
+            if item.id in collection_of and item.id not in tier_of and item.rarity is not None:
+                tier_of[item.id] = int(item.rarity)
+        self.items: list[SchemaItem] = [
+            item for item in schema if item.id in collection_of and item.id in tier_of and item.paintindex is not None
+        ]
+        self._number_of = {item.id: number for number, item in enumerate(self.items)}
+        self.item_collection = np.array([collection_of[item.id] for item in self.items], dtype=np.int32)
+        self.item_tier = np.array([tier_of[item.id] for item in self.items], dtype=np.int16)
+        paints = schema.paints
+        self.item_wear_min = np.array([paints.get(item.paintindex, {}).get("wear_min", 0.0) for item in self.items])
+        self.item_wear_max = np.array([paints.get(item.paintindex, {}).get("wear_max", 1.0) for item in self.items])
+
+        # tier -> (output item numbers, collections x outputs membership matrix)
+        self.outputs: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        for tier in np.unique(self.item_tier).tolist():
+            columns = np.flatnonzero(self.item_tier == tier + 1)
+            if not len(columns):
+                continue
+            membership = np.zeros((len(self.collections), len(columns)))
+            membership[self.item_collection[columns], np.arange(len(columns))] = 1.0
+            self.outputs[tier] = (columns, membership)
+
+    @classmethod
+    def load(cls, schemas_dir: str | Path = "schemas") -> "TradeUpEngine":
+        """Build the engine from a directory of generated JSON files."""
+        drops_path = Path(schemas_dir) / "container_drops.json"
+        drops = JsonSerializer().load_file(drops_path) if drops_path.exists() else None
+        return cls(CS2Schema.load(schemas_dir), drops)
+
+    def item_numbers(self, item_ids: "np.ndarray | list") -> "np.ndarray":
+        """Engine numbers of items.json ids, -1 for items that cannot take part in a contract."""
+        ids = np.asarray(item_ids, dtype=object)
+        numbers = np.fromiter((self._number_of.get(item_id, -1) for item_id in ids.ravel()), np.int32, ids.size)
+        return numbers.reshape(ids.shape)
+
+    def evaluate(self, inputs: "np.ndarray", floats: "np.ndarray", normalize_inputs: bool = False) -> TradeUpResult:
+        """
+        Evaluate contracts of CONTRACT_SIZE inputs each.
+
+        A contract is valid when all its inputs are known items of one rarity that has a next rarity
+        in at least one of their collections.
+
+        Args:
+            inputs: (contracts, 10) engine item numbers
+            floats: (contracts, 10) input floats
+            normalize_inputs: Average the inputs' floats normalized into their own wear ranges instead
+                of the raw floats
+        """
+        inputs = np.asarray(inputs, dtype=np.int64)
+        floats = np.asarray(floats, dtype=np.float64)
+        if inputs.ndim != 2 or inputs.shape[1] != CONTRACT_SIZE or floats.shape != inputs.shape:
+            raise ValueError(f"Expected (contracts, {CONTRACT_SIZE}) inputs and floats, got {inputs.shape}")
+        count = len(inputs)
+
+        known = ((inputs >= 0) & (inputs < len(self.items))).all(axis=1)
+        safe_inputs = np.where(known[:, None], inputs, 0)
+        tiers = self.item_tier[safe_inputs]
+        valid = known & (tiers == tiers[:, :1]).all(axis=1)
+
+        if normalize_inputs:
+            wear_min = self.item_wear_min[safe_inputs]
+            span = self.item_wear_max[safe_inputs] - wear_min
+            with np.errstate(invalid="ignore", divide="ignore"):
+                floats = np.where(span > 0, (floats - wear_min) / span, 0.0)
+        average = floats.mean(axis=1)
+
+        # Inputs per collection, one row per contract
+        cells = np.arange(count)[:, None] * len(self.collections) + self.item_collection[safe_inputs]
+        counts = np.bincount(cells.ravel(), minlength=count * len(self.collections))
+        counts = counts.reshape(count, len(self.collections)).astype(np.float64)
+
+        results = []
+        for tier in np.unique(tiers[valid, 0]).tolist():
+            rows = np.flatnonzero(valid & (tiers[:, 0] == tier))
+            if tier not in self.outputs:
+                valid[rows] = False
+                continue
+            columns, membership = self.outputs[tier]
+            tickets = counts[rows] @ membership  # inputs from each output's collection
+            total = tickets.sum(axis=1)
+            reachable = total > 0
+            valid[rows[~reachable]] = False
+            if reachable.any():
+                results.append((rows[reachable], columns, tickets[reachable] / total[reachable, None]))
+
+        width = max((int((probabilities > 0).sum(axis=1).max()) for _, _, probabilities in results), default=0)
+        outcomes = np.full((count, width), -1, dtype=np.int32)
+        probabilities_out = np.zeros((count, width))
+        floats_out = np.full((count, width), np.nan)
+        for rows, columns, probabilities in results:
+            # Most likely outcomes first; the stable sort keeps item order among equal probabilities
+            order = np.argsort(-probabilities, axis=1, kind="stable")[:, :width]
+            picked = np.take_along_axis(probabilities, order, axis=1)
+            items = columns[order]
+            present = picked > 0
+            wear_min = self.item_wear_min[items]
+            span = self.item_wear_max[items] - wear_min
+            k = order.shape[1]
+            outcomes[rows, :k] = np.where(present, items, -1)
+            probabilities_out[rows, :k] = picked
+            floats_out[rows, :k] = np.where(present, wear_min + average[rows, None] * span, np.nan)
+
+        return TradeUpResult(valid=valid, outcomes=outcomes, probabilities=probabilities_out, floats=floats_out)
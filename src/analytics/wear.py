@@ -0,0 +1,105 @@
+"""Vectorized wear classification of (paint index, float) pairs."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import ConfigurationError
+from ..services.serializer import JsonSerializer
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+
+def require_numpy() -> None:
+    """Raise a ConfigurationError when NumPy is not installed."""
+    if np is None:
+        raise ConfigurationError("Analytics require the numpy package")
+
+
+@dataclass(frozen=True, slots=True)
+class WearResult:
+    """Per-row results of WearClassifier.classify, parallel to its inputs."""
+
+    band: "np.ndarray"  # int8 index into wears.json, -1 for floats outside [0, 1]
+    valid: "np.ndarray"  # bool, float inside the paint's [wear_min, wear_max] range
+    percentile: "np.ndarray"  # float64 position of the float in the paint's range (0 best, 1 worst), NaN if invalid
+
+
+class WearClassifier:
+    """
+    Wear band, feasibility and percentile of paint floats, computed on whole arrays at once.
+
+    Paint ranges are held in dense arrays indexed by paint index, so a batch costs one gather and a
+    binary search over the band edges instead of per-row dictionary lookups.
+
+    Example:
+        classifier = WearClassifier.load("schemas")
+        result = classifier.classify(np.array([44, 282]), np.array([0.03, 0.2]))
+        classifier.band_names[result.band]   # ["Factory New", "Field-Tested"]
+    """
+
+    def __init__(self, paints: dict[str, dict[str, Any]], wears: list[dict[str, Any]]):
+        require_numpy()
+        size = max((int(paint_id) for paint_id in paints), default=-1) + 1
+        self.wear_min = np.full(size, np.nan)
+        self.wear_max = np.full(size, np.nan)
+        for paint_id, paint in paints.items():
+            self.wear_min[int(paint_id)] = paint.get("wear_min", 0.0)
+            self.wear_max[int(paint_id)] = paint.get("wear_max", 1.0)
+
+        wears = sorted(wears, key=lambda wear: wear["from"])
+        self.band_names = np.array([wear["name"] for wear in wears])
+        # Upper edges of every band but the last; a float on an edge belongs to the next band
+        self.band_edges = np.array([wear["to"] for wear in wears[:-1]], dtype=np.float64)
+
+    @classmethod
+    def load(cls, schemas_dir: str | Path = "schemas", serializer: JsonSerializer | None = None) -> "WearClassifier":
+        """Load paints.json and wears.json from a directory of generated JSON files."""
+        schemas_dir = Path(schemas_dir)
+        serializer = serializer or JsonSerializer()
+        tables = {}
+        for table in ("paints", "wears"):
+            file_path = schemas_dir / f"{table}.json"
+            try:
+                tables[table] = serializer.load_file(file_path)
+            except (OSError, ValueError) as e:
+                raise ConfigurationError(
+                    f"Failed to load schema file {file_path.name}: {e}", details={"path": str(file_path)}
+                ) from e
+        return cls(tables["paints"], tables["wears"])
+
+    def bands(self, floats: "np.ndarray") -> "np.ndarray":
+        """Wear band of every float, -1 outside [0, 1]."""
+        floats = np.asarray(floats, dtype=np.float64)
+        band = np.searchsorted(self.band_edges, floats, side="right").astype(np.int8)
+        band[~((floats >= 0.0) & (floats <= 1.0))] = -1
+        return band
+
+    def classify(self, paint_indexes: "np.ndarray", floats: "np.ndarray") -> WearResult:
+        """
+        Classify parallel arrays of paint indexes and floats.
+
+        Unknown paint indexes, including negative ones, are never valid.
+        """
+        paint_indexes = np.asarray(paint_indexes)
+        floats = np.asarray(floats, dtype=np.float64)
+        if paint_indexes.shape != floats.shape:
+            raise ValueError(f"Shape mismatch: {paint_indexes.shape} paint indexes, {floats.shape} floats")
+
+        known = (paint_indexes >= 0) & (paint_indexes < len(self.wear_min))
+        lookup = np.where(known, paint_indexes, 0)
+        wear_min = self.wear_min[lookup]
+        wear_max = self.wear_max[lookup]
+
+        # NaN ranges of paint indexes missing from paints.json compare False
+        valid = known & (floats >= wear_min) & (floats <= wear_max)
+        span = wear_max - wear_min
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentile = (floats - wear_min) / span
+        percentile[~valid] = np.nan
+        percentile[valid & (span == 0)] = 0.0
+
+        return WearResult(band=self.bands(floats), valid=valid, percentile=percentile)
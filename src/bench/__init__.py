@@ -0,0 +1,5 @@
+"""Micro and stage benchmarks for CS2 Items Schema."""
+
+from .timing import measure, summarize
+
+__all__ = ["measure", "summarize"]
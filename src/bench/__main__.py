@@ -0,0 +1,128 @@
+"""Pipeline benchmark suite on synthetic catalogues.
+
+Usage:
+    python -m src.bench generate --scales 1,5,20        write bench_data/1x, 5x and 20x
+    python -m src.bench run --scales 1,5 --rounds 5     time every stage at each scale
+    python -m src.bench run --stages items,sql --output results.json
+    python -m src.bench compare --threshold 0.2         fail on stages slower than the stored baseline
+    python -m src.bench compare --update                store this run as the new baseline
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .compare import (
+    DEFAULT_MIN_SECONDS,
+    DEFAULT_THRESHOLD,
+    build_baseline,
+    compare_results,
+    format_diff,
+    load_baseline,
+    machine_info,
+    save_baseline,
+)
+from .stages import STAGES, bench_scales, fixture_dir, format_results
+from .synthetic import SCALES, generate
+
+
+def _scales(value: str) -> list[float]:
+    return [float(scale.rstrip("x")) for scale in value.split(",")]
+
+
+def _add_suite_arguments(parser: argparse.ArgumentParser, scales: list[float], rounds: int) -> None:
+    scales_text = ",".join(f"{scale:g}" for scale in scales)
+    parser.add_argument("--scales", type=_scales, default=scales, help=f"Comma-separated (default: {scales_text})")
+    parser.add_argument("--rounds", type=int, default=rounds, help=f"Timed rounds per stage (default: {rounds})")
+    parser.add_argument("--stages", help=f"Comma-separated stages (default: {','.join(STAGES)})")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.bench", description="Pipeline benchmark suite")
+    parser.add_argument("--data-dir", type=Path, default=Path("bench_data"), help="Synthetic fixtures directory")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic catalogues")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="Write synthetic game files")
+    generate_parser.add_argument(
+        "--scales", type=_scales, default=list(SCALES), help="Comma-separated (default: 1,5,20)"
+    )
+
+    run_parser = commands.add_parser("run", help="Time the pipeline stages, generating missing fixtures")
+    # 20x takes long with the current collectors, so it is opt-in
+    _add_suite_arguments(run_parser, [1.0, 5.0], rounds=5)
+    run_parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+
+    compare_parser = commands.add_parser(
+        "compare", help="Run the suite and compare it with a stored baseline, exit 1 on regressions"
+    )
+    _add_suite_arguments(compare_parser, [1.0], rounds=7)
+    compare_parser.add_argument(
+        "--baseline", type=Path, help="Baseline JSON (default: <data-dir>/baseline.json), written when missing"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Relative median slowdown that fails a stage (default: {DEFAULT_THRESHOLD})",
+    )
+    compare_parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=DEFAULT_MIN_SECONDS * 1e3,
+        help=f"Ignore slowdowns smaller than this many milliseconds (default: {DEFAULT_MIN_SECONDS * 1e3:g})",
+    )
+    compare_parser.add_argument("--update", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        for scale in args.scales:
+            for path in generate(fixture_dir(args.data_dir, scale), scale, args.seed).values():
+                print(f"{path}  {path.stat().st_size / 2**20:.1f} MB")
+        return 0
+
+    stages = args.stages.split(",") if args.stages else None
+    results = bench_scales(args.data_dir, args.scales, args.schemas_dir, args.rounds, stages, args.seed)
+
+    if args.command == "run":
+        for label, stage_results in results.items():
+            print(f"\n{label}")
+            print(format_results(stage_results))
+        if args.output:
+            args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        return 0
+
+    baseline_path = args.baseline or args.data_dir / "baseline.json"
+    if not baseline_path.exists():
+        save_baseline(baseline_path, build_baseline(results, args.rounds))
+        print(f"No baseline at {baseline_path}, stored this run as the baseline")
+        return 0
+
+    try:
+        baseline = load_baseline(baseline_path)
+    except ValueError as e:
+        if not args.update:
+            print(e)
+            return 2
+        save_baseline(baseline_path, build_baseline(results, args.rounds))
+        print(f"Replaced the outdated baseline at {baseline_path} with this run")
+        return 0
+    diffs = compare_results(baseline, results, args.threshold, args.min_ms / 1e3)
+    print(format_diff(diffs))
+    if baseline.get("machine") != machine_info():
+        print(f"\nWarning: {baseline_path} was recorded on another machine or Python, timings may not compare")
+
+    regressed = [diff for diff in diffs if diff.status == "regressed"]
+    if args.update:
+        save_baseline(baseline_path, build_baseline(results, args.rounds))
+        print(f"\nStored this run as the baseline at {baseline_path}")
+    if regressed:
+        print(f"\n{len(regressed)} stage(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
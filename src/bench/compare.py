@@ -0,0 +1,151 @@
+"""Stored benchmark baselines and the regression check of a run against them.
+
+A baseline is the JSON of a suite run (``bench_scales`` results per scale) with the rounds and the
+machine it came from. A stage counts as regressed only when both hold:
+
+* its median grew by more than the threshold (relative) and by more than ``min_seconds`` (absolute)
+* its first quartile lies above the baseline's third quartile, so the interquartile ranges of the
+  two runs do not overlap and the shift is larger than the noise
+
+Timings are only comparable on the same machine; the baseline records platform and Python version
+and a mismatch is reported next to the diff.
+"""
+
+import platform
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..services.serializer import JsonSerializer
+
+# 2: stages store their quartiles
+BASELINE_VERSION = 2
+
+DEFAULT_THRESHOLD = 0.25
+# Slowdowns smaller than this never fail a stage, the relative noise of fast stages is too large
+DEFAULT_MIN_SECONDS = 0.005
+
+
+@dataclass(slots=True)
+class StageDiff:
+    scale: str
+    stage: str
+    status: str  # "regressed", "improved", "unchanged", "new" or "missing"
+    baseline: float | None = None
+    current: float | None = None
+    records_changed: bool = False
+
+    @property
+    def change(self) -> float | None:
+        if self.baseline is None or self.current is None or not self.baseline:
+            return None
+        return self.current / self.baseline - 1
+
+
+def machine_info() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def build_baseline(results: dict[str, dict[str, dict[str, float]]], rounds: int) -> dict[str, Any]:
+    return {
+        "version": BASELINE_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "rounds": rounds,
+        "machine": machine_info(),
+        "scales": results,
+    }
+
+
+def save_baseline(path: str | Path, baseline: dict[str, Any]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(JsonSerializer(indent=2, sort_keys=False).dumps(baseline))
+
+
+def load_baseline(path: str | Path) -> dict[str, Any]:
+    """
+    Read a stored baseline.
+
+    Raises:
+        ValueError: If the file is not a baseline of this version
+    """
+    baseline = JsonSerializer().load_file(Path(path))
+    if not isinstance(baseline, dict) or baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path} is not a version {BASELINE_VERSION} benchmark baseline, replace it with --update")
+    return baseline
+
+
+def _regressed(base: dict[str, float], current: dict[str, float], threshold: float, min_seconds: float) -> bool:
+    return (
+        current["median"] > base["median"] * (1 + threshold)
+        and current["median"] - base["median"] > min_seconds
+        and current["q1"] > base["q3"]
+    )
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    results: dict[str, dict[str, dict[str, float]]],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> list[StageDiff]:
+    """
+    Compare a suite run with a baseline, stage by stage and scale by scale.
+
+    Args:
+        baseline: Stored baseline, see build_baseline
+        results: bench_scales results of the current run
+        threshold: Relative median slowdown that counts as a regression, e.g. 0.25 for 25%
+        min_seconds: Absolute median slowdown below which nothing counts as a regression
+    """
+    diffs = []
+    for scale, stages in results.items():
+        base_stages = baseline["scales"].get(scale, {})
+        for stage, current in stages.items():
+            base = base_stages.get(stage)
+            if base is None:
+                diffs.append(StageDiff(scale, stage, "new", current=current["median"]))
+                continue
+            if _regressed(base, current, threshold, min_seconds):
+                status = "regressed"
+            elif _regressed(current, base, threshold, min_seconds):
+                status = "improved"
+            else:
+                status = "unchanged"
+            diffs.append(
+                StageDiff(
+                    scale,
+                    stage,
+                    status,
+                    baseline=base["median"],
+                    current=current["median"],
+                    records_changed=base.get("records") != current.get("records"),
+                )
+            )
+        for stage, base in base_stages.items():
+            if stage not in stages:
+                diffs.append(StageDiff(scale, stage, "missing", baseline=base["median"]))
+    return diffs
+
+
+def format_diff(diffs: list[StageDiff]) -> str:
+    def milliseconds(value: float | None) -> str:
+        return "-" if value is None else f"{value * 1e3:.2f}"
+
+    lines = [f"{'scale':<6} {'stage':<16} {'baseline ms':>12} {'current ms':>12} {'change':>8}  status"]
+    for diff in diffs:
+        change = "-" if diff.change is None else f"{diff.change:+.1%}"
+        status = diff.status.upper() if diff.status == "regressed" else diff.status
+        if diff.records_changed:
+            status += " (records differ, fixture changed?)"
+        lines.append(
+            f"{diff.scale:<6} {diff.stage:<16} {milliseconds(diff.baseline):>12} {milliseconds(diff.current):>12} "
+            f"{change:>8}  {status}"
+        )
+    return "\n".join(lines)
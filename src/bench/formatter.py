@@ -0,0 +1,44 @@
+"""Benchmark of CS2Item serialization: dataclasses.asdict against CS2Item.to_dict."""
+
+import argparse
+from dataclasses import asdict
+from pathlib import Path
+
+from ..services.item_formatter import ItemFormatterService
+from .timing import measure, summarize
+
+
+def bench_item_serialization(schemas_dir: str | Path = "schemas", rounds: int = 7) -> dict[str, dict[str, float]]:
+    """
+    Serialize every formatted item with both code paths.
+
+    Raises:
+        AssertionError: If the two paths do not produce the same dictionaries
+    """
+    items = list(ItemFormatterService(schemas_dir).iter_items())
+
+    # asdict deep-copies, so it needs plain dictionaries to compare against
+    if [asdict(item) for item in items] != [item.to_dict() for item in items]:
+        raise AssertionError("CS2Item.to_dict() output differs from dataclasses.asdict()")
+
+    results = {
+        "asdict": summarize(measure(lambda: [asdict(item) for item in items], rounds=rounds)),
+        "to_dict": summarize(measure(lambda: [item.to_dict() for item in items], rounds=rounds)),
+        "to_tuple": summarize(measure(lambda: [item.to_tuple() for item in items], rounds=rounds)),
+    }
+    results["items"] = {"count": len(items)}
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CS2Item serialization benchmark")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    results = bench_item_serialization(args.schemas_dir, args.rounds)
+    count = results.pop("items")["count"]
+    baseline = results["asdict"]["median"]
+    print(f"{count} items")
+    for name, stats in results.items():
+        print(f"{name:<10} {stats['median'] * 1e3:8.2f} ms  (x{baseline / stats['median']:.1f})")
@@ -0,0 +1,94 @@
+"""Per-lookup latency of the CS2Schema query API and of bulk market name resolution."""
+
+import argparse
+from pathlib import Path
+
+from ..query import CS2Schema, MarketNameEngine
+from .timing import measure, summarize
+
+
+def bench_schema_queries(schemas_dir: str | Path = "schemas", rounds: int = 7) -> dict[str, dict[str, float]]:
+    """
+    Time every CS2Schema lookup over all items, reported per lookup.
+
+    Loading and indexing is measured separately on fresh schemas so that lookups only time the probes.
+    """
+    schema = CS2Schema.load(schemas_dir)
+    results = {"load and index": summarize(measure(lambda: _build_indexes(CS2Schema.load(schemas_dir)), rounds=3))}
+    _build_indexes(schema)
+
+    items = list(schema)
+    ids = [item.id for item in items]
+    pairs = [(item.defindex, item.paintindex) for item in items]
+    names = [item.name for item in items]
+    codenames = [item.codename for item in items]
+    rarities = sorted({item.rarity for item in items if item.rarity is not None})
+    containers = list(schema.containers)
+
+    lookups = {
+        "get": (ids, schema.get),
+        "by_def_paint": (pairs, lambda pair: schema.by_def_paint(*pair)),
+        "by_codename": (codenames, schema.by_codename),
+        "by_name": (names, schema.by_name),
+        "by_rarity": (rarities, schema.by_rarity),
+        "by_container": (containers, schema.by_container),
+    }
+    batches = {
+        "get_many": (ids, schema.get_many),
+        "by_def_paint_many": (pairs, schema.by_def_paint_many),
+        "by_name_many": (names, schema.by_name_many),
+        "by_container_many": (containers, schema.by_container_many),
+    }
+
+    for name, (keys, lookup) in lookups.items():
+        samples = measure(lambda keys=keys, lookup=lookup: [lookup(key) for key in keys], rounds=rounds)
+        results[name] = summarize([sample / len(keys) for sample in samples])
+    for name, (keys, lookup) in batches.items():
+        samples = measure(lambda keys=keys, lookup=lookup: lookup(keys), rounds=rounds)
+        results[name] = summarize([sample / len(keys) for sample in samples])
+
+    results["items"] = {"count": len(items)}
+    return results
+
+
+def bench_market_names(
+    schemas_dir: str | Path = "schemas", count: int = 1_000_000, rounds: int = 5
+) -> dict[str, dict[str, float]]:
+    """Time resolving ``count`` market names in bulk, reported per name."""
+    engine = MarketNameEngine.load(schemas_dir)
+    results = {"index": summarize(measure(lambda: len(MarketNameEngine.load(schemas_dir)), rounds=3))}
+
+    names = [entry.name for entry in engine.iter_names()]
+    names = (names * (count // len(names) + 1))[:count]
+    samples = measure(lambda: engine.resolve_many(names), rounds=rounds)
+    results["resolve_many"] = summarize([sample / count for sample in samples])
+    results["names"] = {"count": len(engine)}
+    return results
+
+
+def _build_indexes(schema: CS2Schema) -> None:
+    schema.get("")
+    schema.by_def_paint("")
+    schema.by_codename("")
+    schema.by_name("")
+    schema.by_rarity("")
+    schema.by_container("")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CS2Schema lookup latency benchmark")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    results = bench_schema_queries(args.schemas_dir, args.rounds)
+    count = results.pop("items")["count"]
+    build = results.pop("load and index")
+    print(f"{count} items, loaded and indexed in {build['median'] * 1e3:.2f} ms")
+    for name, stats in results.items():
+        print(f"{name:<18} {stats['median'] * 1e9:8.0f} ns/lookup  (iqr {stats['iqr'] * 1e9:.0f} ns)")
+
+    market = bench_market_names(args.schemas_dir, rounds=args.rounds)
+    stats = market["resolve_many"]
+    print(f"{market['names']['count']} market names, loaded and indexed in {market['index']['median'] * 1e3:.2f} ms")
+    print(f"{'resolve_many':<18} {stats['median'] * 1e9:8.0f} ns/name    (iqr {stats['iqr'] * 1e9:.0f} ns)")
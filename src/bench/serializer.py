@@ -0,0 +1,70 @@
+"""Benchmark and output check of the JSON serializer backends."""
+
+import argparse
+from functools import partial
+from pathlib import Path
+
+from ..services.serializer import JsonSerializer, msgspec, orjson
+from .timing import measure, summarize
+
+DEFAULT_FILES = ("items.json", "definitions.json")
+
+
+def available_backends() -> list[str]:
+    backends = ["json"]
+    if orjson is not None:
+        backends.append("orjson")
+    if msgspec is not None:
+        backends.append("msgspec")
+    return backends
+
+
+def verify_identical_output(schemas_dir: str | Path = "schemas", files: tuple[str, ...] = DEFAULT_FILES) -> None:
+    """
+    Check that every installed backend writes exactly the bytes of the stdlib encoder.
+
+    Raises:
+        AssertionError: Naming the first backend and file whose output differs
+    """
+    reference = JsonSerializer(backend="json")
+    for filename in files:
+        data = reference.load_file(Path(schemas_dir) / filename)
+        expected = reference.dumps(data)
+        for backend in available_backends():
+            serializer = JsonSerializer(backend=backend)
+            if serializer.dumps(data) != expected:
+                raise AssertionError(f"{backend} output differs from json for {filename}")
+            if serializer.loads(expected) != data:
+                raise AssertionError(f"{backend} does not round-trip {filename}")
+
+
+def bench_serializers(
+    schemas_dir: str | Path = "schemas", files: tuple[str, ...] = DEFAULT_FILES, rounds: int = 7
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Time load and dump of each file per installed backend."""
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for filename in files:
+        raw = (Path(schemas_dir) / filename).read_bytes()
+        data = JsonSerializer(backend="json").loads(raw)
+        for backend in available_backends():
+            serializer = JsonSerializer(backend=backend)
+            results.setdefault(filename, {})[f"{backend}.load"] = summarize(
+                measure(partial(serializer.loads, raw), rounds=rounds)
+            )
+            results[filename][f"{backend}.dump"] = summarize(measure(partial(serializer.dumps, data), rounds=rounds))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON serializer benchmark")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    verify_identical_output(args.schemas_dir)
+    print(f"Output identical to json for: {', '.join(available_backends())}")
+
+    for filename, timings in bench_serializers(args.schemas_dir, rounds=args.rounds).items():
+        print(filename)
+        for name, stats in timings.items():
+            print(f"  {name:<14} {stats['median'] * 1e3:8.2f} ms")
@@ -0,0 +1,227 @@
+"""Benchmark of the collection pipeline, stage by stage, over the game files of a directory.
+
+Every stage is timed on the outputs of the previous ones, the same hand-off ResourceCollector does:
+
+    parse            DataFetcher._parse_responses (VDF and CDN parsing of the four files)
+    fields           FieldsCollector
+    containers       ContainersCollector
+    items            ItemsCollector
+    container_drops  ContainerDropsCollector
+    sticker_kits     StickerKitsCollector
+    sql              SQLCreator.create, without the DDL cache so every round compiles
+    format           ItemFormatterService over the collected data, to_dict of every item
+
+Stages left out of a run are still computed once when a later stage needs their outputs.
+"""
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from ..collectors import (
+    ContainerDropsCollector,
+    ContainersCollector,
+    FieldsCollector,
+    ItemsCollector,
+    StickerKitsCollector,
+)
+from ..config import DataUrls, Settings
+from ..models.types import GameData, ProcessedData
+from ..services.auto_downloader import AutoDownloader
+from ..services.data_fetcher import DataFetcher
+from ..services.item_formatter import ItemFormatterService
+from ..services.serializer import JsonSerializer
+from ..sql.creator import SQLCreator
+from .synthetic import SCALES, generate
+from .timing import measure, summarize
+
+STAGES = ("parse", "fields", "containers", "items", "container_drops", "sticker_kits", "sql", "format")
+
+
+def _records(result: Any) -> int:
+    """
+    Size of a stage's output: entries of a dictionary or list, summed over a tuple of them. Parsed game
+    data counts the entries of every items_game section plus the localization and CDN entries.
+    """
+    if isinstance(result, tuple):
+        return sum(_records(part) for part in result)
+    if isinstance(result, GameData):
+        sections = sum(_records(section) for section in result.items_game.values())
+        return sections + len(result.csgo_english) + len(result.csgo_schinese) + len(result.items_cdn)
+    return len(result) if isinstance(result, (dict, list)) else 0
+
+
+def load_required_schemas(schemas_dir: str | Path = "schemas") -> dict[str, Any]:
+    """The static schema files ResourceCollector loads, keyed the same way."""
+    serializer = JsonSerializer()
+    return {
+        filename.replace(".json", "").replace("_", ""): serializer.load_file(Path(schemas_dir) / filename)
+        for filename in Settings.REQUIRED_SCHEMA_FILES
+    }
+
+
+def bench_stages(
+    static_dir: str | Path,
+    schemas_dir: str | Path = "schemas",
+    rounds: int = 5,
+    stages: Iterable[str] | None = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Time the pipeline stages over the game files of a directory.
+
+    Args:
+        static_dir: Directory with items_game.txt, the two localizations and items_game_cdn.txt
+        schemas_dir: Directory with the static schema files (phases, origins, wears)
+        rounds: Timed rounds per stage
+        stages: Stages to time (default: all of STAGES, in pipeline order)
+
+    Returns:
+        Per timed stage: the timing summary and the number of records the stage produced
+
+    Raises:
+        ValueError: If a stage name is unknown
+    """
+    selected = list(STAGES) if stages is None else list(stages)
+    if unknown := [stage for stage in selected if stage not in STAGES]:
+        raise ValueError(f"Unknown stages: {', '.join(unknown)} (available: {', '.join(STAGES)})")
+    last = max(STAGES.index(stage) for stage in selected) if selected else -1
+
+    results: dict[str, dict[str, float]] = {}
+
+    def run(stage: str, func: Callable[[], Any]) -> Any:
+        output = None
+
+        def call() -> None:
+            nonlocal output
+            output = func()
+
+        if stage in selected:
+            results[stage] = summarize(measure(call, rounds=rounds))
+            results[stage]["records"] = _records(output)
+        else:
+            call()
+        return output
+
+    paths = AutoDownloader(static_dir=Path(static_dir)).get_local_files_path()
+    raw = {key: path.read_text(encoding="utf-8") for key, path in paths.items()}
+    schemas = load_required_schemas(schemas_dir)
+    fetcher = DataFetcher(DataUrls(), use_local_files=True, local_dir=Path(static_dir))
+
+    game_data = run(
+        "parse",
+        lambda: fetcher._parse_responses(
+            raw["items_game"], raw["csgo_english"], raw["csgo_schinese"], raw["items_cdn"]
+        ),
+    )
+    if last < STAGES.index("fields"):
+        return results
+
+    types, qualities, definitions, paints, rarities, musics, tints = run(
+        "fields", lambda: FieldsCollector(game_data, schemas["phasesmapping"]).collect()
+    )
+    weapon_cases, souvenir_cases, sticker_capsules, patch_capsules, music_kits = run(
+        "containers", lambda: ContainersCollector(game_data).collect()
+    )
+    containers = {**weapon_cases, **souvenir_cases}
+    sticker_kit_containers = {**sticker_capsules, **patch_capsules}
+    if last < STAGES.index("items"):
+        return results
+
+    items = run("items", lambda: ItemsCollector(game_data, paints, definitions, containers).collect())
+    container_drops = run(
+        "container_drops",
+        lambda: ContainerDropsCollector(game_data, types, containers, items, paints, definitions).collect(),
+    )
+    stickers, patches, graffities = run(
+        "sticker_kits", lambda: StickerKitsCollector(game_data, sticker_kit_containers).collect()
+    )
+    sticker_kits = {**stickers, **patches, **graffities}
+    if last < STAGES.index("sql"):
+        return results
+
+    run(
+        "sql",
+        lambda: SQLCreator(
+            types=types,
+            qualities=qualities,
+            definitions=definitions,
+            paints=paints,
+            musics=musics,
+            rarities=rarities,
+            containers=containers,
+            container_drops=container_drops,
+            sticker_kit_containers=sticker_kit_containers,
+            items=items,
+            sticker_kits=sticker_kits,
+            music_kits=music_kits,
+            tints=tints,
+            phases=schemas["phases"],
+            origins=schemas["origins"],
+            wears=schemas["wears"],
+            cache_dir=None,
+        ).create(),
+    )
+    if last < STAGES.index("format"):
+        return results
+
+    data = ProcessedData(
+        types=types,
+        qualities=qualities,
+        definitions=definitions,
+        paints=paints,
+        rarities=rarities,
+        musics=musics,
+        tints=tints,
+        containers=containers,
+        sticker_kit_containers=sticker_kit_containers,
+        items=items,
+        sticker_kits=sticker_kits,
+        music_kits=music_kits,
+        stickers=stickers,
+        patches=patches,
+        graffities=graffities,
+        container_drops=container_drops,
+    )
+    run(
+        "format",
+        lambda: [item.to_dict() for item in ItemFormatterService.from_processed_data(data, schemas_dir).iter_items()],
+    )
+    return results
+
+
+def fixture_dir(data_dir: str | Path, scale: float) -> Path:
+    return Path(data_dir) / f"{scale:g}x"
+
+
+def bench_scales(
+    data_dir: str | Path = "bench_data",
+    scales: Iterable[float] = SCALES,
+    schemas_dir: str | Path = "schemas",
+    rounds: int = 5,
+    stages: Iterable[str] | None = None,
+    seed: int = 0,
+) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Time the stages on synthetic catalogues, generating the missing ones under ``data_dir/<scale>x``.
+
+    Returns:
+        bench_stages results per scale label ("1x", "5x", ...)
+    """
+    stages = None if stages is None else list(stages)
+    results = {}
+    for scale in scales:
+        static_dir = fixture_dir(data_dir, scale)
+        if not (static_dir / "manifestId.txt").exists():
+            generate(static_dir, scale, seed)
+        results[static_dir.name] = bench_stages(static_dir, schemas_dir, rounds, stages)
+    return results
+
+
+def format_results(results: dict[str, dict[str, float]]) -> str:
+    lines = [f"{'stage':<16} {'median ms':>10} {'iqr ms':>9} {'min ms':>10} {'records':>9}"]
+    for stage, stats in results.items():
+        lines.append(
+            f"{stage:<16} {stats['median'] * 1e3:>10.2f} {stats['iqr'] * 1e3:>9.2f} {stats['min'] * 1e3:>10.2f} "
+            f"{stats['records']:>9}"
+        )
+    return "\n".join(lines)
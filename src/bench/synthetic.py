@@ -0,0 +1,565 @@
+"""Synthetic game files (items_game, localizations, CDN list) at a configurable catalogue scale.
+
+The generated files follow the structure the collectors walk in the real ones:
+
+* Weapons, knives and gloves resolve their names and types through prefab chains up to five levels deep
+  (``weapon_ak47_prefab -> rifle -> primary -> weapon_base -> statted_item_base``)
+* Weapon cases open through ``set supply crate series`` -> revolving loot list -> client loot list,
+  whose per-rarity lists hold the case's skins and whose unusual list nests a shared knife or glove
+  group holding painted and vanilla special items
+* Souvenir packages, map collections, sticker and patch capsules, music kit boxes, keys, collectibles
+  and agents fill in the rest, and the localizations carry filler tokens like the real ones
+
+Scale 1 approximates today's catalogue; collections, capsules, sticker kits and the other growing
+parts scale linearly while the weapon, knife and glove models stay fixed. The output is deterministic
+for a given scale and seed.
+
+Example:
+    paths = generate("bench_data/5x", scale=5)
+
+Command line::
+
+    python -m src.bench generate --scales 1,5,20
+"""
+
+import hashlib
+import random
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Any
+
+import vdf
+
+# Scales of the benchmark suite: today's catalogue and two future ones
+SCALES = (1, 5, 20)
+
+# (codename, display name, type prefab)
+WEAPONS = [
+    ("deagle", "Desert Eagle", "pistol"),
+    ("elite", "Dual Berettas", "pistol"),
+    ("fiveseven", "Five-SeveN", "pistol"),
+    ("glock", "Glock-18", "pistol"),
+    ("hkp2000", "P2000", "pistol"),
+    ("p250", "P250", "pistol"),
+    ("tec9", "Tec-9", "pistol"),
+    ("cz75a", "CZ75-Auto", "pistol"),
+    ("usp_silencer", "USP-S", "pistol"),
+    ("revolver", "R8 Revolver", "pistol"),
+    ("ak47", "AK-47", "rifle"),
+    ("aug", "AUG", "rifle"),
+    ("famas", "FAMAS", "rifle"),
+    ("galilar", "Galil AR", "rifle"),
+    ("m4a1", "M4A4", "rifle"),
+    ("m4a1_silencer", "M4A1-S", "rifle"),
+    ("sg556", "SG 553", "rifle"),
+    ("awp", "AWP", "sniper_rifle"),
+    ("g3sg1", "G3SG1", "sniper_rifle"),
+    ("scar20", "SCAR-20", "sniper_rifle"),
+    ("ssg08", "SSG 08", "sniper_rifle"),
+    ("mac10", "MAC-10", "smg"),
+    ("mp5sd", "MP5-SD", "smg"),
+    ("mp7", "MP7", "smg"),
+    ("mp9", "MP9", "smg"),
+    ("bizon", "PP-Bizon", "smg"),
+    ("p90", "P90", "smg"),
+    ("ump45", "UMP-45", "smg"),
+    ("mag7", "MAG-7", "shotgun"),
+    ("nova", "Nova", "shotgun"),
+    ("sawedoff", "Sawed-Off", "shotgun"),
+    ("xm1014", "XM1014", "shotgun"),
+    ("m249", "M249", "machinegun"),
+    ("negev", "Negev", "machinegun"),
+    ("taser", "Zeus x27", "pistol"),
+]
+KNIVES = [
+    ("bayonet", "Bayonet"),
+    ("knife_css", "Classic Knife"),
+    ("knife_flip", "Flip Knife"),
+    ("knife_gut", "Gut Knife"),
+    ("knife_karambit", "Karambit"),
+    ("knife_m9_bayonet", "M9 Bayonet"),
+    ("knife_tactical", "Huntsman Knife"),
+    ("knife_falchion", "Falchion Knife"),
+    ("knife_survival_bowie", "Bowie Knife"),
+    ("knife_butterfly", "Butterfly Knife"),
+    ("knife_push", "Shadow Daggers"),
+    ("knife_cord", "Paracord Knife"),
+    ("knife_canis", "Survival Knife"),
+    ("knife_ursus", "Ursus Knife"),
+    ("knife_gypsy_jackknife", "Navaja Knife"),
+    ("knife_outdoor", "Nomad Knife"),
+    ("knife_stiletto", "Stiletto Knife"),
+    ("knife_widowmaker", "Talon Knife"),
+    ("knife_skeleton", "Skeleton Knife"),
+    ("knife_kukri", "Kukri Knife"),
+]
+GLOVES = [
+    ("studded_bloodhound_gloves", "Bloodhound Gloves"),
+    ("sporty_gloves", "Sport Gloves"),
+    ("slick_gloves", "Driver Gloves"),
+    ("leather_handwraps", "Hand Wraps"),
+    ("motorcycle_gloves", "Moto Gloves"),
+    ("specialist_gloves", "Specialist Gloves"),
+    ("studded_hydra_gloves", "Hydra Gloves"),
+    ("studded_brokenfang_gloves", "Broken Fang Gloves"),
+]
+TYPE_PREFABS = {
+    "pistol": ("secondary", "CSGO_Type_Pistol", "Pistol"),
+    "rifle": ("primary", "CSGO_Type_Rifle", "Rifle"),
+    "sniper_rifle": ("primary", "CSGO_Type_SniperRifle", "Sniper Rifle"),
+    "smg": ("primary", "CSGO_Type_SMG", "SMG"),
+    "shotgun": ("primary", "CSGO_Type_Shotgun", "Shotgun"),
+    "machinegun": ("primary", "CSGO_Type_Machinegun", "Machinegun"),
+}
+# key, value, English name; the rarity's weapon and non-weapon names share the English one for brevity
+RARITIES = [
+    ("default", "0", "Stock", "#ded6cc"),
+    ("common", "1", "Consumer Grade", "#b0c3d9"),
+    ("uncommon", "2", "Industrial Grade", "#5e98d9"),
+    ("rare", "3", "Mil-Spec Grade", "#4b69ff"),
+    ("mythical", "4", "Restricted", "#8847ff"),
+    ("legendary", "5", "Classified", "#d32ce6"),
+    ("ancient", "6", "Covert", "#eb4b4b"),
+    ("immortal", "7", "Contraband", "#e4ae39"),
+]
+QUALITIES = [
+    ("normal", "0"),
+    ("genuine", "1"),
+    ("vintage", "2"),
+    ("unusual", "3"),
+    ("unique", "4"),
+    ("community", "5"),
+    ("developer", "6"),
+    ("selfmade", "7"),
+    ("customized", "8"),
+    ("strange", "9"),
+    ("completed", "10"),
+    ("haunted", "11"),
+    ("tournament", "12"),
+]
+# Skins per rarity of a weapon case and of a map collection
+CASE_TIERS = {"rare": 6, "mythical": 5, "legendary": 3, "ancient": 2}
+COLLECTION_TIERS = {"common": 3, "uncommon": 3, "rare": 3, "mythical": 2, "legendary": 1}
+
+CDN_URL = "http://media.steampowered.com/apps/730/icons/econ/default_generated/{}_light_large.{}.png"
+_CJK = [chr(code) for code in range(0x4E00, 0x4E00 + 2000)]
+
+
+@dataclass(frozen=True)
+class CatalogueSize:
+    """Entity counts of a synthetic catalogue; the defaults approximate today's one."""
+
+    case_sets: int = 42
+    map_sets: int = 40
+    souvenir_packages: int = 120
+    knife_finishes: int = 40
+    glove_paints: int = 8
+    knife_groups: int = 6
+    glove_groups: int = 3
+    sticker_kits: int = 8000
+    sticker_capsules: int = 560
+    patch_capsules: int = 28
+    music_kits: int = 84
+    music_boxes: int = 83
+    keys: int = 47
+    collectibles: int = 475
+    agents: int = 141
+    tints: int = 19
+    filler_tokens: int = 30000
+
+    # Parts of the catalogue that do not grow with the scale
+    FIXED = ("knife_finishes", "glove_paints", "knife_groups", "glove_groups", "tints")
+
+    def scaled(self, factor: float) -> "CatalogueSize":
+        """This size with every growing part multiplied by a factor."""
+        return replace(
+            self,
+            **{
+                entry.name: max(1, round(getattr(self, entry.name) * factor))
+                for entry in fields(self)
+                if entry.name not in self.FIXED
+            },
+        )
+
+
+class SyntheticCatalogue:
+    """
+    Deterministic generator of the four game files for one catalogue size.
+
+    Example:
+        catalogue = SyntheticCatalogue(CatalogueSize().scaled(5))
+        catalogue.write("bench_data/5x")
+    """
+
+    def __init__(self, size: CatalogueSize | None = None, seed: int = 0):
+        self.size = size or CatalogueSize()
+        self.rng = random.Random(seed)
+        self.items: dict[str, dict[str, Any]] = {}
+        self.prefabs: dict[str, dict[str, Any]] = {}
+        self.paint_kits: dict[str, dict[str, Any]] = {"0": {"name": "default", "description_tag": "#PaintKit_Default"}}
+        self.paint_kits_rarity: dict[str, str] = {}
+        self.item_sets: dict[str, dict[str, Any]] = {}
+        self.client_loot_lists: dict[str, dict[str, str]] = {}
+        self.revolving_loot_lists: dict[str, str] = {}
+        self.sticker_kits: dict[str, dict[str, Any]] = {}
+        self.music_definitions: dict[str, dict[str, Any]] = {}
+        self.tokens: dict[str, str] = {}
+        self.cdn: dict[str, str] = {}
+        self._next_defindex = 5000
+        self._next_series = 1
+        self._build()
+
+    # -- files -----------------------------------------------------------------------------------
+
+    def items_game(self) -> dict[str, Any]:
+        return {
+            "items_game": {
+                "game_info": {"first_valid_class": "2", "last_valid_class": "3"},
+                "rarities": {
+                    key: {
+                        "value": value,
+                        "loc_key": f"Rarity_{key}",
+                        "loc_key_weapon": f"Rarity_{key}_Weapon",
+                        "loc_key_character": f"Rarity_{key}_Character",
+                        "color": f"desc_{key}",
+                    }
+                    for key, value, _, _ in RARITIES
+                },
+                "qualities": {key: {"value": value, "weight": "1"} for key, value in QUALITIES},
+                "colors": {
+                    f"desc_{key}": {"color_name": f"ItemRarity{key}", "hex_color": color}
+                    for key, _, _, color in RARITIES
+                },
+                "graffiti_tints": {
+                    f"tint_{n}": {"id": str(n), "hex_color": f"#{self.rng.randrange(0x1000000):06x}"}
+                    for n in range(1, self.size.tints + 1)
+                },
+                "prefabs": self.prefabs,
+                "items": self.items,
+                "paint_kits": self.paint_kits,
+                "paint_kits_rarity": self.paint_kits_rarity,
+                "item_sets": self.item_sets,
+                "client_loot_lists": self.client_loot_lists,
+                "revolving_loot_lists": self.revolving_loot_lists,
+                "sticker_kits": self.sticker_kits,
+                "music_definitions": self.music_definitions,
+            }
+        }
+
+    def localization(self, language: str) -> dict[str, Any]:
+        """The ``lang`` file of "english" or "schinese"."""
+        if language == "english":
+            tokens = self.tokens
+        else:
+            tokens = {key: self._chinese(value) for key, value in self.tokens.items()}
+        return {"lang": {"Language": language, "Tokens": tokens}}
+
+    def cdn_text(self) -> str:
+        lines = ["#", "# CDN URLs", "#"] + [f"{key}={url}" for key, url in self.cdn.items()]
+        return "\n".join(lines) + "\n"
+
+    def write(self, static_dir: str | Path) -> dict[str, Path]:
+        """Write the files DataFetcher reads from a local directory, and the manifest id it checks."""
+        static_dir = Path(static_dir)
+        static_dir.mkdir(parents=True, exist_ok=True)
+        contents = {
+            "items_game": ("items_game.txt", vdf.dumps(self.items_game(), pretty=True)),
+            "csgo_english": ("csgo_english.txt", vdf.dumps(self.localization("english"), pretty=True)),
+            "csgo_schinese": ("csgo_schinese.txt", vdf.dumps(self.localization("schinese"), pretty=True)),
+            "items_cdn": ("items_game_cdn.txt", self.cdn_text()),
+        }
+        paths = {}
+        for key, (filename, content) in contents.items():
+            paths[key] = static_dir / filename
+            paths[key].write_text(content, encoding="utf-8")
+        (static_dir / "manifestId.txt").write_text("synthetic", encoding="utf-8")
+        return paths
+
+    # -- catalogue -------------------------------------------------------------------------------
+
+    def _build(self) -> None:
+        for key, _, name, _ in RARITIES:
+            self.tokens[f"Rarity_{key}"] = name
+            self.tokens[f"Rarity_{key}_Weapon"] = name
+            self.tokens[f"Rarity_{key}_Character"] = name
+        for key, _ in QUALITIES:
+            self.tokens[key] = key.capitalize()
+        for n in range(1, self.size.tints + 1):
+            self.tokens[f"Attrib_SprayTintValue_{n}"] = f"Tint {n}"
+
+        self._build_prefabs()
+        weapons = self._build_models()
+        self._build_weapon_sets(weapons)
+        self._build_stickers()
+        self._build_music()
+        self._build_misc()
+
+        for n in range(self.size.filler_tokens):
+            self.tokens[f"SFUI_Filler_{n}"] = f"Filler text number {n} of the user interface"
+
+    def _build_prefabs(self) -> None:
+        prefabs = self.prefabs
+        prefabs["statted_item_base"] = {"item_quality": "unique"}
+        prefabs["weapon_base"] = {"prefab": "statted_item_base"}
+        prefabs["primary"] = {"prefab": "weapon_base"}
+        prefabs["secondary"] = {"prefab": "weapon_base"}
+        for prefab, (parent, type_key, type_name) in TYPE_PREFABS.items():
+            prefabs[prefab] = {"prefab": parent, "item_type_name": f"#{type_key}"}
+            self.tokens[type_key] = type_name
+        prefabs["melee"] = {"prefab": "weapon_base", "item_type_name": "#CSGO_Type_Knife"}
+        prefabs["melee_unusual"] = {"prefab": "melee", "item_quality": "unusual"}
+        prefabs["hands"] = {"prefab": "statted_item_base", "item_type_name": "#Type_Hands"}
+        prefabs["hands_paintable"] = {"prefab": "hands", "item_quality": "unusual"}
+        prefabs["weapon_case_base"] = {"item_type_name": "#CSGO_Type_WeaponCase"}
+        prefabs["weapon_case"] = {"prefab": "weapon_case_base"}
+        prefabs["weapon_case_souvenirpkg"] = {"prefab": "weapon_case_base", "item_quality": "tournament"}
+        prefabs["sticker_capsule"] = {"prefab": "weapon_case_base"}
+        prefabs["musickit_box"] = {"prefab": "weapon_case_base"}
+        prefabs["weapon_case_key"] = {"item_type_name": "#CSGO_Tool_WeaponCase_KeyTag"}
+        prefabs["collectible"] = {"item_type_name": "#CSGO_Type_Collectible"}
+        prefabs["customplayertradable"] = {"item_type_name": "#Type_CustomPlayer"}
+        prefabs["sticker_tool"] = {"item_type_name": "#CSGO_Tool_Sticker"}
+        prefabs["patch_tool"] = {"item_type_name": "#CSGO_Tool_Patch"}
+        prefabs["spray_tool"] = {"item_type_name": "#CSGO_Type_Spray"}
+        prefabs["musickit_tool"] = {"item_type_name": "#CSGO_Type_MusicKit"}
+        self.tokens.update(
+            {
+                "CSGO_Type_Knife": "Knife",
+                "Type_Hands": "Gloves",
+                "CSGO_Type_WeaponCase": "Container",
+                "CSGO_Tool_WeaponCase_KeyTag": "Key",
+                "CSGO_Type_Collectible": "Collectible",
+                "Type_CustomPlayer": "Agent",
+                "CSGO_Tool_Sticker": "Sticker",
+                "CSGO_Tool_Patch": "Patch",
+                "CSGO_Type_Spray": "Graffiti",
+                "CSGO_Type_MusicKit": "Music Kit",
+            }
+        )
+
+    def _add_item(self, defindex: str | None, data: dict[str, Any], name: str | None = None) -> str:
+        if defindex is None:
+            defindex = str(self._next_defindex)
+            self._next_defindex += 1
+        if name is not None:
+            token = f"CSGO_{data['name']}"
+            data["item_name"] = f"#{token}"
+            self.tokens[token] = name
+        self.items[defindex] = data
+        return defindex
+
+    def _add_paint(self, codename: str, name: str, rarity: str, wear_range: tuple[float, float]) -> str:
+        paintindex = str(len(self.paint_kits))
+        token = f"PaintKit_{codename}_Tag"
+        self.paint_kits[paintindex] = {
+            "name": codename,
+            "description_tag": f"#{token}",
+            "wear_remap_min": f"{wear_range[0]:.2f}",
+            "wear_remap_max": f"{wear_range[1]:.2f}",
+        }
+        self.paint_kits_rarity[codename] = rarity
+        self.tokens[token] = name
+        return paintindex
+
+    def _add_cdn(self, def_codename: str, paint_codename: str) -> None:
+        key = f"{def_codename}_{paint_codename}"
+        self.cdn[key] = CDN_URL.format(key, hashlib.sha1(key.encode()).hexdigest())
+
+    def _wear_range(self) -> tuple[float, float]:
+        return self.rng.choice([(0.0, 0.08), (0.0, 0.5), (0.06, 0.8), (0.0, 1.0), (0.1, 0.7), (0.0, 0.7)])
+
+    def _build_models(self) -> list[str]:
+        weapons = []
+        for n, (codename, name, type_prefab) in enumerate(WEAPONS, start=1):
+            self.prefabs[f"weapon_{codename}_prefab"] = {"prefab": type_prefab, "item_name": f"#SFUI_WPNHUD_{codename}"}
+            self.tokens[f"SFUI_WPNHUD_{codename}"] = name
+            self.items[str(n)] = {"name": f"weapon_{codename}", "prefab": f"weapon_{codename}_prefab"}
+            weapons.append(f"weapon_{codename}")
+
+        knife_paints = [
+            self._add_paint(f"knife_finish_{n}", f"Knife Finish {n}", "ancient", self._wear_range())
+            for n in range(self.size.knife_finishes)
+        ]
+        self.knives: list[tuple[str, list[str]]] = []  # (codename, paint codenames)
+        for n, (codename, name) in enumerate(KNIVES):
+            defindex = str(500 + n)
+            self._add_item(defindex, {"name": f"weapon_{codename}", "prefab": "melee_unusual"}, name)
+            finishes = sorted(self.rng.sample(knife_paints, len(knife_paints) // 2), key=int)
+            for paintindex in finishes:
+                self._add_cdn(f"weapon_{codename}", self.paint_kits[paintindex]["name"])
+            self.knives.append((f"weapon_{codename}", [self.paint_kits[p]["name"] for p in finishes]))
+
+        self.gloves: list[tuple[str, list[str]]] = []
+        for n, (codename, name) in enumerate(GLOVES):
+            defindex = str(5027 + n)
+            self._add_item(defindex, {"name": codename, "prefab": "hands_paintable"}, name)
+            paints = []
+            for m in range(self.size.glove_paints):
+                paint_codename = f"{codename}_finish_{m}"
+                self._add_paint(paint_codename, f"{name} Finish {m}", "ancient", (0.06, 0.8))
+                self._add_cdn(codename, paint_codename)
+                paints.append(paint_codename)
+            self.gloves.append((codename, paints))
+        self._next_defindex = 5100
+        return weapons
+
+    def _add_skin(self, weapons: list[str], rarity: str, set_name: str) -> str:
+        """A new paint for a random weapon, returned as its ``[paint]weapon`` loot entry."""
+        weapon = self.rng.choice(weapons)
+        codename = f"cu_{weapon[7:]}_{set_name}_{len(self.paint_kits)}"
+        self._add_paint(codename, f"{set_name.title()} {len(self.paint_kits)}", rarity, self._wear_range())
+        self._add_cdn(weapon, codename)
+        return f"[{codename}]{weapon}"
+
+    def _build_weapon_sets(self, weapons: list[str]) -> None:
+        # Knife and glove groups shared by the cases' unusual lists, with vanilla knives in the knife groups
+        groups = []
+        for n in range(self.size.knife_groups):
+            group = f"knives_group_{n}"
+            entries: dict[str, str] = {}
+            for knife, finishes in self.rng.sample(self.knives, 5):
+                entries[knife] = "1"
+                for finish in finishes[: 1 + len(finishes) // 2]:
+                    entries[f"[{finish}]{knife}"] = "1"
+            self.client_loot_lists[group] = entries
+            groups.append(group)
+        for n in range(self.size.glove_groups):
+            group = f"gloves_group_{n}"
+            self.client_loot_lists[group] = {
+                f"[{paint}]{glove}": "1" for glove, paints in self.gloves for paint in paints[n::2]
+            }
+            groups.append(group)
+
+        key_defindexes = []
+        for n in range(self.size.keys):
+            key_defindexes.append(
+                self._add_item(None, {"name": f"crate_key_{n}", "prefab": "weapon_case_key"}, f"Case Key {n}")
+            )
+
+        for n in range(self.size.case_sets):
+            set_name = f"community_{n}"
+            entries = {
+                rarity: [self._add_skin(weapons, rarity, set_name) for _ in range(count)]
+                for rarity, count in CASE_TIERS.items()
+            }
+            self._add_item_set(set_name, entries)
+
+            crate = f"crate_{set_name}"
+            series = str(self._next_series)
+            self._next_series += 1
+            self.revolving_loot_lists[series] = crate
+            crate_list = {"will_produce_stattrak": "1"}
+            for rarity, loot in entries.items():
+                self.client_loot_lists[f"{crate}_{rarity}"] = dict.fromkeys(loot, "1")
+                crate_list[f"{crate}_{rarity}"] = "1"
+            self.client_loot_lists[f"{crate}_unusual"] = {self.rng.choice(groups): "1"}
+            crate_list[f"{crate}_unusual"] = "1"
+            self.client_loot_lists[crate] = crate_list
+
+            data = {
+                "name": crate,
+                "prefab": "weapon_case",
+                "tags": {"ItemSet": {"tag_value": f"set_{set_name}", "tag_group": "ItemSet"}},
+                "attributes": {"set supply crate series": {"attribute_class": "supply_crate_series", "value": series}},
+                "associated_items": {self.rng.choice(key_defindexes): "1"},
+            }
+            self._add_item(None, data, f"Community Case {n}")
+
+        map_sets = []
+        for n in range(self.size.map_sets):
+            set_name = f"map_{n}"
+            entries = {
+                rarity: [self._add_skin(weapons, rarity, set_name) for _ in range(count)]
+                for rarity, count in COLLECTION_TIERS.items()
+            }
+            self._add_item_set(set_name, entries)
+            map_sets.append(set_name)
+
+        for n in range(self.size.souvenir_packages):
+            set_name = map_sets[n % len(map_sets)]
+            data = {
+                "name": f"crate_{set_name}_souvenir_{n}",
+                "prefab": "weapon_case_souvenirpkg",
+                "tags": {"ItemSet": {"tag_value": f"set_{set_name}", "tag_group": "ItemSet"}},
+            }
+            self._add_item(None, data, f"Souvenir Package {n}")
+
+    def _add_item_set(self, set_name: str, entries: dict[str, list[str]]) -> None:
+        token = f"CSGO_set_{set_name}"
+        self.tokens[token] = f"The {set_name.replace('_', ' ').title()} Collection"
+        self.item_sets[f"set_{set_name}"] = {
+            "name": f"#{token}",
+            "items": {entry: "1" for loot in entries.values() for entry in loot},
+        }
+
+    def _build_stickers(self) -> None:
+        self._add_item("1209", {"name": "sticker", "prefab": "sticker_tool"}, "Sticker")
+        self._add_item("4609", {"name": "patch", "prefab": "patch_tool"}, "Patch")
+        self._add_item("1348", {"name": "spray", "prefab": "spray_tool"}, "Sealed Graffiti")
+
+        stickers: list[str] = []
+        patches: list[str] = []
+        rarities = ["rare", "mythical", "legendary", "ancient"]
+        for n in range(1, self.size.sticker_kits + 1):
+            kind = "patch" if n % 20 == 0 else "graffiti" if n % 10 == 0 else "sticker"
+            codename = f"{kind}_{n}" if kind != "sticker" else f"team_{n % 97}_{n}"
+            token = f"StickerKit_{codename}"
+            self.sticker_kits[str(n)] = {
+                "name": codename,
+                "item_name": f"#{token}",
+                "description_string": f"#{token}_desc",
+                "sticker_material": f"{kind}/{codename}",
+                "item_rarity": self.rng.choice(rarities),
+            }
+            self.tokens[token] = f"{kind.title()} {n}"
+            self.tokens[f"{token}_desc"] = f"Description of {kind} {n}"
+            (patches if kind == "patch" else stickers).append(codename)
+
+        for n in range(self.size.sticker_capsules):
+            self._add_capsule(f"crate_sticker_pack_{n}", "StickerCapsule", "sticker", stickers, f"Sticker Capsule {n}")
+        for n in range(self.size.patch_capsules):
+            self._add_capsule(f"crate_patch_pack_{n}", "PatchCapsule", "patch", patches, f"Patch Pack {n}")
+
+    def _add_capsule(self, crate: str, tag: str, tool: str, kits: list[str], name: str) -> None:
+        lootlist = f"{crate}_lootlist"
+        contents = self.rng.sample(kits, min(len(kits), 12))
+        # Two levels: the capsule list names one list per rarity tier
+        self.client_loot_lists[lootlist] = {f"{lootlist}_rare": "1", f"{lootlist}_legendary": "1"}
+        self.client_loot_lists[f"{lootlist}_rare"] = {f"[{kit}]{tool}": "1" for kit in contents[:9]}
+        self.client_loot_lists[f"{lootlist}_legendary"] = {f"[{kit}]{tool}": "1" for kit in contents[9:]}
+        data = {"name": crate, "prefab": "sticker_capsule", "tags": {tag: {"tag_value": lootlist, "tag_group": tag}}}
+        self._add_item(None, data, name)
+
+    def _build_music(self) -> None:
+        self._add_item("1314", {"name": "musickit", "prefab": "musickit_tool"}, "Music Kit")
+        musicians = []
+        for n in range(1, self.size.music_kits + 1):
+            codename = f"musician_{n}"
+            self.music_definitions[str(n)] = {"name": codename, "loc_name": f"#musickit_{codename}"}
+            self.tokens[f"musickit_{codename}"] = f"Musician {n}, Track {n}"
+            musicians.append(codename)
+        for n in range(self.size.music_boxes):
+            lootlist = f"musickit_box_{n}"
+            contents = self.rng.sample(musicians, min(len(musicians), 7))
+            self.client_loot_lists[lootlist] = {f"[{musician}]musickit": "1" for musician in contents}
+            data = {"name": f"crate_musickit_{n}", "prefab": "musickit_box", "loot_list_name": lootlist}
+            self._add_item(None, data, f"Music Kit Box {n}")
+
+    def _build_misc(self) -> None:
+        for n in range(self.size.collectibles):
+            self._add_item(None, {"name": f"collectible_pin_{n}", "prefab": "collectible"}, f"Pin {n}")
+        for n in range(self.size.agents):
+            self._add_item(None, {"name": f"customplayer_{n}", "prefab": "customplayertradable"}, f"Agent {n}")
+
+    def _chinese(self, text: str) -> str:
+        """Stable pseudo-translation: one CJK character per word, digits kept."""
+        words = text.split()
+        return "".join(
+            word if word.isdigit() else _CJK[int(hashlib.md5(word.encode()).hexdigest()[:6], 16) % len(_CJK)]
+            for word in words
+        )
+
+
+def generate(static_dir: str | Path, scale: float = 1, seed: int = 0) -> dict[str, Path]:
+    """Write a synthetic catalogue of the given scale into a directory."""
+    return SyntheticCatalogue(CatalogueSize().scaled(scale), seed).write(static_dir)
@@ -0,0 +1,52 @@
+"""Timing helpers shared by the benchmarks."""
+
+import gc
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+def measure(func: Callable[[], Any], rounds: int = 5, number: int = 1) -> list[float]:
+    """
+    Time a callable over several rounds.
+
+    Args:
+        func: Zero-argument callable to time
+        rounds: Number of independent rounds
+        number: Calls per round, the round time is divided by it
+
+    Returns:
+        Seconds per call for every round
+    """
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize timing samples with their median, quartiles, interquartile range and extremes."""
+    ordered = sorted(samples)
+    if len(ordered) > 1:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+    else:
+        q1 = q3 = ordered[0]
+    return {
+        "median": statistics.median(ordered),
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "rounds": len(ordered),
+    }
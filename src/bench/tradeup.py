@@ -0,0 +1,45 @@
+"""Throughput of batch trade-up contract evaluation."""
+
+import argparse
+from pathlib import Path
+
+from ..analytics.tradeup import CONTRACT_SIZE, TradeUpEngine
+from ..analytics.wear import np
+from .timing import measure, summarize
+
+
+def bench_tradeup(
+    schemas_dir: str | Path = "schemas", contracts: int = 10_000, rounds: int = 5
+) -> dict[str, dict[str, float]]:
+    """
+    Evaluate random contracts, each drawing its inputs from one random rarity, with both float rules.
+
+    Reported per contract.
+    """
+    engine = TradeUpEngine.load(schemas_dir)
+    rng = np.random.default_rng(0)
+    tiers = np.array(sorted(engine.outputs))
+    by_tier = {tier: np.flatnonzero(engine.item_tier == tier) for tier in tiers.tolist()}
+    inputs = np.stack([rng.choice(by_tier[tier], CONTRACT_SIZE) for tier in rng.choice(tiers, contracts).tolist()])
+    floats = rng.random((contracts, CONTRACT_SIZE))
+
+    results = {}
+    for name, normalize in (("classic", False), ("normalized", True)):
+        samples = measure(lambda normalize=normalize: engine.evaluate(inputs, floats, normalize), rounds=rounds)
+        results[name] = summarize([sample / contracts for sample in samples])
+    results["contracts"] = {"count": contracts, "valid": int(engine.evaluate(inputs, floats).valid.sum())}
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trade-up contract evaluation benchmark")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--contracts", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = bench_tradeup(args.schemas_dir, args.contracts, args.rounds)
+    info = results.pop("contracts")
+    print(f"{info['count']} contracts, {info['valid']} valid")
+    for name, stats in results.items():
+        print(f"{name:<10} {stats['median'] * 1e6:8.2f} us/contract  ({1 / stats['median']:,.0f} contracts/s)")
@@ -0,0 +1,73 @@
+"""Benchmark of WearClassifier against a per-row Python loop."""
+
+import argparse
+from pathlib import Path
+
+from ..analytics.wear import WearClassifier, np, require_numpy
+from ..services.serializer import JsonSerializer
+from .timing import measure, summarize
+
+
+def classify_loop(paints: dict, wears: list[dict], paint_indexes: list[int], floats: list[float]) -> list[tuple]:
+    """Reference implementation: one dictionary lookup and band scan per row."""
+    results = []
+    for paint_index, value in zip(paint_indexes, floats, strict=True):
+        band = next((i for i, wear in enumerate(wears) if value < wear["to"]), len(wears) - 1)
+        paint = paints.get(str(paint_index))
+        if paint is not None and paint["wear_min"] <= value <= paint["wear_max"]:
+            span = paint["wear_max"] - paint["wear_min"]
+            results.append((band, True, (value - paint["wear_min"]) / span if span else 0.0))
+        else:
+            results.append((band, False, None))
+    return results
+
+
+def bench_wear_classification(
+    schemas_dir: str | Path = "schemas", rows: int = 10_000_000, loop_rows: int = 200_000, rounds: int = 5
+) -> dict[str, dict[str, float]]:
+    """
+    Classify ``rows`` random (paint, float) pairs with NumPy and ``loop_rows`` of them with the loop.
+
+    Both are reported per row. Raises AssertionError if the two disagree on the loop sample.
+    """
+    require_numpy()
+    schemas_dir = Path(schemas_dir)
+    serializer = JsonSerializer()
+    paints = serializer.load_file(schemas_dir / "paints.json")
+    wears = serializer.load_file(schemas_dir / "wears.json")
+    classifier = WearClassifier(paints, wears)
+
+    rng = np.random.default_rng(0)
+    paint_ids = np.array(sorted(int(paint_id) for paint_id in paints))
+    paint_indexes = rng.choice(paint_ids, rows)
+    floats = rng.random(rows)
+
+    sample = (paint_indexes[:loop_rows].tolist(), floats[:loop_rows].tolist())
+    expected = classify_loop(paints, wears, *sample)
+    result = classifier.classify(paint_indexes[:loop_rows], floats[:loop_rows])
+    if result.band.tolist() != [row[0] for row in expected] or result.valid.tolist() != [row[1] for row in expected]:
+        raise AssertionError("WearClassifier disagrees with the reference loop")
+
+    numpy_samples = measure(lambda: classifier.classify(paint_indexes, floats), rounds=rounds)
+    loop_samples = measure(lambda: classify_loop(paints, wears, *sample), rounds=max(1, rounds // 2))
+    return {
+        "numpy": summarize([sample / rows for sample in numpy_samples]),
+        "loop": summarize([sample / loop_rows for sample in loop_samples]),
+        "rows": {"numpy": rows, "loop": loop_rows},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vectorized wear classification benchmark")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = bench_wear_classification(args.schemas_dir, args.rows, rounds=args.rounds)
+    rows = results.pop("rows")
+    baseline = results["loop"]["median"]
+    for name, stats in results.items():
+        note = f"extrapolated from {rows['loop']:,} rows" if name == "loop" else f"x{baseline / stats['median']:.0f}"
+        total = stats["median"] * args.rows
+        print(f"{name:<6} {stats['median'] * 1e9:8.1f} ns/row  {total:8.2f} s per {args.rows:,} rows  ({note})")
@@ -1,6 +1,7 @@
 """Data collectors for processing game data."""
 
 from .base import BaseCollector
+from .container_drops import ContainerDropsCollector
 from .containers import ContainersCollector
 from .fields import FieldsCollector
 from .items import ItemsCollector
@@ -11,5 +12,6 @@ __all__ = [
     "FieldsCollector",
     "ItemsCollector",
     "ContainersCollector",
+    "ContainerDropsCollector",
     "StickerKitsCollector",
 ]
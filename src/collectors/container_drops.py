@@ -0,0 +1,190 @@
+"""Container drop tables collector for CS2 game data."""
+
+import re
+from functools import cached_property
+from typing import Any
+
+from ..models.types import GameData
+from .base import BaseCollector
+
+# Published weapon case odds per rarity tier of the case, plus the rare special item (knife or gloves)
+RARITY_ODDS = {3: 0.7992, 4: 0.1598, 5: 0.032, 6: 0.0064, 7: 0.0064}
+SPECIAL_ODDS = 0.0026
+
+# Definition types of the rare special items, by name (types.json ids shift when a type is added)
+SPECIAL_TYPE_NAMES = {"Knife", "Gloves"}
+
+
+def rarity_odds(rarity: int) -> float:
+    """Standard weight of a rarity tier; every tier below Mil-Spec is five times more likely."""
+    return RARITY_ODDS.get(rarity, RARITY_ODDS[3] * 5 ** (3 - rarity))
+
+
+class ContainerDropsCollector(BaseCollector):
+    """Collector for the drop tables of weapon cases and souvenir packages."""
+
+    ITEM_NAME_RE = re.compile(r"\[(.+)](.+)")
+
+    def __init__(
+        self,
+        game_data: GameData,
+        types: dict[str, str],
+        containers: dict[str, dict[str, Any]],
+        items: dict[str, dict[str, Any]],
+        paints: dict[str, dict[str, Any]],
+        definitions: dict[str, dict[str, Any]],
+    ):
+        super().__init__(game_data)
+        self.types = types
+        self.containers = containers
+        self.items = items
+        self.paints = paints
+        self.definitions = definitions
+        self.special_types = {type_id for type_id, name in types.items() if name in SPECIAL_TYPE_NAMES}
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        """
+        Collect precomputed drop tables of item set containers.
+
+        Returns:
+            Dictionary of containers with their items grouped by rarity, the odds of every group,
+            StatTrak and souvenir flags and the rare special items
+        """
+        drops = {}
+        items_game_items = self.game_data.items_game.get("items", {})
+
+        for defindex, container in self.containers.items():
+            item_data = items_game_items.get(defindex, {})
+            souvenir = item_data.get("prefab") == "weapon_case_souvenirpkg"
+            loot_dict = self._get_loot_dict(item_data)
+
+            groups: dict[int, list[str]] = {}
+            special: list[str] = []
+            if loot_dict is not None:
+                # The case's own rarity lists decide the tier, which differs from the paint kit rarity
+                for item_id, rarity in self._walk_loot(loot_dict, None).items():
+                    if self._is_special(item_id):
+                        if not souvenir:
+                            special.append(item_id)
+                    elif rarity is not None:
+                        groups.setdefault(rarity, []).append(item_id)
+            else:
+                # Containers without a loot list (e.g. souvenir packages opened through their item set)
+                for item_id in container.get("items", []):
+                    paint_index = self.items.get(item_id, {}).get("paint")
+                    rarity = self.paints.get(paint_index, {}).get("rarity") if paint_index else None
+                    if rarity is not None:
+                        groups.setdefault(int(rarity), []).append(item_id)
+
+            weights = {rarity: rarity_odds(rarity) for rarity in groups}
+            total = sum(weights.values()) + (SPECIAL_ODDS if special else 0.0)
+            if not total:
+                continue
+
+            drop = {
+                "stattrak": not souvenir and loot_dict is not None and self._will_produce_stattrak(loot_dict),
+                "souvenir": souvenir,
+                "rarities": {
+                    str(rarity): {"odds": round(weights[rarity] / total, 6), "items": groups[rarity]}
+                    for rarity in sorted(groups)
+                },
+            }
+            if special:
+                drop["special"] = {"odds": round(SPECIAL_ODDS / total, 6), "items": special}
+
+            drops[defindex] = drop
+
+        return drops
+
+    def _get_loot_dict(self, item_data: dict[str, Any]) -> dict[str, Any] | None:
+        """Get the client loot list a container opens through its supply crate series."""
+        series_value = item_data.get("attributes", {}).get("set supply crate series", {}).get("value")
+        revolving_loot_lists = self.game_data.items_game.get("revolving_loot_lists", {})
+        client_loot_lists = self.game_data.items_game.get("client_loot_lists", {})
+
+        if series_value and revolving_loot_lists.get(series_value) in client_loot_lists:
+            return client_loot_lists[revolving_loot_lists[series_value]]
+        if item_data.get("loot_list_name") in client_loot_lists:
+            return client_loot_lists[item_data["loot_list_name"]]
+        return None
+
+    def _will_produce_stattrak(self, entry: dict[str, Any]) -> bool:
+        """Check if a loot list, or any list nested in it, produces StatTrak items."""
+        client_loot_lists = self.game_data.items_game.get("client_loot_lists", {})
+
+        for loot_name in entry.keys():
+            if loot_name == "will_produce_stattrak":
+                return True
+            if loot_name in client_loot_lists and self._will_produce_stattrak(client_loot_lists[loot_name]):
+                return True
+        return False
+
+    def _walk_loot(self, entry: dict[str, Any], rarity: int | None) -> dict[str, int | None]:
+        """
+        Recursively resolve the items of a loot list and its nested lists.
+
+        Nested lists named after a rarity (``crate_community_4_mythical``) give their items that
+        rarity; items outside such lists keep the rarity of the enclosing list, or None.
+        """
+        found: dict[str, int | None] = {}
+        client_loot_lists = self.game_data.items_game.get("client_loot_lists", {})
+
+        for loot_name in entry.keys():
+            if loot_name in client_loot_lists:
+                nested_rarity = self._list_rarity(loot_name)
+                nested = self._walk_loot(
+                    client_loot_lists[loot_name], rarity if nested_rarity is None else nested_rarity
+                )
+                for item_id, item_rarity in nested.items():
+                    found.setdefault(item_id, item_rarity)
+            elif (item_id := self._resolve_item(loot_name)) is not None:
+                found.setdefault(item_id, rarity)
+
+        return found
+
+    def _list_rarity(self, loot_name: str) -> int | None:
+        """Rarity value of a loot list named ``<list>_<rarity key>``, None for other lists."""
+        suffix = loot_name.rsplit("_", 1)[-1]
+        rarity = self.game_data.items_game.get("rarities", {}).get(suffix, {})
+        value = rarity.get("value") if isinstance(rarity, dict) else None
+        return int(value) if value is not None else None
+
+    def _is_special(self, item_id: str) -> bool:
+        """Whether an item is a knife or gloves."""
+        def_index = item_id.rsplit("]", 1)[-1]
+        return self.definitions.get(def_index, {}).get("type") in self.special_types
+
+    def _resolve_item(self, loot_name: str) -> str | None:
+        """
+        Item id of a ``[paint]definition`` loot entry; unpainted (vanilla) entries resolve to the defindex.
+
+        Entries naming an unknown paint resolve to None rather than to the vanilla item.
+        """
+        matches = self.ITEM_NAME_RE.findall(loot_name)
+        paint_name, def_name = matches[0] if matches else ("", loot_name)
+
+        def_index = self._def_indexes.get(def_name)
+        if def_index is None:
+            return None
+        if not paint_name:
+            return def_index
+        paint_index = self._paint_indexes.get(paint_name)
+        if paint_index is None:
+            return None
+        return f"[{paint_index}]{def_index}"
+
+    @cached_property
+    def _def_indexes(self) -> dict[str, str]:
+        indexes: dict[str, str] = {}
+        for defindex, type_data in self.game_data.items_game.get("items", {}).items():
+            if "name" in type_data:
+                indexes.setdefault(type_data["name"], defindex)
+        return indexes
+
+    @cached_property
+    def _paint_indexes(self) -> dict[str, str]:
+        indexes: dict[str, str] = {}
+        for paint_idx, paint_data in self.game_data.items_game.get("paint_kits", {}).items():
+            if "name" in paint_data:
+                indexes.setdefault(paint_data["name"], paint_idx)
+        return indexes
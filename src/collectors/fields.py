@@ -4,6 +4,7 @@ from typing import Any
 
 from ..exceptions import DataValidationError
 from ..models.types import GameData, PhasesMapping
+from ..services.instrumentation import instrumented
 from .base import BaseCollector
 
 
@@ -42,6 +43,7 @@ class FieldsCollector(BaseCollector):
 
         return types, qualities, definitions, paints, rarities, musics, tints
 
+    @instrumented("qualities")
     def _collect_qualities(self) -> dict[str, dict[str, str]]:
         """Extract quality data."""
         qualities = {}
@@ -64,6 +66,7 @@ class FieldsCollector(BaseCollector):
 
         return qualities
 
+    @instrumented("definitions")
     def _collect_definitions(self) -> dict[str, dict[str, Any]]:
         """Extract item definition data."""
         definitions = {}
@@ -101,6 +104,7 @@ class FieldsCollector(BaseCollector):
 
         return definitions
 
+    @instrumented("paints")
     def _collect_paints(self) -> dict[str, dict[str, Any]]:
         """Extract paint kit data."""
         paints = {}
@@ -144,6 +148,7 @@ class FieldsCollector(BaseCollector):
 
         return paints
 
+    @instrumented("rarities")
     def _collect_rarities(self) -> dict[str, dict[str, Any]]:
         """Extract rarity data."""
         rarities = {}
@@ -197,6 +202,7 @@ class FieldsCollector(BaseCollector):
 
         return rarities
 
+    @instrumented("types")
     def _collect_types(self) -> dict[str, str]:
         """Extract item type data."""
         types = set()
@@ -218,6 +224,7 @@ class FieldsCollector(BaseCollector):
 
         return {str(i): t for i, t in enumerate(sorted(types))}
 
+    @instrumented("tints")
     def _collect_tints(self) -> dict[str, dict[str, str]]:
         """Extract graffiti tint data."""
         tints = {}
@@ -239,6 +246,7 @@ class FieldsCollector(BaseCollector):
 
         return tints
 
+    @instrumented("musics")
     def _collect_music_definitions(self) -> dict[str, dict[str, str]]:
         """Extract music kit definition data."""
         music_defs = {}
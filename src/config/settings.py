@@ -14,6 +14,8 @@ class Settings:
     # Directory paths
     resource_dir: Path = field(default_factory=lambda: Path("schemas"))
     sql_dir: Path = field(default_factory=lambda: Path("sql"))
+    # Build cache (compiled DDL and similar derived artifacts), None disables caching
+    cache_dir: Path | None = field(default_factory=lambda: Path(".cache"))
 
     # Data URLs
     urls: DataUrls = field(default_factory=DataUrls)
@@ -26,6 +28,24 @@ class Settings:
     json_indent: int = 2
     ensure_ascii: bool = False
     sort_keys: bool = True
+    # JSON backend: "auto" (orjson, then msgspec, then stdlib), "orjson", "msgspec" or "json"
+    json_backend: str = "auto"
+
+    # Also write items.compact.json (see src.services.compact)
+    compact_items: bool = False
+
+    # Write schema.bin, the memory-mappable snapshot read by src.services.snapshot.SchemaReader
+    write_snapshot: bool = True
+
+    # Write search_index.json from the formatted items (see src.query.search)
+    write_search_index: bool = True
+
+    # Columnar export of items, paints and definitions: None, "auto", "npy" or "parquet" (see src.services.columnar)
+    columnar_format: str | None = None
+
+    # Precompressed siblings ("gz", "br", "zst") written next to outputs of at least compress_min_size bytes
+    compress_formats: tuple[str, ...] = ()
+    compress_min_size: int = 1024
 
     # Required schema files
     REQUIRED_SCHEMA_FILES: ClassVar[list[str]] = ["_phases_mapping.json", "phases.json", "origins.json", "wears.json"]
@@ -1,12 +1,24 @@
 """Main resource collector orchestrating the data collection process."""
 
 import logging
+from pathlib import Path
 from typing import Any
 
-from ..collectors import ContainersCollector, FieldsCollector, ItemsCollector, StickerKitsCollector
+from ..collectors import (
+    ContainerDropsCollector,
+    ContainersCollector,
+    FieldsCollector,
+    ItemsCollector,
+    StickerKitsCollector,
+)
 from ..config import Settings
 from ..exceptions import CS2SchemaError
+from ..models import ProcessedData
 from ..services import DataFetcher, FileManager
+from ..services.columnar import build_columns, encode_columns, remove_stale_files
+from ..services.compact import compact_items
+from ..services.instrumentation import span
+from ..services.snapshot import SNAPSHOT_FILE, build_snapshot
 from ..sql import SQLCreator
 
 logger = logging.getLogger(__name__)
@@ -20,30 +32,45 @@ class ResourceCollector:
         self.data_fetcher = DataFetcher(self.settings.urls, timeout=self.settings.request_timeout)
         self.file_manager = FileManager(self.settings)
 
-    async def collect(self) -> None:
-        """Main collection process."""
+    async def collect(self) -> ProcessedData:
+        """Main collection process.
+
+        Returns:
+            The processed data that was written to disk, for in-process consumers
+        """
         try:
             logger.info("Starting CS2 schema data collection")
 
             # Load required schema files
             logger.info("Loading required schema files")
-            schemas = self.file_manager.load_required_schemas()
+            with span("load_schemas"):
+                schemas = self.file_manager.load_required_schemas()
 
             # Fetch game data
             logger.info("Fetching game data from external sources")
-            game_data = await self.data_fetcher.fetch_all_data()
+            with span("fetch"):
+                game_data = await self.data_fetcher.fetch_all_data()
 
             # Process fields data
             logger.info("Processing field data")
-            fields_collector = FieldsCollector(game_data, schemas["phasesmapping"])
-            types, qualities, definitions, paints, rarities, musics, tints = fields_collector.collect()
+            with span("fields"):
+                fields_collector = FieldsCollector(game_data, schemas["phasesmapping"])
+                types, qualities, definitions, paints, rarities, musics, tints = fields_collector.collect()
 
             # Process containers data
             logger.info("Processing container data")
-            containers_collector = ContainersCollector(game_data)
-            weapon_cases, souvenir_cases, sticker_capsules, patch_capsules, music_kit_containers = (
-                containers_collector.collect()
-            )
+            with span("containers") as stage:
+                containers_collector = ContainersCollector(game_data)
+                weapon_cases, souvenir_cases, sticker_capsules, patch_capsules, music_kit_containers = (
+                    containers_collector.collect()
+                )
+                stage.set_records(
+                    len(weapon_cases)
+                    + len(souvenir_cases)
+                    + len(sticker_capsules)
+                    + len(patch_capsules)
+                    + len(music_kit_containers)
+                )
 
             # Combine all container types
             containers = {**weapon_cases, **souvenir_cases}
@@ -51,13 +78,26 @@ class ResourceCollector:
 
             # Process items data
             logger.info("Processing items data")
-            items_collector = ItemsCollector(game_data, paints, definitions, containers)
-            items = items_collector.collect()
+            with span("items") as stage:
+                items_collector = ItemsCollector(game_data, paints, definitions, containers)
+                items = items_collector.collect()
+                stage.set_records(len(items))
+
+            # Precompute container drop tables
+            logger.info("Processing container drop tables")
+            with span("container_drops") as stage:
+                container_drops_collector = ContainerDropsCollector(
+                    game_data, types, containers, items, paints, definitions
+                )
+                container_drops = container_drops_collector.collect()
+                stage.set_records(len(container_drops))
 
             # Process sticker kits data
             logger.info("Processing sticker kits data")
-            sticker_kits_collector = StickerKitsCollector(game_data, sticker_kit_containers)
-            stickers, patches, graffities = sticker_kits_collector.collect()
+            with span("sticker_kits") as stage:
+                sticker_kits_collector = StickerKitsCollector(game_data, sticker_kit_containers)
+                stickers, patches, graffities = sticker_kits_collector.collect()
+                stage.set_records(len(stickers) + len(patches) + len(graffities))
 
             # Combine all sticker-related data for now (can be separated later if needed)
             sticker_kits = {**stickers, **patches, **graffities}
@@ -74,6 +114,7 @@ class ResourceCollector:
                 musics,
                 tints,
                 containers,
+                container_drops,
                 sticker_kit_containers,
                 items,
                 sticker_kits,
@@ -90,6 +131,7 @@ class ResourceCollector:
                 musics=musics,
                 rarities=rarities,
                 containers=containers,
+                container_drops=container_drops,
                 sticker_kit_containers=sticker_kit_containers,
                 items=items,
                 sticker_kits=sticker_kits,
@@ -98,16 +140,60 @@ class ResourceCollector:
                 phases=schemas["phases"],
                 origins=schemas["origins"],
                 wears=schemas["wears"],
+                cache_dir=self.settings.cache_dir,
             )
-            sql_files = sql_creator.create()
+            with span("sql"):
+                sql_files = sql_creator.create()
 
             # Save all files
             logger.info("Saving JSON and SQL files")
-            self.file_manager.save_json_files(*json_files)
-            self.file_manager.save_text_files(*sql_files)
+            with span("write_json") as stage:
+                self.file_manager.save_json_files(*json_files)
+                if self.settings.compact_items:
+                    self.file_manager.save_json_files(("items.compact.json", compact_items(items)), compact=True)
+                stage.set_records(len(json_files))
+            with span("write_sql") as stage:
+                self.file_manager.save_text_files(*sql_files)
+                stage.set_records(len(sql_files))
+            if self.settings.write_snapshot:
+                logger.info("Saving schema snapshot")
+                with span("snapshot"):
+                    # The nested drop tables do not fit the flat snapshot records
+                    tables = {
+                        Path(filename).stem: data for filename, data in json_files if filename != "container_drops.json"
+                    }
+                    self.file_manager.save_binary_files((SNAPSHOT_FILE, build_snapshot(tables)))
+            if self.settings.columnar_format:
+                logger.info("Saving columnar export")
+                with span("columnar"):
+                    columns = build_columns(items, paints, definitions)
+                    columnar_files = encode_columns(columns, self.settings.columnar_format)
+                    self.file_manager.save_binary_files(*columnar_files)
+                    remove_stale_files(self.settings.resource_dir, columnar_files)
+            with span("manifest"):
+                self.file_manager.save_manifest()
 
             logger.info("CS2 schema data collection completed successfully")
 
+            return ProcessedData(
+                types=types,
+                qualities=qualities,
+                definitions=definitions,
+                paints=paints,
+                rarities=rarities,
+                musics=musics,
+                tints=tints,
+                containers=containers,
+                sticker_kit_containers=sticker_kit_containers,
+                items=items,
+                sticker_kits=sticker_kits,
+                music_kits=music_kits,
+                stickers=stickers,
+                patches=patches,
+                graffities=graffities,
+                container_drops=container_drops,
+            )
+
         except CS2SchemaError:
             logger.error("Collection failed due to application error", exc_info=True)
             raise
@@ -125,6 +211,7 @@ class ResourceCollector:
         musics: dict[str, dict[str, str]],
         tints: dict[str, dict[str, str]],
         containers: dict[str, Any],
+        container_drops: dict[str, Any],
         sticker_kit_containers: dict[str, Any],
         items: dict[str, Any],
         sticker_kits: dict[str, Any],
@@ -139,6 +226,7 @@ class ResourceCollector:
             ("musics.json", musics),
             ("rarities.json", rarities),
             ("containers.json", containers),
+            ("container_drops.json", container_drops),
             ("sticker_kit_containers.json", sticker_kit_containers),
             ("items.json", items),
             ("sticker_kits.json", sticker_kits),
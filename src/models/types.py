@@ -43,3 +43,5 @@ class ProcessedData:
     stickers: dict[str, dict[str, Any]] | None = None
     patches: dict[str, dict[str, Any]] | None = None
     graffities: dict[str, dict[str, Any]] | None = None
+    # Precomputed drop tables of weapon cases and souvenir packages
+    container_drops: dict[str, dict[str, Any]] | None = None
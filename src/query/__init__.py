@@ -0,0 +1,16 @@
+"""In-process query APIs over the generated schema."""
+
+from .market import MarketFlags, MarketName, MarketNameEngine
+from .schema import CS2Schema, SchemaItem
+from .search import SearchHit, SearchIndex, SearchIndexBuilder
+
+__all__ = [
+    "CS2Schema",
+    "MarketFlags",
+    "MarketName",
+    "MarketNameEngine",
+    "SchemaItem",
+    "SearchHit",
+    "SearchIndex",
+    "SearchIndexBuilder",
+]
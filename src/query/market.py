@@ -0,0 +1,178 @@
+"""Steam market hash names of the schema's skins and their reverse resolution."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from enum import IntFlag
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import ConfigurationError
+from ..services.serializer import JsonSerializer
+from .schema import CS2Schema, SchemaItem
+
+STAR = "★"
+STATTRAK = "StatTrak™"
+SOUVENIR = "Souvenir"
+
+KNIFE_TYPE = "Knife"
+GLOVES_TYPE = "Gloves"
+
+
+class MarketFlags(IntFlag):
+    """Qualities encoded in a market name."""
+
+    NONE = 0
+    STATTRAK = 1
+    SOUVENIR = 2
+    STAR = 4
+
+
+@dataclass(frozen=True, slots=True)
+class MarketName:
+    """A market hash name and the item it stands for."""
+
+    name: str
+    defindex: str
+    paintindex: str | None
+    wear: str | None
+    flags: MarketFlags
+
+
+class MarketNameEngine:
+    """
+    Generator of every valid market hash name and an exact reverse index over them.
+
+    Availability rules:
+
+    * Exteriors are the wears.json bands overlapping the paint's ``[wear_min, wear_max]`` range
+    * Knives (★) can be StatTrak™, gloves (★) cannot, and knives are also listed without a paint
+    * Other skins can be StatTrak™ when a weapon case drops them and Souvenir when a souvenir package
+      does; souvenir packages are recognised by their definition name
+
+    Phased paints (Doppler, Gamma Doppler) share one market name, so a name may resolve to several
+    paint indexes: ``resolve`` returns the lowest one and ``candidates`` returns them all.
+
+    Example:
+        engine = MarketNameEngine.load("schemas")
+        engine.names_for("[282]7")            # ["AK-47 | Redline (Field-Tested)", ...]
+        engine.resolve("StatTrak™ AK-47 | Redline (Field-Tested)")
+    """
+
+    def __init__(self, schema: CS2Schema, types: Mapping[str, str], wears: list[dict[str, Any]]):
+        self.schema = schema
+        self.types = types
+        self.wears = wears
+
+    @classmethod
+    def load(cls, schemas_dir: str | Path = "schemas", serializer: JsonSerializer | None = None) -> "MarketNameEngine":
+        """Load the schema, types.json and wears.json from a directory of generated JSON files."""
+        schemas_dir = Path(schemas_dir)
+        serializer = serializer or JsonSerializer()
+        tables = {}
+        for table in ("types", "wears"):
+            file_path = schemas_dir / f"{table}.json"
+            try:
+                tables[table] = serializer.load_file(file_path)
+            except (OSError, ValueError) as e:
+                raise ConfigurationError(
+                    f"Failed to load schema file {file_path.name}: {e}", details={"path": str(file_path)}
+                ) from e
+        return cls(CS2Schema.load(schemas_dir, serializer), tables["types"], tables["wears"])
+
+    def iter_names(self) -> Iterator[MarketName]:
+        """Every valid market name of every skin, knives without a paint included."""
+        for item in self.schema:
+            yield from self._names_of(item)
+        yield from self._vanilla_knife_names()
+
+    def names_for(self, item_id: str | int) -> list[str]:
+        """Market names of one item of items.json."""
+        item = self.schema.get(item_id)
+        return [] if item is None else [entry.name for entry in self._names_of(item)]
+
+    def resolve(self, name: str) -> MarketName | None:
+        """The item a market name stands for, the lowest paint index for phased paints."""
+        candidates = self._index.get(name)
+        return candidates[0] if candidates else None
+
+    def candidates(self, name: str) -> tuple[MarketName, ...]:
+        """Every item a market name can stand for."""
+        return self._index.get(name, ())
+
+    def resolve_many(self, names: Iterable[str]) -> list[MarketName | None]:
+        """Resolve market names in bulk, ``None`` for unknown names."""
+        first = self._first
+        return [first.get(name) for name in names]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    @cached_property
+    def _index(self) -> dict[str, tuple[MarketName, ...]]:
+        index: dict[str, list[MarketName]] = {}
+        for entry in self.iter_names():
+            index.setdefault(entry.name, []).append(entry)
+        for entries in index.values():
+            entries.sort(key=lambda entry: int(entry.paintindex or 0))
+        return {name: tuple(entries) for name, entries in index.items()}
+
+    @cached_property
+    def _first(self) -> dict[str, MarketName]:
+        return {name: entries[0] for name, entries in self._index.items()}
+
+    @cached_property
+    def _souvenir_containers(self) -> frozenset[str]:
+        definitions = self.schema.definitions
+        return frozenset(
+            container_id
+            for container_id in self.schema.containers
+            if SOUVENIR in definitions.get(container_id, {}).get("name", "")
+        )
+
+    def _type_of(self, defindex: str) -> str | None:
+        return self.types.get(self.schema.definitions.get(defindex, {}).get("type", ""))
+
+    def _exteriors(self, paintindex: str) -> list[str]:
+        paint = self.schema.paints.get(paintindex, {})
+        wear_min = paint.get("wear_min", 0.0)
+        wear_max = paint.get("wear_max", 1.0)
+        return [wear["name"] for wear in self.wears if wear["from"] < wear_max and wear["to"] > wear_min]
+
+    def _names_of(self, item: SchemaItem) -> Iterator[MarketName]:
+        if item.paintindex is None:
+            return
+
+        item_type = self._type_of(item.defindex)
+        variants: list[tuple[str, MarketFlags]]
+        if item_type in (KNIFE_TYPE, GLOVES_TYPE):
+            variants = [(f"{STAR} ", MarketFlags.STAR)]
+            if item_type == KNIFE_TYPE:
+                variants.append((f"{STAR} {STATTRAK} ", MarketFlags.STAR | MarketFlags.STATTRAK))
+        else:
+            variants = [("", MarketFlags.NONE)]
+            souvenir_containers = self._souvenir_containers
+            if any(container not in souvenir_containers for container in item.containers):
+                variants.append((f"{STATTRAK} ", MarketFlags.STATTRAK))
+            if any(container in souvenir_containers for container in item.containers):
+                variants.append((f"{SOUVENIR} ", MarketFlags.SOUVENIR))
+
+        for wear in self._exteriors(item.paintindex):
+            for prefix, flags in variants:
+                yield MarketName(f"{prefix}{item.name} ({wear})", item.defindex, item.paintindex, wear, flags)
+
+    def _vanilla_knife_names(self) -> Iterator[MarketName]:
+        """Knives that exist with a paint are also traded without one, with no exterior."""
+        seen = set()
+        for item in self.schema:
+            if item.paintindex is None or item.defindex in seen or self._type_of(item.defindex) != KNIFE_TYPE:
+                continue
+            seen.add(item.defindex)
+            name = self.schema.definitions[item.defindex]["name"]
+            yield MarketName(f"{STAR} {name}", item.defindex, None, None, MarketFlags.STAR)
+            yield MarketName(
+                f"{STAR} {STATTRAK} {name}", item.defindex, None, None, MarketFlags.STAR | MarketFlags.STATTRAK
+            )
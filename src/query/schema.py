@@ -0,0 +1,257 @@
+"""Indexed, read-only query API over the generated schema tables."""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import ConfigurationError
+from ..models import ProcessedData
+from ..services.serializer import JsonSerializer
+
+REQUIRED_TABLES = ("items", "definitions", "paints")
+OPTIONAL_TABLES = ("rarities", "containers")
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaItem:
+    """An item of items.json joined with its definition, paint and containers."""
+
+    id: str
+    defindex: str
+    paintindex: str | None
+    codename: str
+    name: str
+    name_zh: str
+    rarity: str | None
+    image: str | None
+    containers: tuple[str, ...]
+
+
+def _casefold(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+class CS2Schema:
+    """
+    Query API over items.json, definitions.json, paints.json, rarities.json and containers.json.
+
+    Items are joined once on first use and every index is built the first time it is queried, so a
+    schema only pays for the lookups it serves. All lookups are dictionary probes; ids can be given
+    as strings or integers.
+
+    Example:
+        schema = CS2Schema.load("schemas")
+        schema.by_def_paint(7, 44).name      # "AK-47 | Case Hardened"
+        schema.by_name("ak-47 | 表面淬火")
+        schema.by_rarity("Covert")
+    """
+
+    def __init__(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        definitions: Mapping[str, dict[str, Any]],
+        paints: Mapping[str, dict[str, Any]],
+        rarities: Mapping[str, dict[str, Any]] | None = None,
+        containers: Mapping[str, dict[str, Any]] | None = None,
+    ):
+        self.items = items
+        self.definitions = definitions
+        self.paints = paints
+        self.rarities = rarities or {}
+        self.containers = containers or {}
+
+    @classmethod
+    def load(cls, schemas_dir: str | Path = "schemas", serializer: JsonSerializer | None = None) -> "CS2Schema":
+        """Load the schema tables from a directory of generated JSON files."""
+        schemas_dir = Path(schemas_dir)
+        serializer = serializer or JsonSerializer()
+        tables: dict[str, Any] = {}
+        for table in REQUIRED_TABLES + OPTIONAL_TABLES:
+            file_path = schemas_dir / f"{table}.json"
+            if not file_path.exists():
+                if table in REQUIRED_TABLES:
+                    raise ConfigurationError(
+                        f"Required schema file not found: {file_path.name}", details={"path": str(file_path)}
+                    )
+                continue
+            try:
+                tables[table] = serializer.load_file(file_path)
+            except (OSError, ValueError) as e:
+                raise ConfigurationError(
+                    f"Failed to load schema file {file_path.name}: {e}", details={"path": str(file_path)}
+                ) from e
+        return cls(**tables)
+
+    @classmethod
+    def from_processed_data(cls, data: ProcessedData) -> "CS2Schema":
+        """Build a schema from the tables returned by ResourceCollector.collect()."""
+        return cls(
+            items=data.items,
+            definitions=data.definitions,
+            paints=data.paints,
+            rarities=data.rarities,
+            containers=data.containers,
+        )
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[SchemaItem]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, item_id: object) -> bool:
+        return str(item_id) in self._by_id
+
+    # Single lookups
+
+    def get(self, item_id: str | int) -> SchemaItem | None:
+        """Item by its items.json id, e.g. ``"[44]7"`` or ``"1209"``."""
+        return self._by_id.get(str(item_id))
+
+    def by_def_paint(self, defindex: str | int, paintindex: str | int | None = None) -> SchemaItem | None:
+        """Item by definition index and paint index (``None`` for unpainted items)."""
+        key = (str(defindex), None if paintindex is None else str(paintindex))
+        return self._by_def_paint.get(key)
+
+    def by_codename(self, codename: str) -> tuple[SchemaItem, ...]:
+        """Items sharing an items_game codename, e.g. ``"weapon_ak47"`` or ``"crate_community_22"``."""
+        return self._by_codename.get(codename, ())
+
+    def by_name(self, name: str) -> tuple[SchemaItem, ...]:
+        """Items whose English or Chinese display name matches, ignoring case and repeated spaces."""
+        return self._by_name.get(_casefold(name), ())
+
+    def by_rarity(self, rarity: str | int) -> tuple[SchemaItem, ...]:
+        """Items of a rarity given by id (``6``) or by any English or Chinese rarity name (``"Covert"``)."""
+        key = str(rarity)
+        if key in self._by_rarity:
+            return self._by_rarity[key]
+        rarity_ids = self._rarity_ids.get(_casefold(key), ())
+        if len(rarity_ids) == 1:
+            return self._by_rarity.get(rarity_ids[0], ())
+        return tuple(item for rarity_id in rarity_ids for item in self._by_rarity.get(rarity_id, ()))
+
+    def by_container(self, container_id: str | int) -> tuple[SchemaItem, ...]:
+        """Items dropped by a container, in the order containers.json lists them."""
+        return self._by_container.get(str(container_id), ())
+
+    # Batch lookups
+
+    def get_many(self, item_ids: Iterable[str | int]) -> list[SchemaItem | None]:
+        """Items by id, ``None`` for unknown ids."""
+        by_id = self._by_id
+        return [by_id.get(str(item_id)) for item_id in item_ids]
+
+    def by_def_paint_many(self, pairs: Iterable[tuple[str | int, str | int | None]]) -> list[SchemaItem | None]:
+        """Items by (defindex, paintindex) pairs, ``None`` for unknown pairs."""
+        by_def_paint = self._by_def_paint
+        return [
+            by_def_paint.get((str(defindex), None if paintindex is None else str(paintindex)))
+            for defindex, paintindex in pairs
+        ]
+
+    def by_name_many(self, names: Iterable[str]) -> list[tuple[SchemaItem, ...]]:
+        """Items matching each display name."""
+        by_name = self._by_name
+        return [by_name.get(_casefold(name), ()) for name in names]
+
+    def by_container_many(self, container_ids: Iterable[str | int]) -> list[tuple[SchemaItem, ...]]:
+        """Items dropped by each container."""
+        by_container = self._by_container
+        return [by_container.get(str(container_id), ()) for container_id in container_ids]
+
+    # Indexes, built on first use
+
+    @cached_property
+    def _by_id(self) -> dict[str, SchemaItem]:
+        containers_of: dict[str, list[str]] = {}
+        for container_id, container in self.containers.items():
+            for item_id in container.get("items", ()):
+                containers_of.setdefault(item_id, []).append(container_id)
+
+        by_id = {}
+        for item_id, item in self.items.items():
+            defindex = item.get("def", item_id)
+            paintindex = item.get("paint")
+            definition = self.definitions.get(defindex, {})
+            def_name = definition.get("name", item.get("name", ""))
+            def_name_zh = definition.get("name_zh", def_name)
+
+            if paintindex is not None:
+                paint = self.paints.get(paintindex, {})
+                paint_name = paint.get("name", f"Paint_{paintindex}")
+                name = f"{def_name} | {paint_name}"
+                name_zh = f"{def_name_zh} | {paint.get('name_zh', paint_name)}"
+                rarity = paint.get("rarity")
+            else:
+                name, name_zh = def_name, def_name_zh
+                rarity = definition.get("rarity")
+
+            containers = containers_of.get(item_id, [])
+            containers += [c for c in item.get("containers", ()) if c not in containers]
+
+            by_id[item_id] = SchemaItem(
+                id=item_id,
+                defindex=defindex,
+                paintindex=paintindex,
+                codename=item.get("name", ""),
+                name=name,
+                name_zh=name_zh,
+                rarity=rarity,
+                image=item.get("image"),
+                containers=tuple(containers),
+            )
+        return by_id
+
+    @cached_property
+    def _by_def_paint(self) -> dict[tuple[str, str | None], SchemaItem]:
+        return {(item.defindex, item.paintindex): item for item in self._by_id.values()}
+
+    @cached_property
+    def _by_codename(self) -> dict[str, tuple[SchemaItem, ...]]:
+        return self._group(self._by_id.values(), lambda item: (item.codename,))
+
+    @cached_property
+    def _by_name(self) -> dict[str, tuple[SchemaItem, ...]]:
+        return self._group(self._by_id.values(), lambda item: {_casefold(item.name), _casefold(item.name_zh)})
+
+    @cached_property
+    def _by_rarity(self) -> dict[str, tuple[SchemaItem, ...]]:
+        return self._group(self._by_id.values(), lambda item: () if item.rarity is None else (item.rarity,))
+
+    @cached_property
+    def _rarity_ids(self) -> dict[str, tuple[str, ...]]:
+        """Casefolded rarity name -> rarity ids; some Chinese names are shared by two tiers."""
+        names: dict[str, list[str]] = {}
+        for rarity_id, rarity in self.rarities.items():
+            for field, value in rarity.items():
+                if field != "color" and isinstance(value, str):
+                    ids = names.setdefault(_casefold(value), [])
+                    if rarity_id not in ids:
+                        ids.append(rarity_id)
+        return {name: tuple(ids) for name, ids in names.items()}
+
+    @cached_property
+    def _by_container(self) -> dict[str, tuple[SchemaItem, ...]]:
+        by_id = self._by_id
+        index: dict[str, list[SchemaItem]] = {}
+        for container_id, container in self.containers.items():
+            index[container_id] = [by_id[item_id] for item_id in container.get("items", ()) if item_id in by_id]
+        for item in by_id.values():
+            for container_id in item.containers:
+                items = index.setdefault(container_id, [])
+                if item not in items:
+                    items.append(item)
+        return {container_id: tuple(items) for container_id, items in index.items()}
+
+    @staticmethod
+    def _group(
+        items: Iterable[SchemaItem], keys_of: Callable[[SchemaItem], Iterable[str]]
+    ) -> dict[str, tuple[SchemaItem, ...]]:
+        groups: dict[str, list[SchemaItem]] = {}
+        for item in items:
+            for key in keys_of(item):
+                groups.setdefault(key, []).append(item)
+        return {key: tuple(group) for key, group in groups.items()}
@@ -0,0 +1,316 @@
+"""Bilingual autocomplete and typo-tolerant search over the formatted item names.
+
+The index is built from the formatter output at collection time and exported as
+``search_index.json`` (compact JSON, version 1)::
+
+    {
+      "version": 1,
+      "slugs": [...], "en": [...], "zh": [...],   # documents, ordered by English name length
+      "terms": [...],                             # sorted English words
+      "term_docs": [[...], ...],                  # documents of each word, parallel to "terms"
+      "grams": {"红": [...], "红线": [...]},      # non-ASCII character unigrams and bigrams
+      "trigrams": {" ak": [...], ...}             # English trigrams for fuzzy matching
+    }
+
+Postings are ascending document numbers, stored in the file as the first number followed by the
+gaps between consecutive numbers. English queries match every query word as a prefix of a
+word of the name (binary search over ``terms``); queries with non-ASCII characters match as a substring
+of the Chinese name, narrowed down through the n-gram postings. When fewer results than requested
+are found, names sharing most of the query's trigrams fill the rest, which tolerates typos.
+"""
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate, pairwise
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import DataValidationError
+from ..services.serializer import JsonSerializer
+
+SEARCH_INDEX_FILE = "search_index.json"
+SEARCH_INDEX_VERSION = 1
+
+FUZZY_THRESHOLD = 0.5
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """A matching item and how well it matched (1.0 for prefix and substring matches)."""
+
+    slug: str
+    name_en: str
+    name_zh: str
+    score: float
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_WORD_RE.findall(text.casefold()))
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _chinese_grams(text: str) -> set[str]:
+    """Character unigrams and bigrams with at least one non-ASCII character."""
+    text = text.casefold()
+    grams = set(text) | {text[i : i + 2] for i in range(len(text) - 1)}
+    return {gram for gram in grams if not gram.isascii()}
+
+
+def _delta_encode(postings: list[int]) -> list[int]:
+    return postings[:1] + [number - previous for previous, number in pairwise(postings)]
+
+
+def _delta_decode(gaps: list[int]) -> list[int]:
+    return list(accumulate(gaps))
+
+
+class SearchIndex:
+    """
+    Prefix, n-gram and trigram index over item names in English and Chinese.
+
+    Example:
+        index = SearchIndex.load("schemas/search_index.json")
+        index.search("ak redl")       # AK-47 | Redline, ...
+        index.search("红线")
+        index.search("karambti")      # typo, answered by trigram similarity
+    """
+
+    def __init__(
+        self,
+        slugs: list[str],
+        en: list[str],
+        zh: list[str],
+        terms: list[str],
+        term_docs: list[list[int]],
+        grams: dict[str, list[int]],
+        trigrams: dict[str, list[int]],
+    ):
+        self.slugs = slugs
+        self.en = en
+        self.zh = zh
+        self.terms = terms
+        self.term_docs = term_docs
+        self.grams = grams
+        self.trigrams = trigrams
+
+    @classmethod
+    def from_items(cls, items: Iterable[Any]) -> "SearchIndex":
+        """Build the index from formatted items (CS2Item objects or their dictionaries)."""
+        builder = SearchIndexBuilder()
+        for item in items:
+            builder.add(item)
+        return builder.build()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SearchIndex":
+        """Rebuild an index from the search_index.json layout."""
+        if data.get("version") != SEARCH_INDEX_VERSION:
+            raise DataValidationError(f"Unsupported search index version: {data.get('version')}")
+        return cls(
+            slugs=data["slugs"],
+            en=data["en"],
+            zh=data["zh"],
+            terms=data["terms"],
+            term_docs=[_delta_decode(gaps) for gaps in data["term_docs"]],
+            grams={gram: _delta_decode(gaps) for gram, gaps in data["grams"].items()},
+            trigrams={trigram: _delta_decode(gaps) for trigram, gaps in data["trigrams"].items()},
+        )
+
+    @classmethod
+    def load(cls, path: str | Path, serializer: JsonSerializer | None = None) -> "SearchIndex":
+        """Load an exported search_index.json."""
+        return cls.from_dict((serializer or JsonSerializer()).load_file(Path(path)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """The search_index.json layout of this index."""
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "slugs": self.slugs,
+            "en": self.en,
+            "zh": self.zh,
+            "terms": self.terms,
+            "term_docs": [_delta_encode(postings) for postings in self.term_docs],
+            "grams": {gram: _delta_encode(postings) for gram, postings in self.grams.items()},
+            "trigrams": {trigram: _delta_encode(postings) for trigram, postings in self.trigrams.items()},
+        }
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> list[SearchHit]:
+        """
+        Best matches of a query, exact matches first and then, if enabled, fuzzy ones.
+
+        Args:
+            query: English words (each one a prefix) or a Chinese substring
+            limit: Maximum number of hits
+            fuzzy: Fill up with trigram matches when there are fewer than ``limit`` exact matches
+        """
+        if query.isascii():
+            numbers = self._prefix_matches(_normalize(query), limit)
+        else:
+            numbers = self._chinese_matches(query.casefold().strip(), limit)
+
+        hits = [self._hit(number, 1.0) for number in numbers]
+        if fuzzy and len(hits) < limit:
+            found = set(numbers)
+            for number, score in self._fuzzy_matches(_normalize(query), limit + len(found)):
+                if number not in found:
+                    hits.append(self._hit(number, score))
+                    if len(hits) == limit:
+                        break
+        return hits
+
+    def _hit(self, number: int, score: float) -> SearchHit:
+        return SearchHit(self.slugs[number], self.en[number], self.zh[number], score)
+
+    def _term_range(self, prefix: str) -> range:
+        """Positions in ``terms`` of the words starting with a prefix."""
+        start = bisect_left(self.terms, prefix)
+        # U+FFFF sorts after every character that can follow the prefix in a word
+        return range(start, bisect_left(self.terms, prefix + "\uffff", start))
+
+    def _prefix_matches(self, query: str, limit: int) -> list[int]:
+        words = query.split()
+        if not words:
+            return []
+
+        # Start from the query word with the fewest postings, then check the others per document
+        ranges = sorted((self._term_range(word) for word in words), key=len)
+        if not ranges[0]:
+            return []
+        candidates: set[int] = set()
+        for position in ranges[0]:
+            candidates.update(self.term_docs[position])
+
+        for term_range in ranges[1:]:
+            if not term_range:
+                return []
+            matching: set[int] = set()
+            for position in term_range:
+                matching.update(self.term_docs[position])
+            candidates &= matching
+            if not candidates:
+                return []
+
+        # Names starting with the whole query come first
+        leading = sorted(number for number in self._name_prefix_matches(query) if number in candidates)
+        leading_set = set(leading)
+        rest = sorted(candidates - leading_set) if len(leading) < limit else []
+        return (leading + rest)[:limit]
+
+    def _name_prefix_matches(self, query: str) -> Iterator[int]:
+        names = self._sorted_names
+        start = bisect_left(names, (query,))
+        for name, number in names[start:]:
+            if not name.startswith(query):
+                break
+            yield number
+
+    @cached_property
+    def _sorted_names(self) -> list[tuple[str, int]]:
+        return sorted((_normalize(name), number) for number, name in enumerate(self.en))
+
+    def _chinese_matches(self, query: str, limit: int) -> list[int]:
+        if not query:
+            return []
+        grams = _chinese_grams(query)
+        bigrams = [gram for gram in grams if len(gram) == 2]
+        postings = [self.grams.get(gram, ()) for gram in bigrams or grams]
+        postings.sort(key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        # Bigrams only narrow the candidates down, the query must still occur as a whole
+        matches = []
+        for number in sorted(candidates):
+            if query in self.zh[number].casefold():
+                matches.append(number)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def _fuzzy_matches(self, query: str, limit: int) -> list[tuple[int, float]]:
+        """Documents ranked by the share of the query's trigrams found in their English name."""
+        if not query:
+            return []
+        query_trigrams = _trigrams(query)
+        shared: dict[int, int] = {}
+        for trigram in query_trigrams:
+            for number in self.trigrams.get(trigram, ()):
+                shared[number] = shared.get(number, 0) + 1
+
+        minimum = FUZZY_THRESHOLD * len(query_trigrams)
+        scored = sorted((-count, number) for number, count in shared.items() if count >= minimum)
+        return [(number, -count / len(query_trigrams)) for count, number in scored[:limit]]
+
+
+class SearchIndexBuilder:
+    """
+    Accumulates the names of formatted items while they stream past, then builds a SearchIndex.
+
+    Example:
+        builder = SearchIndexBuilder()
+        formatter.save_formatted_items(items=builder.collect(formatter.iter_items()))
+        index = builder.build()
+    """
+
+    def __init__(self) -> None:
+        self.docs: list[tuple[str, str, str]] = []
+
+    def add(self, item: Any) -> None:
+        """Add a formatted item (a CS2Item or its dictionary)."""
+        if isinstance(item, dict):
+            slug, name = item["slug_name"], item["name"]
+        else:
+            slug, name = item.slug_name, item.name
+        en = name.get("en-US") or ""
+        self.docs.append((slug, en, name.get("zh-CN") or en))
+
+    def collect(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Pass items through unchanged, adding each one to the index."""
+        for item in items:
+            self.add(item)
+            yield item
+
+    def build(self) -> SearchIndex:
+        """Build the index over every item added so far."""
+        # Shorter names first, so that ascending document numbers rank results
+        docs = sorted(self.docs, key=lambda doc: (len(doc[1]), doc[1].casefold(), doc[0]))
+
+        words: dict[str, list[int]] = {}
+        grams: dict[str, list[int]] = {}
+        trigrams: dict[str, list[int]] = {}
+        for number, (_, en, zh) in enumerate(docs):
+            normalized = _normalize(en)
+            for word in dict.fromkeys(normalized.split()):
+                words.setdefault(word, []).append(number)
+            for gram in _chinese_grams(zh):
+                grams.setdefault(gram, []).append(number)
+            for trigram in _trigrams(normalized):
+                trigrams.setdefault(trigram, []).append(number)
+
+        terms = sorted(words)
+        return SearchIndex(
+            slugs=[doc[0] for doc in docs],
+            en=[doc[1] for doc in docs],
+            zh=[doc[2] for doc in docs],
+            terms=terms,
+            term_docs=[words[term] for term in terms],
+            grams=dict(sorted(grams.items())),
+            trigrams=dict(sorted(trigrams.items())),
+        )
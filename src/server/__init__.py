@@ -0,0 +1,13 @@
+"""HTTP lookup service over the generated schema (``python -m src.server``).
+
+The load-test harness lives in ``src.server.loadtest`` and is not imported here.
+"""
+
+from .app import create_app
+from .state import SchemaService, SchemaState
+
+__all__ = [
+    "create_app",
+    "SchemaService",
+    "SchemaState",
+]
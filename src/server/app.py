@@ -0,0 +1,219 @@
+"""aiohttp lookup service over the generated schema.
+
+Endpoints (JSON in, JSON out)::
+
+    GET  /healthz                 state summary
+    GET  /items/{id}              one item of items.json, e.g. /items/[282]7
+    POST /items:batchGet          {"ids": [...]} and/or {"pairs": [[defindex, paintindex], ...]}
+    POST /market:resolve          {"names": [...]} market hash names to items
+    GET  /market/{id}             market hash names of one item
+    POST /admin/reload            reload the schema directory now
+
+Every response carries the ETag of the schema generation that answered it. GET requests with a
+matching ``If-None-Match`` are answered with 304. Batch results are lists parallel to the request,
+with ``null`` for unknown entries.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+from ..query import MarketFlags, MarketName, SchemaItem
+from ..services.serializer import JsonSerializer
+from .state import SchemaService, SchemaState
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 10_000
+
+SERVICE_KEY = web.AppKey("service", SchemaService)
+
+_serializer = JsonSerializer(indent=None, sort_keys=False)
+
+
+def _item_dict(item: SchemaItem | None) -> dict[str, Any] | None:
+    return None if item is None else asdict(item)
+
+
+def _market_dict(entry: MarketName | None) -> dict[str, Any] | None:
+    if entry is None:
+        return None
+    item = f"[{entry.paintindex}]{entry.defindex}" if entry.paintindex is not None else entry.defindex
+    return {
+        "name": entry.name,
+        "item_id": item,
+        "defindex": entry.defindex,
+        "paintindex": entry.paintindex,
+        "wear": entry.wear,
+        "flags": [flag.name.lower() for flag in MarketFlags if flag and flag in entry.flags],
+    }
+
+
+def _json(data: Any, state: SchemaState, status: int = 200) -> web.Response:
+    return web.Response(
+        body=_serializer.dumps(data),
+        status=status,
+        content_type="application/json",
+        headers={"ETag": state.etag},
+    )
+
+
+def _error(message: str, status: int, state: SchemaState | None = None) -> web.Response:
+    headers = {"ETag": state.etag} if state is not None else None
+    return web.Response(
+        body=_serializer.dumps({"error": message}), status=status, content_type="application/json", headers=headers
+    )
+
+
+def _not_modified(request: web.Request, state: SchemaState) -> web.Response | None:
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return None
+    # If-None-Match compares weakly (RFC 9110 13.1.2): "a", W/"a" and list spacing all match
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if "*" in tags or state.etag in tags:
+        return web.Response(status=304, headers={"ETag": state.etag})
+    return None
+
+
+async def _read_batch(request: web.Request, state: SchemaState, *fields: str) -> dict[str, list] | web.Response:
+    """Parse a batch request body into lists, or an error response."""
+    try:
+        body = _serializer.loads(await request.read())
+    except ValueError:
+        return _error("Request body is not valid JSON", 400, state)
+    if not isinstance(body, dict):
+        return _error("Request body must be a JSON object", 400, state)
+
+    batch = {}
+    for field in fields:
+        values = body.get(field, [])
+        if not isinstance(values, list):
+            return _error(f"'{field}' must be a list", 400, state)
+        batch[field] = values
+    size = sum(len(values) for values in batch.values())
+    if size > MAX_BATCH_SIZE:
+        return _error(f"Batch of {size} entries exceeds the limit of {MAX_BATCH_SIZE}", 413, state)
+    return batch
+
+
+async def healthz(request: web.Request) -> web.Response:
+    service = request.app[SERVICE_KEY]
+    return _json({"status": "ok", **service.describe()}, service.state)
+
+
+async def get_item(request: web.Request) -> web.Response:
+    state = request.app[SERVICE_KEY].state
+    if response := _not_modified(request, state):
+        return response
+    item = state.schema.get(request.match_info["item_id"])
+    if item is None:
+        return _error("Item not found", 404, state)
+    return _json(_item_dict(item), state)
+
+
+async def batch_get_items(request: web.Request) -> web.Response:
+    state = request.app[SERVICE_KEY].state
+    batch = await _read_batch(request, state, "ids", "pairs")
+    if isinstance(batch, web.Response):
+        return batch
+
+    pairs = []
+    for pair in batch["pairs"]:
+        if not isinstance(pair, list) or not 1 <= len(pair) <= 2:
+            return _error("'pairs' entries must be [defindex] or [defindex, paintindex]", 400, state)
+        pairs.append((pair[0], pair[1] if len(pair) == 2 else None))
+
+    data = {}
+    if batch["ids"]:
+        data["ids"] = [_item_dict(item) for item in state.schema.get_many(str(item_id) for item_id in batch["ids"])]
+    if pairs:
+        data["pairs"] = [_item_dict(item) for item in state.schema.by_def_paint_many(pairs)]
+    return _json(data, state)
+
+
+async def resolve_market_names(request: web.Request) -> web.Response:
+    state = request.app[SERVICE_KEY].state
+    batch = await _read_batch(request, state, "names")
+    if isinstance(batch, web.Response):
+        return batch
+    if not all(isinstance(name, str) for name in batch["names"]):
+        return _error("'names' must be a list of strings", 400, state)
+    return _json({"names": [_market_dict(entry) for entry in state.market.resolve_many(batch["names"])]}, state)
+
+
+async def get_market_names(request: web.Request) -> web.Response:
+    state = request.app[SERVICE_KEY].state
+    if response := _not_modified(request, state):
+        return response
+    item_id = request.match_info["item_id"]
+    if item_id not in state.schema:
+        return _error("Item not found", 404, state)
+    return _json({"names": state.market.names_for(item_id)}, state)
+
+
+async def reload_schema(request: web.Request) -> web.Response:
+    service = request.app[SERVICE_KEY]
+    try:
+        changed = await service.reload(force=True)
+    except Exception as e:
+        logger.error("Schema reload failed", exc_info=True)
+        # Without a loaded state (the first load failed too) the error goes out without an ETag
+        return _error(f"Reload failed: {e}", 500, service.state if service.loaded else None)
+    return _json({"reloaded": changed, **service.describe()}, service.state)
+
+
+def create_app(
+    schemas_dir: str | Path = "schemas", watch_interval: float | None = None, state: SchemaState | None = None
+) -> web.Application:
+    """
+    Build the application; the schema is loaded on startup unless a state is given.
+
+    Args:
+        schemas_dir: Directory of generated JSON files
+        watch_interval: Seconds between checks for changed files, no watching when None
+        state: Preloaded state, e.g. shared between applications in tests and benchmarks
+    """
+    app = web.Application()
+    app[SERVICE_KEY] = SchemaService(schemas_dir, state)
+
+    async def lifecycle(app: web.Application) -> AsyncIterator[None]:
+        service = app[SERVICE_KEY]
+        if not service.loaded:
+            await service.reload(force=True)
+        watcher = asyncio.create_task(service.watch(watch_interval)) if watch_interval else None
+        yield
+        if watcher is not None:
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+
+    app.cleanup_ctx.append(lifecycle)
+    app.router.add_get("/healthz", healthz)
+    app.router.add_get("/items/{item_id}", get_item)
+    app.router.add_post("/items:batchGet", batch_get_items)
+    app.router.add_post("/market:resolve", resolve_market_names)
+    app.router.add_get("/market/{item_id}", get_market_names)
+    app.router.add_post("/admin/reload", reload_schema)
+    return app
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve schema lookups over HTTP")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--watch", type=float, default=2.0, metavar="SECONDS", help="Check for new schema files (0 to disable)"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    web.run_app(create_app(args.schemas_dir, args.watch or None), host=args.host, port=args.port)
@@ -0,0 +1,193 @@
+"""Load-test harness for the lookup service.
+
+Starts the service in a subprocess on localhost (or targets ``--url``), then keeps ``--concurrency``
+clients busy for ``--duration`` seconds with a mix of single lookups, batch lookups and market name
+resolutions drawn from the local schema, and reports throughput and latency percentiles per endpoint::
+
+    python -m src.server.loadtest --schemas-dir schemas --duration 10 --concurrency 64 --batch-size 100
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import quote
+
+import aiohttp
+
+from ..query import MarketNameEngine
+
+# Share of requests per endpoint
+DEFAULT_MIX = {"get": 0.4, "batch": 0.3, "resolve": 0.3}
+
+
+@dataclass
+class EndpointStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    entries: int = 0
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_ready(session: aiohttp.ClientSession, url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with session.get(f"{url}/healthz") as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientError:
+            pass
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Service at {url} did not become ready within {timeout:.0f}s")
+        await asyncio.sleep(0.1)
+
+
+async def _worker(
+    session: aiohttp.ClientSession,
+    url: str,
+    ids: list[str],
+    names: list[str],
+    mix: dict[str, float],
+    batch_size: int,
+    deadline: float,
+    stats: dict[str, EndpointStats],
+    rng: random.Random,
+) -> None:
+    kinds, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        kind = rng.choices(kinds, weights)[0]
+        if kind == "get":
+            request = session.get(f"{url}/items/{quote(rng.choice(ids), safe='')}")
+            entries = 1
+        elif kind == "batch":
+            request = session.post(f"{url}/items:batchGet", json={"ids": rng.choices(ids, k=batch_size)})
+            entries = batch_size
+        else:
+            request = session.post(f"{url}/market:resolve", json={"names": rng.choices(names, k=batch_size)})
+            entries = batch_size
+
+        start = time.perf_counter()
+        try:
+            async with request as response:
+                await response.read()
+                ok = response.status == 200
+        except aiohttp.ClientError:
+            ok = False
+        elapsed = time.perf_counter() - start
+
+        endpoint = stats[kind]
+        if ok:
+            endpoint.latencies.append(elapsed)
+            endpoint.entries += entries
+        else:
+            endpoint.errors += 1
+
+
+async def run_load(
+    url: str,
+    ids: list[str],
+    names: list[str],
+    duration: float = 10.0,
+    concurrency: int = 64,
+    batch_size: int = 100,
+    mix: dict[str, float] | None = None,
+    seed: int = 0,
+) -> dict[str, dict[str, float]]:
+    """
+    Drive a running service and summarize every endpoint.
+
+    Returns:
+        Per endpoint: requests, errors, requests and entries per second and latency percentiles (seconds)
+    """
+    mix = mix or DEFAULT_MIX
+    stats = {kind: EndpointStats() for kind in mix}
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await _wait_ready(session, url, timeout=60)
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(
+            *(
+                _worker(session, url, ids, names, mix, batch_size, deadline, stats, random.Random(seed + n))
+                for n in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+    results = {}
+    for kind, endpoint in stats.items():
+        latencies = sorted(endpoint.latencies)
+        if len(latencies) > 1:
+            percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            p50, p90, p99 = percentiles[49], percentiles[89], percentiles[98]
+        else:
+            p50 = p90 = p99 = latencies[0] if latencies else float("nan")
+        results[kind] = {
+            "requests": len(latencies),
+            "errors": endpoint.errors,
+            "rps": len(latencies) / elapsed,
+            "entries_per_second": endpoint.entries / elapsed,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test of the schema lookup service")
+    parser.add_argument("--schemas-dir", type=Path, default=Path("schemas"))
+    parser.add_argument("--url", help="Target a running service instead of starting one on localhost")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent clients")
+    parser.add_argument("--batch-size", type=int, default=100, help="Entries per batch request")
+    args = parser.parse_args(argv)
+
+    # Request payloads come from the same schema the service answers from
+    engine = MarketNameEngine.load(args.schemas_dir)
+    ids = [item.id for item in engine.schema]
+    names = [entry.name for entry in engine.iter_names()]
+
+    server = None
+    url = args.url
+    if url is None:
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "src.server", "--schemas-dir", str(args.schemas_dir.resolve()), "--port", str(port)],
+            cwd=Path(__file__).resolve().parents[2],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    try:
+        results = asyncio.run(run_load(url.rstrip("/"), ids, names, args.duration, args.concurrency, args.batch_size))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    header = ("endpoint", "requests", "errors", "req/s", "entries/s", "p50 ms", "p90 ms", "p99 ms")
+    print("{:<9} {:>9} {:>7} {:>9} {:>11} {:>8} {:>8} {:>8}".format(*header))
+    for kind, result in results.items():
+        print(
+            f"{kind:<9} {result['requests']:>9} {result['errors']:>7} {result['rps']:>9.0f} "
+            f"{result['entries_per_second']:>11.0f} {result['p50'] * 1e3:>8.2f} {result['p90'] * 1e3:>8.2f} "
+            f"{result['p99'] * 1e3:>8.2f}"
+        )
+    return 1 if any(result["errors"] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Immutable in-memory schema state served by the lookup service, and its hot-swapping holder."""
+
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from ..query import CS2Schema, MarketNameEngine
+from ..services.file_manager import FileManager
+from ..services.serializer import JsonSerializer
+
+logger = logging.getLogger(__name__)
+
+# Tables the service loads; their content (or the manifest covering them) makes up the ETag
+SERVED_TABLES = ("items", "definitions", "paints", "rarities", "containers", "types", "wears")
+
+
+def _table_paths(schemas_dir: Path) -> list[Path]:
+    return [schemas_dir / f"{table}.json" for table in SERVED_TABLES]
+
+
+def content_hash(schemas_dir: str | Path) -> str:
+    """
+    SHA-256 over the served tables.
+
+    When the collector's manifest is present its recorded digests are hashed instead of re-reading
+    every file; otherwise the files themselves are hashed.
+    """
+    schemas_dir = Path(schemas_dir)
+    digest = hashlib.sha256()
+    manifest_path = schemas_dir / FileManager.MANIFEST_FILE
+    if manifest_path.exists():
+        manifest = JsonSerializer().load_file(manifest_path).get("files", {})
+        entries = {key: entry for key, entry in manifest.items() if Path(key).stem in SERVED_TABLES}
+        if entries:
+            for key in sorted(entries):
+                digest.update(f"{key}:{entries[key]['sha256']}\n".encode())
+            return digest.hexdigest()
+
+    for path in _table_paths(schemas_dir):
+        if path.exists():
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def files_signature(schemas_dir: str | Path) -> tuple[tuple[str, int, int], ...]:
+    """Cheap change detector: name, size and modification time of the served tables and the manifest."""
+    schemas_dir = Path(schemas_dir)
+    signature = []
+    for path in [*_table_paths(schemas_dir), schemas_dir / FileManager.MANIFEST_FILE]:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaState:
+    """One loaded generation of the schema with warmed-up indexes; never mutated once built."""
+
+    schema: CS2Schema
+    market: MarketNameEngine
+    etag: str
+    signature: tuple[tuple[str, int, int], ...]
+    loaded_at: float
+
+    @classmethod
+    def load(cls, schemas_dir: str | Path = "schemas") -> "SchemaState":
+        """Load the tables and build the indexes the endpoints use (blocking)."""
+        schemas_dir = Path(schemas_dir)
+        signature = files_signature(schemas_dir)
+        market = MarketNameEngine.load(schemas_dir)
+        # Build the lazy indexes now, so that the first requests after a swap are not the slow ones
+        len(market.schema)
+        market.resolve_many(())
+        len(market)
+        return cls(
+            schema=market.schema,
+            market=market,
+            etag=f'"{content_hash(schemas_dir)[:32]}"',
+            signature=signature,
+            loaded_at=time.time(),
+        )
+
+
+class SchemaService:
+    """
+    Holder of the current SchemaState.
+
+    Handlers read ``service.state`` once per request and work on that generation only. A reload
+    builds the next generation in a worker thread and then replaces the reference, so requests are
+    never blocked and never see a half-built state.
+    """
+
+    def __init__(self, schemas_dir: str | Path = "schemas", state: SchemaState | None = None):
+        self.schemas_dir = Path(schemas_dir)
+        self._state = state
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._state is not None
+
+    @property
+    def state(self) -> SchemaState:
+        if self._state is None:
+            raise RuntimeError("Schema state is not loaded yet")
+        return self._state
+
+    async def reload(self, force: bool = False) -> bool:
+        """
+        Load the schema directory again and swap it in.
+
+        Args:
+            force: Reload even when the files look unchanged
+
+        Returns:
+            True if a new state was swapped in
+        """
+        async with self._lock:
+            current = self._state
+            if not force and current is not None and files_signature(self.schemas_dir) == current.signature:
+                return False
+            state = await asyncio.to_thread(SchemaState.load, self.schemas_dir)
+            if not force and current is not None and state.etag == current.etag:
+                # Touched but identical files: keep the current generation, remember the new signature
+                self._state = replace(current, signature=state.signature)
+                return False
+            self._state = state
+            logger.info("Schema state loaded (%d items, etag %s)", len(state.schema), state.etag)
+            return True
+
+    async def watch(self, interval: float) -> None:
+        """Poll the schema files and reload on change until cancelled; failed reloads keep the old state."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.error("Schema reload failed, still serving the previous state", exc_info=True)
+
+    def describe(self) -> dict[str, Any]:
+        state = self.state
+        return {
+            "etag": state.etag,
+            "items": len(state.schema),
+            "market_names": len(state.market),
+            "loaded_at": state.loaded_at,
+        }
@@ -0,0 +1,192 @@
+"""Columnar (struct-of-arrays) export of items, paints and definitions for analytics consumers.
+
+Every entity becomes a set of parallel arrays sorted by its id. Missing integers are stored as -1 and
+missing floats as NaN. Two storage formats are supported:
+
+* ``npy``: ``columnar/<entity>/<column>.npy``, one NumPy array per column, loadable with ``mmap_mode``
+  (strings are fixed-width unicode arrays, so they map as well)
+* ``parquet``: ``columnar/<entity>.parquet``, one Parquet file per entity, written when pyarrow is installed
+"""
+
+import io
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import ConfigurationError
+from .compressor import COMPRESSORS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None  # type: ignore[assignment]
+
+COLUMNAR_DIR = "columnar"
+COLUMNAR_FORMATS = ("auto", "npy", "parquet")
+ENTITIES = ("items", "paints", "definitions")
+
+
+def resolve_format(fmt: str) -> str:
+    """Resolve "auto" to parquet or npy and check that the required libraries are installed."""
+    if fmt not in COLUMNAR_FORMATS:
+        raise ConfigurationError(f"Unknown columnar format: {fmt}", details={"formats": list(COLUMNAR_FORMATS)})
+    if np is None:
+        raise ConfigurationError("Columnar export requires the numpy package")
+    if fmt == "auto":
+        return "parquet" if pyarrow is not None else "npy"
+    if fmt == "parquet" and pyarrow is None:
+        raise ConfigurationError("Parquet columnar export requires the pyarrow package")
+    return fmt
+
+
+def _int_or_missing(value: Any) -> int:
+    return int(value) if value not in (None, "") else -1
+
+
+def build_columns(
+    items: dict[str, dict[str, Any]],
+    paints: dict[str, dict[str, Any]],
+    definitions: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, "np.ndarray"]]:
+    """Pivot items, paints and definitions into NumPy columns."""
+    if np is None:
+        raise ConfigurationError("Columnar export requires the numpy package")
+
+    paint_ids = sorted(paints, key=int)
+    paint_columns = {
+        "paintindex": np.array([int(paint_id) for paint_id in paint_ids], dtype=np.int32),
+        "rarity": np.array([_int_or_missing(paints[p].get("rarity")) for p in paint_ids], dtype=np.int16),
+        "phase": np.array([_int_or_missing(paints[p].get("phase")) for p in paint_ids], dtype=np.int16),
+        "wear_min": np.array([paints[p].get("wear_min", np.nan) for p in paint_ids], dtype=np.float64),
+        "wear_max": np.array([paints[p].get("wear_max", np.nan) for p in paint_ids], dtype=np.float64),
+        "name": np.array([paints[p].get("name", "") for p in paint_ids], dtype=np.str_),
+        "name_zh": np.array([paints[p].get("name_zh", "") for p in paint_ids], dtype=np.str_),
+    }
+
+    def_ids = sorted(definitions, key=int)
+    definition_columns = {
+        "defindex": np.array([int(def_id) for def_id in def_ids], dtype=np.int32),
+        "type": np.array([_int_or_missing(definitions[d].get("type")) for d in def_ids], dtype=np.int16),
+        "quality": np.array([_int_or_missing(definitions[d].get("quality")) for d in def_ids], dtype=np.int16),
+        "rarity": np.array([_int_or_missing(definitions[d].get("rarity")) for d in def_ids], dtype=np.int16),
+        "name": np.array([definitions[d].get("name", "") for d in def_ids], dtype=np.str_),
+        "name_zh": np.array([definitions[d].get("name_zh", "") for d in def_ids], dtype=np.str_),
+    }
+
+    item_ids = sorted(items)
+    item_defs, item_paints, rarities, wear_min, wear_max = [], [], [], [], []
+    for item_id in item_ids:
+        item = items[item_id]
+        paint = paints.get(item.get("paint", ""), {})
+        definition = definitions.get(item.get("def", ""), {})
+        item_defs.append(_int_or_missing(item.get("def")))
+        item_paints.append(_int_or_missing(item.get("paint")))
+        # painted items take the paint rarity, everything else the definition rarity
+        rarities.append(_int_or_missing(paint.get("rarity") if paint else definition.get("rarity")))
+        wear_min.append(paint.get("wear_min", np.nan))
+        wear_max.append(paint.get("wear_max", np.nan))
+
+    item_columns = {
+        "id": np.array(item_ids, dtype=np.str_),
+        "def": np.array(item_defs, dtype=np.int32),
+        "paint": np.array(item_paints, dtype=np.int32),
+        "rarity": np.array(rarities, dtype=np.int16),
+        "wear_min": np.array(wear_min, dtype=np.float64),
+        "wear_max": np.array(wear_max, dtype=np.float64),
+        "name": np.array([items[i].get("name", "") for i in item_ids], dtype=np.str_),
+        "image": np.array([items[i].get("image", "") for i in item_ids], dtype=np.str_),
+    }
+
+    return {"items": item_columns, "paints": paint_columns, "definitions": definition_columns}
+
+
+def encode_columns(columns: dict[str, dict[str, "np.ndarray"]], fmt: str) -> list[tuple[str, bytes]]:
+    """
+    Serialize columns in the given format.
+
+    Returns:
+        (path relative to the resource directory, content) pairs
+    """
+    fmt = resolve_format(fmt)
+    files = []
+
+    for entity, entity_columns in columns.items():
+        if fmt == "parquet":
+            table = pyarrow.table(entity_columns)
+            buffer = pyarrow.BufferOutputStream()
+            pyarrow.parquet.write_table(table, buffer)
+            files.append((f"{COLUMNAR_DIR}/{entity}.parquet", buffer.getvalue().to_pybytes()))
+        else:
+            for name, array in entity_columns.items():
+                buffer = io.BytesIO()
+                np.save(buffer, array, allow_pickle=False)
+                files.append((f"{COLUMNAR_DIR}/{entity}/{name}.npy", buffer.getvalue()))
+
+    return files
+
+
+def remove_stale_files(resource_dir: str | Path, files: list[tuple[str, bytes]]) -> list[Path]:
+    """
+    Delete columnar outputs that encode_columns no longer produces.
+
+    That is the other format's files after a format switch and npy columns that were dropped, together
+    with their compressed copies. Emptied entity directories are removed, so load_columns does not
+    prefer them over the Parquet files.
+
+    Returns:
+        Paths of the deleted outputs
+    """
+    base = Path(resource_dir) / COLUMNAR_DIR
+    written = {Path(resource_dir) / path for path, _ in files}
+    removed = []
+    try:
+        for entity in ENTITIES:
+            entity_dir = base / entity
+            candidates = [base / f"{entity}.parquet"]
+            if entity_dir.is_dir():
+                candidates.extend(sorted(entity_dir.glob("*.npy")))
+            for path in candidates:
+                if path in written or not path.exists():
+                    continue
+                path.unlink()
+                for suffix in COMPRESSORS:
+                    path.with_name(f"{path.name}.{suffix}").unlink(missing_ok=True)
+                removed.append(path)
+            if entity_dir.is_dir() and not any(entity_dir.iterdir()):
+                entity_dir.rmdir()
+    except OSError as e:
+        raise ConfigurationError(f"Failed to remove stale columnar files: {e}", details={"path": str(base)}) from e
+    return removed
+
+
+def load_columns(resource_dir: str | Path, entity: str, mmap: bool = True) -> dict[str, "np.ndarray"]:
+    """
+    Load the columns of one entity written by encode_columns.
+
+    npy columns are memory-mapped read-only when mmap is set; Parquet files are read through a memory map
+    and converted to NumPy arrays.
+    """
+    if np is None:
+        raise ConfigurationError("Columnar export requires the numpy package")
+
+    base = Path(resource_dir) / COLUMNAR_DIR
+    entity_dir = base / entity
+    if entity_dir.is_dir():
+        return {
+            path.stem: np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+            for path in sorted(entity_dir.glob("*.npy"))
+        }
+
+    parquet_file = base / f"{entity}.parquet"
+    if parquet_file.exists():
+        if pyarrow is None:
+            raise ConfigurationError("Reading Parquet columns requires the pyarrow package")
+        table = pyarrow.parquet.read_table(parquet_file, memory_map=mmap)
+        return {name: table.column(name).to_numpy() for name in table.column_names}
+
+    raise ConfigurationError(f"No columnar data for {entity}", details={"path": str(base)})
@@ -0,0 +1,135 @@
+"""Compact, column-oriented variant of items.json with factored-out CDN URL prefixes.
+
+Layout of ``items.compact.json``::
+
+    {
+      "version": 1,
+      "prefixes": ["http://media.steampowered.com/apps/730/icons/econ/default_generated/"],
+      "ids": ["[10006]5027", "1000", ...],
+      "names": ["studded_bloodhound_gloves", "Community Season One Spring 2013", ...],
+      "image_prefix": [0, null, ...],
+      "image_variant": ["bloodhound_black_silver_light", null, ...],
+      "image_sha": ["36a1...", null, ...],
+      "extra": {"<item id>": {"containers": [...]}}
+    }
+
+Columns are parallel to ``ids`` and ``null`` marks an absent value. ``def`` and ``paint`` are not stored
+when they match the item id (``"<def>"`` or ``"[<paint>]<def>"``). Images following the CDN naming
+``<prefix><name>_<variant>_large.<sha1>.png`` keep only the variant and hash; other images keep the
+rest of the URL in ``image_variant`` with a ``null`` hash. Any other field goes to the sparse ``extra``
+mapping, where ``"def": null`` marks an item without a definition index and ``"paint": null`` an item
+keyed ``[<paint>]<def>`` without a paint index.
+"""
+
+import re
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import DataValidationError
+from .serializer import JsonSerializer
+
+COMPACT_VERSION = 1
+
+_ITEM_ID_RE = re.compile(r"^\[(?P<paint>[^\]]+)\](?P<def>.+)$")
+_GENERATED_IMAGE_RE = re.compile(r"^(?P<variant>.+)_large\.(?P<sha>[0-9a-f]{40})\.png$")
+
+
+def _implied_indexes(item_id: str) -> tuple[str, str | None]:
+    """Definition and paint index implied by an item id."""
+    if match := _ITEM_ID_RE.match(item_id):
+        return match["def"], match["paint"]
+    return item_id, None
+
+
+def compact_items(items: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Convert items.json data into the compact layout."""
+    prefix_ids: dict[str, int] = {}
+    names: list[str | None] = []
+    image_prefix: list[int | None] = []
+    image_variant: list[str | None] = []
+    image_sha: list[str | None] = []
+    extra: dict[str, dict[str, Any]] = {}
+
+    for item_id, item in items.items():
+        implied_def, implied_paint = _implied_indexes(item_id)
+        name = item.get("name")
+        names.append(name)
+
+        image = item.get("image")
+        if isinstance(image, str) and "/" in image:
+            prefix, rest = image.rsplit("/", 1)
+            image_prefix.append(prefix_ids.setdefault(prefix + "/", len(prefix_ids)))
+            match = _GENERATED_IMAGE_RE.match(rest[len(name) + 1 :]) if name and rest.startswith(f"{name}_") else None
+            image_variant.append(match["variant"] if match else rest)
+            image_sha.append(match["sha"] if match else None)
+        else:
+            image_prefix.append(None)
+            image_variant.append(None)
+            image_sha.append(None)
+
+        stored = {"name": name is not None, "image": image_prefix[-1] is not None}
+        stored["def"] = item.get("def") == implied_def
+        stored["paint"] = implied_paint is not None and item.get("paint") == implied_paint
+        rest_fields = {key: value for key, value in item.items() if not stored.get(key)}
+        if "def" not in item:
+            rest_fields["def"] = None
+        if implied_paint is not None and "paint" not in item:
+            rest_fields["paint"] = None
+        if rest_fields:
+            extra[item_id] = rest_fields
+
+    return {
+        "version": COMPACT_VERSION,
+        "prefixes": list(prefix_ids),
+        "ids": list(items),
+        "names": names,
+        "image_prefix": image_prefix,
+        "image_variant": image_variant,
+        "image_sha": image_sha,
+        "extra": extra,
+    }
+
+
+def expand_items(compact: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Restore items.json data from the compact layout produced by compact_items."""
+    if compact.get("version") != COMPACT_VERSION:
+        raise DataValidationError(
+            f"Unsupported compact items version: {compact.get('version')}", details={"expected": COMPACT_VERSION}
+        )
+
+    prefixes: list[str] = compact["prefixes"]
+    extra: dict[str, dict[str, Any]] = compact["extra"]
+    items: dict[str, dict[str, Any]] = {}
+
+    columns = ("ids", "names", "image_prefix", "image_variant", "image_sha")
+    lengths = {column: len(compact[column]) for column in columns}
+    if len(set(lengths.values())) > 1:
+        raise DataValidationError("Compact items columns differ in length", details=lengths)
+
+    for item_id, name, prefix_id, variant, sha in zip(*(compact[column] for column in columns), strict=True):
+        implied_def, implied_paint = _implied_indexes(item_id)
+        item: dict[str, Any] = {"def": implied_def}
+        if name is not None:
+            item["name"] = name
+        if implied_paint is not None:
+            item["paint"] = implied_paint
+        if prefix_id is not None:
+            if sha is not None:
+                item["image"] = f"{prefixes[prefix_id]}{name}_{variant}_large.{sha}.png"
+            else:
+                item["image"] = prefixes[prefix_id] + variant
+
+        if item_id in extra:
+            item.update(extra[item_id])
+            if item["def"] is None:
+                del item["def"]
+            if "paint" in item and item["paint"] is None:
+                del item["paint"]
+        items[item_id] = item
+
+    return items
+
+
+def load_compact_items(path: str | Path) -> dict[str, dict[str, Any]]:
+    """Read items.compact.json and return it expanded to the items.json structure."""
+    return expand_items(JsonSerializer().load_file(Path(path)))
@@ -0,0 +1,60 @@
+"""Precompression of output files into .gz, .br and .zst siblings."""
+
+import gzip
+from collections.abc import Callable
+
+from ..exceptions import ConfigurationError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli  # type: ignore[no-redef]
+    except ImportError:
+        brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+
+def _gzip(content: bytes) -> bytes:
+    # fixed mtime keeps the output reproducible
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def _brotli(content: bytes) -> bytes:
+    return brotli.compress(content, quality=11)
+
+
+def _zstd(content: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=19).compress(content)
+
+
+# file suffix -> (compress function, whether its library is installed)
+COMPRESSORS: dict[str, tuple[Callable[[bytes], bytes], bool]] = {
+    "gz": (_gzip, True),
+    "br": (_brotli, brotli is not None),
+    "zst": (_zstd, zstandard is not None),
+}
+
+
+def available_formats() -> list[str]:
+    """Compression formats whose library is installed."""
+    return [suffix for suffix, (_, installed) in COMPRESSORS.items() if installed]
+
+
+def validate_formats(formats: tuple[str, ...] | list[str]) -> None:
+    """Ensure every requested format is known and its library installed."""
+    for suffix in formats:
+        if suffix not in COMPRESSORS:
+            raise ConfigurationError(f"Unknown compression format: {suffix}", details={"formats": list(COMPRESSORS)})
+        if not COMPRESSORS[suffix][1]:
+            package = "brotli" if suffix == "br" else "zstandard"
+            raise ConfigurationError(f"Compression format {suffix} requires the {package} package")
+
+
+def compress(content: bytes, suffix: str) -> bytes:
+    """Compress content with the format of the given file suffix."""
+    return COMPRESSORS[suffix][0](content)
@@ -11,6 +11,7 @@ from ..config import DataUrls
 from ..exceptions import DataFetchError
 from ..models.types import GameData
 from .auto_downloader import AutoDownloader
+from .instrumentation import span
 
 
 class DataFetcher:
@@ -38,7 +39,8 @@ class DataFetcher:
         async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
             tasks = [self._fetch_url(session, url) for url in self.urls.get_all_urls()]
 
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
+            with span("download"):
+                responses = await asyncio.gather(*tasks, return_exceptions=True)
 
             # Check for exceptions
             for i, response in enumerate(responses):
@@ -54,7 +56,8 @@ class DataFetcher:
             if self.save_raw_files:
                 await self._save_raw_files(items_game_raw, csgo_english_raw, csgo_schinese_raw, items_cdn_raw)
 
-            return self._parse_responses(items_game_raw, csgo_english_raw, csgo_schinese_raw, items_cdn_raw)
+            with span("parse"):
+                return self._parse_responses(items_game_raw, csgo_english_raw, csgo_schinese_raw, items_cdn_raw)
 
     async def _fetch_local_data(self) -> GameData:
         """Fetch data from local files."""
@@ -69,12 +72,14 @@ class DataFetcher:
 
         # Read local files
         try:
-            items_game_raw = file_paths["items_game"].read_text(encoding="utf-8")
-            csgo_english_raw = file_paths["csgo_english"].read_text(encoding="utf-8")
-            csgo_schinese_raw = file_paths["csgo_schinese"].read_text(encoding="utf-8")
-            items_cdn_raw = file_paths["items_cdn"].read_text(encoding="utf-8")
+            with span("read"):
+                items_game_raw = file_paths["items_game"].read_text(encoding="utf-8")
+                csgo_english_raw = file_paths["csgo_english"].read_text(encoding="utf-8")
+                csgo_schinese_raw = file_paths["csgo_schinese"].read_text(encoding="utf-8")
+                items_cdn_raw = file_paths["items_cdn"].read_text(encoding="utf-8")
 
-            return self._parse_responses(items_game_raw, csgo_english_raw, csgo_schinese_raw, items_cdn_raw)
+            with span("parse"):
+                return self._parse_responses(items_game_raw, csgo_english_raw, csgo_schinese_raw, items_cdn_raw)
 
         except FileNotFoundError as e:
             raise DataFetchError(f"Local file not found: {e}") from e
@@ -93,12 +98,19 @@ class DataFetcher:
         """Parse raw response data into structured format."""
         try:
             # Parse VDF data
-            items_game = vdf.loads(items_game_raw)["items_game"]
-            csgo_english: CIMultiDict[str] = CIMultiDict(vdf.loads(csgo_english_raw)["lang"]["Tokens"])
-            csgo_schinese: CIMultiDict[str] = CIMultiDict(vdf.loads(csgo_schinese_raw)["lang"]["Tokens"])
+            with span("items_game"):
+                items_game = vdf.loads(items_game_raw)["items_game"]
+            with span("csgo_english") as stage:
+                csgo_english: CIMultiDict[str] = CIMultiDict(vdf.loads(csgo_english_raw)["lang"]["Tokens"])
+                stage.set_records(len(csgo_english))
+            with span("csgo_schinese") as stage:
+                csgo_schinese: CIMultiDict[str] = CIMultiDict(vdf.loads(csgo_schinese_raw)["lang"]["Tokens"])
+                stage.set_records(len(csgo_schinese))
 
             # Parse CDN data
-            items_cdn = self._parse_cdn_data(items_cdn_raw)
+            with span("items_cdn") as stage:
+                items_cdn = self._parse_cdn_data(items_cdn_raw)
+                stage.set_records(len(items_cdn))
 
             return GameData(
                 items_game=items_game, csgo_english=csgo_english, csgo_schinese=csgo_schinese, items_cdn=items_cdn
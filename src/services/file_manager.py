@@ -1,18 +1,44 @@
 """File management service for JSON and SQL files."""
 
-import json
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from ..config import Settings
 from ..exceptions import ConfigurationError
+from .compressor import COMPRESSORS, compress, validate_formats
+from .serializer import JsonSerializer
+
+logger = logging.getLogger(__name__)
 
 
 class FileManager:
-    """Service for managing file I/O operations."""
+    """Service for managing file I/O operations.
+
+    Outputs are only written when their content changed, through a temporary file that atomically
+    replaces the target. Every output of a run is recorded with its SHA-256 and size in the manifest.
+    Precompressed siblings are produced in a thread pool while the remaining outputs are written.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    DEFAULT_FILE_MODE = 0o644
 
     def __init__(self, settings: Settings):
         self.settings = settings
+        self.serializer = JsonSerializer.from_settings(settings)
+        self.compact_serializer = JsonSerializer(
+            indent=None, sort_keys=settings.sort_keys, ensure_ascii=settings.ensure_ascii, backend=settings.json_backend
+        )
+        # manifest key -> {"sha256": ..., "size": ...} of outputs saved during this run
+        self.manifest: dict[str, dict[str, Any]] = {}
+
+        validate_formats(settings.compress_formats)
+        self._compression_executor: ThreadPoolExecutor | None = None
+        self._compression_jobs: list[Future[None]] = []
 
     def load_required_schemas(self) -> dict[str, Any]:
         """Load required schema files from disk."""
@@ -26,46 +52,191 @@ class FileManager:
                 )
 
             try:
-                with file_path.open("r", encoding="utf-8") as f:
-                    key = filename.replace(".json", "").replace("_", "")
-                    schemas[key] = json.load(f)
-            except (OSError, json.JSONDecodeError) as e:
+                key = filename.replace(".json", "").replace("_", "")
+                schemas[key] = self.serializer.load_file(file_path)
+            except (OSError, ValueError) as e:
                 raise ConfigurationError(
                     f"Failed to load schema file {filename}: {e}", details={"path": str(file_path)}
                 ) from e
 
         return schemas
 
-    def save_json_files(self, *files: tuple[str | Path, dict | list]) -> None:
-        """Save multiple JSON files to the resource directory."""
+    def save_json_files(self, *files: tuple[str | Path, dict | list], compact: bool = False) -> list[Path]:
+        """Save multiple JSON files to the resource directory.
+
+        Args:
+            files: (filename, data) pairs
+            compact: Write without indentation and whitespace instead of the configured indent
+
+        Returns:
+            Paths of the files whose content changed and were rewritten
+        """
         self.settings.resource_dir.mkdir(parents=True, exist_ok=True)
 
+        serializer = self.compact_serializer if compact else self.serializer
+        written = []
         for filename, data in files:
             file_path = self.settings.resource_dir / filename
             try:
-                with file_path.open("w", encoding="utf-8") as f:
-                    json.dump(
-                        data,
-                        f,
-                        sort_keys=self.settings.sort_keys,
-                        indent=self.settings.json_indent,
-                        ensure_ascii=self.settings.ensure_ascii,
-                    )
-            except (OSError, TypeError) as e:
+                if self._write_if_changed(file_path, serializer.dumps(data)):
+                    written.append(file_path)
+            except (OSError, TypeError, ValueError) as e:
                 raise ConfigurationError(
                     f"Failed to save JSON file {filename}: {e}", details={"path": str(file_path)}
                 ) from e
 
-    def save_text_files(self, *files: tuple[str | Path, str]) -> None:
-        """Save multiple text files to the SQL directory."""
+        self._log_written("JSON", len(files), written)
+        return written
+
+    def save_text_files(self, *files: tuple[str | Path, str]) -> list[Path]:
+        """Save multiple text files to the SQL directory.
+
+        Returns:
+            Paths of the files whose content changed and were rewritten
+        """
         self.settings.sql_dir.mkdir(parents=True, exist_ok=True)
 
+        written = []
         for filename, content in files:
             file_path = self.settings.sql_dir / filename
             try:
-                with file_path.open("w", encoding="utf-8") as f:
-                    f.write(content)
+                if self._write_if_changed(file_path, content.encode("utf-8")):
+                    written.append(file_path)
             except OSError as e:
                 raise ConfigurationError(
                     f"Failed to save text file {filename}: {e}", details={"path": str(file_path)}
                 ) from e
+
+        self._log_written("text", len(files), written)
+        return written
+
+    def save_binary_files(self, *files: tuple[str | Path, bytes]) -> list[Path]:
+        """Save multiple binary files under the resource directory, creating subdirectories as needed.
+
+        Returns:
+            Paths of the files whose content changed and were rewritten
+        """
+        written = []
+        for filename, content in files:
+            file_path = self.settings.resource_dir / filename
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                if self._write_if_changed(file_path, content):
+                    written.append(file_path)
+            except OSError as e:
+                raise ConfigurationError(
+                    f"Failed to save binary file {filename}: {e}", details={"path": str(file_path)}
+                ) from e
+
+        self._log_written("binary", len(files), written)
+        return written
+
+    def save_manifest(self) -> bool:
+        """Write the manifest of every output saved so far to the resource directory.
+
+        Waits for pending compression first, so the compressed siblings are listed as well.
+
+        Returns:
+            True if the manifest changed
+        """
+        self.wait_for_compression()
+        file_path = self.settings.resource_dir / self.MANIFEST_FILE
+        try:
+            return self._write_if_changed(file_path, self.serializer.dumps({"files": self.manifest}), record=False)
+        except OSError as e:
+            raise ConfigurationError(f"Failed to save manifest: {e}", details={"path": str(file_path)}) from e
+
+    def wait_for_compression(self) -> None:
+        """Block until every scheduled compression has finished and shut the pool down."""
+        jobs, self._compression_jobs = self._compression_jobs, []
+        try:
+            for job in jobs:
+                try:
+                    job.result()
+                except OSError as e:
+                    raise ConfigurationError(f"Failed to save compressed file: {e}") from e
+        finally:
+            if self._compression_executor is not None:
+                self._compression_executor.shutdown(wait=True)
+                self._compression_executor = None
+
+    def manifest_key(self, file_path: Path) -> str:
+        """Manifest key of an output: its POSIX path relative to the parent of the resource directory."""
+        return Path(os.path.relpath(file_path, self.settings.resource_dir.parent)).as_posix()
+
+    def _write_if_changed(self, file_path: Path, content: bytes, record: bool = True) -> bool:
+        """Atomically replace a file with new content unless it already holds exactly that content."""
+        if record:
+            self._record(file_path, content)
+
+        changed = True
+        mode = self.DEFAULT_FILE_MODE
+        try:
+            stat = file_path.stat()
+            changed = stat.st_size != len(content) or file_path.read_bytes() != content
+            mode = stat.st_mode & 0o777
+        except FileNotFoundError:
+            pass
+
+        if changed:
+            self._replace_file(file_path, content, mode)
+
+        if record:
+            self._schedule_compression(file_path, content, changed)
+
+        return changed
+
+    def _schedule_compression(self, file_path: Path, content: bytes, changed: bool) -> None:
+        """Queue compressed siblings of an output, reusing ones that are newer than an unchanged output.
+
+        Siblings of formats that are no longer produced for the output, because compression is off, the
+        output is below compress_min_size or the format was dropped, are deleted so they cannot go stale.
+        """
+        formats = self.settings.compress_formats if len(content) >= self.settings.compress_min_size else ()
+        for suffix in COMPRESSORS.keys() - set(formats):
+            file_path.with_name(f"{file_path.name}.{suffix}").unlink(missing_ok=True)
+        if not formats:
+            return
+
+        if self._compression_executor is None:
+            workers = min(len(self.settings.compress_formats) * 2, os.cpu_count() or 1)
+            self._compression_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="compress")
+
+        source_mtime = file_path.stat().st_mtime_ns
+        for suffix in self.settings.compress_formats:
+            sibling = file_path.with_name(f"{file_path.name}.{suffix}")
+            stale = changed or not sibling.exists() or sibling.stat().st_mtime_ns < source_mtime
+            self._compression_jobs.append(
+                self._compression_executor.submit(self._write_compressed, sibling, content, suffix, stale)
+            )
+
+    def _write_compressed(self, sibling: Path, content: bytes, suffix: str, stale: bool) -> None:
+        if stale:
+            compressed = compress(content, suffix)
+            self._replace_file(sibling, compressed, self.DEFAULT_FILE_MODE)
+        else:
+            compressed = sibling.read_bytes()
+        self._record(sibling, compressed)
+
+    def _record(self, file_path: Path, content: bytes) -> None:
+        self.manifest[self.manifest_key(file_path)] = {
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "size": len(content),
+        }
+
+    @staticmethod
+    def _replace_file(file_path: Path, content: bytes, mode: int) -> None:
+        # mkstemp creates private files, so the final mode is set explicitly
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.chmod(tmp_name, mode)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _log_written(kind: str, total: int, written: list[Path]) -> None:
+        logger.info(f"Saved {len(written)} changed {kind} files, {total - len(written)} unchanged")
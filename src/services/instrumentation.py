@@ -0,0 +1,230 @@
+"""Nested timing spans with per-stage memory peaks and record counts for the collection pipeline.
+
+Stages are wrapped in ``span("name")`` blocks (or decorated with ``instrumented("name")``) that nest
+by context: a span opened inside another one becomes its child, also across ``await`` points and
+``asyncio.to_thread``. Nothing is measured unless an Instrumentation is active; without one ``span``
+returns a shared no-op object after a single context variable lookup.
+
+Example:
+    instrumentation = Instrumentation()
+    with instrumentation.activate():
+        with span("collect") as stage:
+            items = collect()
+            stage.set_records(len(items))
+    instrumentation.save_report("run_report.json")
+    print(instrumentation.format_summary())
+"""
+
+import functools
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ..exceptions import ConfigurationError
+from .serializer import JsonSerializer
+
+REPORT_FILE = "run_report.json"
+REPORT_VERSION = 1
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(eq=False, slots=True)
+class Span:
+    """One timed stage; ``peak_bytes`` is the traced memory peak above the stage's starting point."""
+
+    name: str
+    path: str
+    seconds: float = 0.0
+    records: int | None = None
+    peak_bytes: int | None = None
+    net_bytes: int | None = None
+    children: list["Span"] = field(default_factory=list)
+    _start_memory: int = 0
+    _peak_seen: int = 0
+
+    def set_records(self, count: int) -> None:
+        """Record how many records the stage produced."""
+        self.records = count
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, "Span"]]:
+        """This span and its descendants, depth first, with their nesting depth."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "seconds": self.seconds,
+            "records": self.records,
+            "peak_bytes": self.peak_bytes,
+            "net_bytes": self.net_bytes,
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded by ``span`` while no Instrumentation is active."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def set_records(self, count: int) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_active: ContextVar["Instrumentation | None"] = ContextVar("instrumentation", default=None)
+_current: ContextVar[Span | None] = ContextVar("instrumentation_span", default=None)
+
+
+def span(name: str) -> Any:
+    """Time a block as a child of the current span; a no-op unless an Instrumentation is active."""
+    instrumentation = _active.get()
+    if instrumentation is None:
+        return _NOOP_SPAN
+    return instrumentation.span(name)
+
+
+def instrumented(name: str, count: Callable[[Any], int] | None = len) -> Callable[[F], F]:
+    """
+    Decorate a function to run in a span.
+
+    Args:
+        name: Span name
+        count: Record count of the function's result, None to record none
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active.get() is None:
+                return func(*args, **kwargs)
+            with span(name) as stage:
+                result = func(*args, **kwargs)
+                if count is not None:
+                    stage.set_records(count(result))
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class Instrumentation:
+    """
+    Collector of the span tree of one run.
+
+    With ``track_memory`` tracemalloc runs while the instrumentation is active (unless it was
+    already tracing) and every span records its peak and net traced memory. Spans of concurrently
+    running tasks share the process-wide peak, so their memory figures overlap.
+    """
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.root = Span("run", "run")
+        self.started_at: datetime | None = None
+        # Callbacks invoked with every span when it starts and when it ends
+        self.enter_hooks: list[Callable[[Span], None]] = []
+        self.exit_hooks: list[Callable[[Span], None]] = []
+
+    @contextmanager
+    def activate(self) -> Iterator[Span]:
+        """Make this instrumentation the active one and time the whole block as the root span."""
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        self.started_at = datetime.now(timezone.utc)
+        instrumentation_token = _active.set(self)
+        try:
+            with self._measure(self.root, None):
+                yield self.root
+        finally:
+            _active.reset(instrumentation_token)
+            if started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        parent = _current.get() or self.root
+        stage = Span(name, f"{parent.path}/{name}")
+        parent.children.append(stage)
+        with self._measure(stage, parent):
+            yield stage
+
+    @contextmanager
+    def _measure(self, stage: Span, parent: Span | None) -> Iterator[None]:
+        # Hooks run outside the memory measurement, so what they allocate (e.g. tracemalloc snapshots)
+        # is in neither this span's peak nor its parent's
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing and parent is not None:
+            # reset_peak() below would lose the parent's peak so far
+            parent._peak_seen = max(parent._peak_seen, tracemalloc.get_traced_memory()[1])
+
+        for hook in self.enter_hooks:
+            hook(stage)
+        if tracing:
+            tracemalloc.reset_peak()
+            stage._start_memory = stage._peak_seen = tracemalloc.get_traced_memory()[0]
+        token = _current.set(stage)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage.seconds = time.perf_counter() - start
+            _current.reset(token)
+            if tracing:
+                current_memory, peak = tracemalloc.get_traced_memory()
+                stage._peak_seen = max(stage._peak_seen, peak)
+                stage.peak_bytes = stage._peak_seen - stage._start_memory
+                stage.net_bytes = current_memory - stage._start_memory
+                if parent is not None:
+                    parent._peak_seen = max(parent._peak_seen, stage._peak_seen)
+
+            for hook in self.exit_hooks:
+                hook(stage)
+            if tracing and self.exit_hooks:
+                tracemalloc.reset_peak()
+
+    def report(self) -> dict[str, Any]:
+        """The run_report.json layout: run metadata and every span flattened in tree order."""
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "total_seconds": self.root.seconds,
+            "memory_tracking": self.track_memory,
+            "stages": [stage.to_dict() for _, stage in self.root.walk()],
+        }
+
+    def save_report(self, path: str | Path = REPORT_FILE, serializer: JsonSerializer | None = None) -> Path:
+        """Write the report as JSON."""
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            (serializer or JsonSerializer(sort_keys=False)).dump_file(path, self.report())
+        except OSError as e:
+            raise ConfigurationError(f"Failed to save run report: {e}", details={"path": str(path)}) from e
+        return path
+
+    def format_summary(self) -> str:
+        """Human readable table of every span: time, share of the run, memory peak and records."""
+        total = self.root.seconds or 1.0
+        lines = [f"{'Stage':<44} {'Time (s)':>10} {'Share':>7} {'Peak MB':>9} {'Records':>9}"]
+        for depth, stage in self.root.walk():
+            peak = f"{stage.peak_bytes / 2**20:.1f}" if stage.peak_bytes is not None else "-"
+            records = f"{stage.records}" if stage.records is not None else "-"
+            label = f"{'  ' * depth}{stage.name}"
+            lines.append(f"{label:<44} {stage.seconds:>10.3f} {stage.seconds / total:>7.1%} {peak:>9} {records:>9}")
+        return "\n".join(lines)
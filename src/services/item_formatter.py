@@ -4,23 +4,86 @@ CS2 Items Formatter Service
 """
 
 import json
-import re
-from dataclasses import asdict, dataclass
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, TextIO
 
+from ..models.types import ProcessedData
+from .serializer import JsonSerializer
+from .slug import SlugRegistry, slugify
 
-def slugify(text: str) -> str:
-    if not text:
-        return ""
+# 格式化所需的Schema: 属性名 -> 文件名
+SCHEMA_FILES: dict[str, str] = {
+    "definitions": "definitions.json",
+    "paints": "paints.json",
+    "sticker_kits": "sticker_kits.json",
+    "music_kits": "music_kits.json",
+    "musics": "musics.json",
+    "containers": "containers.json",
+    "items": "items.json",
+    "types": "types.json",
+}
 
-    text = text.lower().replace(" ", "-").replace("_", "-")
-    clean_text = re.sub(r"[^a-zA-Z0-9-]", "", text)
-    clean_text = re.sub(r"-+", "-", clean_text).strip("-")
+# 格式化类别（按输出顺序）: 属性名 -> 日志名称
+FORMAT_CATEGORIES: dict[str, str] = {
+    "paints": "paint",
+    "sticker_kits": "sticker",
+    "music_kits": "music kit",
+    "definitions": "definition",
+    "containers": "container",
+}
 
-    return clean_text
 
+def write_json_array(items: Iterable[dict], f: TextIO) -> int:
+    """增量写入JSON数组，输出与 json.dump(items, f, ensure_ascii=False, indent=2) 完全一致"""
+    count = 0
+    for item in items:
+        f.write(",\n  " if count else "[\n  ")
+        # JSON字符串中的换行已被转义，这里的换行只来自缩进
+        f.write(json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+        count += 1
+    f.write("\n]" if count else "[]")
+    return count
 
-@dataclass
+
+def write_ndjson(items: Iterable[dict], f: TextIO) -> int:
+    """写入NDJSON，每行一个物品"""
+    count = 0
+    for item in items:
+        f.write(json.dumps(item, ensure_ascii=False))
+        f.write("\n")
+        count += 1
+    return count
+
+
+OUTPUT_WRITERS: dict[str, Callable[[Iterable[dict], TextIO], int]] = {
+    "json": write_json_array,
+    "ndjson": write_ndjson,
+}
+
+
+class FrozenText(dict):
+    """只读的本地化文本字典，可被多个物品安全共享"""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("FrozenText is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (FrozenText, (dict(self),))
+
+
+# 所有物品共享的空描述，避免每个物品重复创建
+EMPTY_TEXT = FrozenText({"zh-CN": "", "en-US": ""})
+
+
+@dataclass(slots=True)
 class CS2Item:
     slug_name: str
     name: dict[str, str]
@@ -35,10 +98,64 @@ class CS2Item:
     model: str | None
     agent_name: dict[str, str]
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        转换为可JSON序列化的字典，字段顺序与 dataclasses.asdict 相同
+
+        嵌套的名称字典直接引用而不深拷贝（默认值为只读的 EMPTY_TEXT）
+        """
+        return {
+            "slug_name": self.slug_name,
+            "name": self.name,
+            "description": self.description,
+            "cover_image": self.cover_image,
+            "item_type": self.item_type,
+            "weapon_defindex": self.weapon_defindex,
+            "weapon_name": self.weapon_name,
+            "paint_id": self.paint_id,
+            "item_id": self.item_id,
+            "team": self.team,
+            "model": self.model,
+            "agent_name": self.agent_name,
+        }
+
+    def to_tuple(self) -> tuple[Any, ...]:
+        """按字段顺序转换为元组（嵌套字典同样不拷贝）"""
+        return (
+            self.slug_name,
+            self.name,
+            self.description,
+            self.cover_image,
+            self.item_type,
+            self.weapon_defindex,
+            self.weapon_name,
+            self.paint_id,
+            self.item_id,
+            self.team,
+            self.model,
+            self.agent_name,
+        )
+
 
 class ItemFormatterService:
-    def __init__(self, schemas_dir: str | Path = "schemas"):
+    def __init__(
+        self,
+        schemas_dir: str | Path = "schemas",
+        schemas: Mapping[str, dict[str, Any]] | None = None,
+        unique_slugs: bool = True,
+        workers: int = 1,
+    ):
+        """
+        Args:
+            schemas_dir: Schema目录，未传入schemas时从此目录加载，也是默认输出目录
+            schemas: 已在内存中的Schema数据（键见SCHEMA_FILES），跳过磁盘读取
+            unique_slugs: 为重复的slug_name依次追加 -2、-3 等后缀
+            workers: 格式化使用的进程数，大于1时在进程池中按类别/涂装分块并行
+        """
         self.schemas_dir = Path(schemas_dir)
+        self.serializer = JsonSerializer()
+        self.unique_slugs = unique_slugs
+        self.workers = max(1, workers)
         self.type_mapping = {
             "Agent": "agent",
             "C4": "c4",
@@ -70,28 +187,60 @@ class ItemFormatterService:
         }
 
         # 加载所有Schema数据
-        self.definitions = self._load_json("definitions.json")
-        self.paints = self._load_json("paints.json")
-        self.sticker_kits = self._load_json("sticker_kits.json")
-        self.music_kits = self._load_json("music_kits.json")
-        self.musics = self._load_json("musics.json")
-        self.containers = self._load_json("containers.json")
-        self.items = self._load_json("items.json")
-        self.types = self._load_json("types.json")
+        if schemas is None:
+            schemas = self._load_all_json()
+        self.definitions = schemas["definitions"]
+        self.paints = schemas["paints"]
+        self.sticker_kits = schemas["sticker_kits"]
+        self.music_kits = schemas["music_kits"]
+        self.musics = schemas["musics"]
+        self.containers = schemas["containers"]
+        self.items = schemas["items"]
+        self.types = schemas["types"]
+
+        # paintindex -> [defindex]，按definitions顺序排列
+        self.paint_definitions = self._build_paint_index()
+
+    @classmethod
+    def from_processed_data(
+        cls, data: ProcessedData, schemas_dir: str | Path = "schemas", unique_slugs: bool = True, workers: int = 1
+    ) -> "ItemFormatterService":
+        """直接使用ResourceCollector在内存中的输出，不再读回JSON文件"""
+        schemas = {name: getattr(data, name) for name in SCHEMA_FILES}
+        # 与磁盘上sort_keys=True的文件保持相同的遍历顺序，保证输出一致
+        sorted_schemas = {name: dict(sorted(schema.items())) for name, schema in schemas.items()}
+        return cls(schemas_dir, schemas=sorted_schemas, unique_slugs=unique_slugs, workers=workers)
+
+    def _load_all_json(self) -> dict[str, dict]:
+        """并发加载所有Schema文件"""
+        with ThreadPoolExecutor(max_workers=len(SCHEMA_FILES)) as executor:
+            loaded = executor.map(self._load_json, SCHEMA_FILES.values())
+            return dict(zip(SCHEMA_FILES, loaded, strict=True))
 
     def _load_json(self, filename: str) -> dict:
         """加载JSON文件"""
         filepath = self.schemas_dir / filename
         try:
-            with open(filepath, encoding="utf-8") as f:
-                return json.load(f)
+            return self.serializer.load_file(filepath)
         except FileNotFoundError:
             print(f"Warning: {filename} not found in {self.schemas_dir}")
             return {}
 
-    def _get_default_description(self) -> dict[str, str]:
-        """获取默认描述"""
-        return {"zh-CN": "", "en-US": ""}
+    def _build_paint_index(self) -> dict[str, list[str]]:
+        """从items.json构建 paintindex -> [defindex] 索引"""
+        def_order = {def_id: position for position, def_id in enumerate(self.definitions)}
+        paint_index: dict[str, list[str]] = {}
+        for item_data in self.items.values():
+            paint_id = item_data.get("paint")
+            def_id = item_data.get("def")
+            if paint_id is None or def_id not in def_order:
+                continue
+            paint_index.setdefault(paint_id, []).append(def_id)
+
+        for def_ids in paint_index.values():
+            def_ids.sort(key=def_order.__getitem__)
+
+        return paint_index
 
     def _get_item_type(self, type_id: str) -> str:
         """根据type_id获取物品类型"""
@@ -115,10 +264,9 @@ class ItemFormatterService:
         paint_name = paint_data.get("name", f"Paint_{paint_id}")
         paint_name_zh = paint_data.get("name_zh", paint_name)
 
-        # 查找使用此涂装的武器
-        for def_id, def_data in self.definitions.items():
-            if f"[{paint_id}]{def_id}" not in self.items:
-                continue
+        # 只遍历实际存在此涂装的武器
+        for def_id in self.paint_definitions.get(paint_id, ()):
+            def_data = self.definitions[def_id]
             item_type = self._get_item_type(def_data.get("type", "0"))
             item_name = self._get_item_name(paint_id, def_id)
             if item_type == "weapon":
@@ -135,7 +283,7 @@ class ItemFormatterService:
                 item = CS2Item(
                     slug_name=slug_name,
                     name=name,
-                    description=self._get_default_description(),
+                    description=EMPTY_TEXT,
                     cover_image=cover_image,
                     item_type=item_type,
                     weapon_defindex=int(def_id),
@@ -144,7 +292,7 @@ class ItemFormatterService:
                     item_id=None,
                     team=None,
                     model=None,
-                    agent_name=self._get_default_description(),
+                    agent_name=EMPTY_TEXT,
                 )
                 items.append(item)
 
@@ -176,7 +324,7 @@ class ItemFormatterService:
             item_id=int(sticker_id),
             team=None,
             model=None,
-            agent_name=self._get_default_description(),
+            agent_name=EMPTY_TEXT,
         )
 
     def _format_music_kit_item(self, kit_id: str, kit_data: dict) -> CS2Item:
@@ -199,7 +347,7 @@ class ItemFormatterService:
         return CS2Item(
             slug_name=slug_name,
             name=name,
-            description=self._get_default_description(),
+            description=EMPTY_TEXT,
             cover_image=None,
             item_type="music_kit",
             weapon_defindex=None,
@@ -208,7 +356,7 @@ class ItemFormatterService:
             item_id=int(kit_id),
             team=None,
             model=None,
-            agent_name=self._get_default_description(),
+            agent_name=EMPTY_TEXT,
         )
 
     def _format_definition_item(self, def_id: str, def_data: dict) -> CS2Item:
@@ -224,7 +372,7 @@ class ItemFormatterService:
         slug_name = slugify(item_name)
 
         # 如果是Agent类型，设置agent_name
-        agent_name = self._get_default_description()
+        agent_name = EMPTY_TEXT
         if item_type == "agent":
             agent_name = name.copy()
 
@@ -237,7 +385,7 @@ class ItemFormatterService:
         return CS2Item(
             slug_name=slug_name,
             name=name,
-            description=self._get_default_description(),
+            description=EMPTY_TEXT,
             cover_image=cover_image,
             item_type=item_type,
             weapon_defindex=int(def_id) if item_type == "weapon" else None,
@@ -269,7 +417,7 @@ class ItemFormatterService:
         return CS2Item(
             slug_name=slug_name,
             name=name,
-            description=self._get_default_description(),
+            description=EMPTY_TEXT,
             cover_image=None,
             item_type="case",
             weapon_defindex=None,
@@ -278,64 +426,151 @@ class ItemFormatterService:
             item_id=int(container_id),
             team=None,
             model=None,
-            agent_name=self._get_default_description(),
+            agent_name=EMPTY_TEXT,
         )
 
-    def format_all_items(self) -> list[dict]:
-        """格式化所有物品"""
-        all_items = []
-
-        # 格式化涂装物品
-        print("Processing paint items...")
-        for paint_id, paint_data in self.paints.items():
-            paint_items = self._format_paint_item(paint_id, paint_data)
-            all_items.extend([asdict(item) for item in paint_items])
-
-        # 格式化印花物品
-        print("Processing sticker items...")
-        for sticker_id, sticker_data in self.sticker_kits.items():
-            if sticker_id != "0":  # 跳过模板项
-                sticker_item = self._format_sticker_item(sticker_id, sticker_data)
-                all_items.append(asdict(sticker_item))
-
-        # 格式化音乐盒物品
-        print("Processing music kit items...")
-        for kit_id, kit_data in self.music_kits.items():
-            music_kit_item = self._format_music_kit_item(kit_id, kit_data)
-            all_items.append(asdict(music_kit_item))
-
-        # 格式化定义物品（非武器的其他物品）
-        print("Processing definition items...")
-        for def_id, def_data in self.definitions.items():
-            item_type = self._get_item_type(def_data.get("type", "0"))
+    def iter_items(self) -> Iterator[CS2Item]:
+        """逐个生成格式化后的物品，不在内存中保留完整列表"""
+        if not self.unique_slugs:
+            yield from self._iter_formatted_items()
+            return
+
+        # 按生成顺序去重，结果是确定的
+        slugs = SlugRegistry()
+        for item in self._iter_formatted_items():
+            item.slug_name = slugs.claim(item.slug_name)
+            yield item
+
+        if slugs.collisions:
+            print(f"Disambiguated {slugs.collisions} duplicate slugs")
+
+    def _iter_formatted_items(self) -> Iterator[CS2Item]:
+        """按类别依次生成物品（slug可能重复）"""
+        if self.workers > 1:
+            yield from self._iter_formatted_items_parallel()
+            return
+
+        for category, label in FORMAT_CATEGORIES.items():
+            print(f"Processing {label} items...")
+            yield from self._format_category(category, self._category_keys(category))
+
+    def _iter_formatted_items_parallel(self) -> Iterator[CS2Item]:
+        """在进程池中按块格式化，按提交顺序合并，输出与顺序执行一致"""
+        tasks = []
+        for category in FORMAT_CATEGORIES:
+            keys = self._category_keys(category)
+            # 涂装物品占大头，拆成多块以便均衡负载
+            chunk_count = self.workers * 4 if category == "paints" else 1
+            chunk_size = max(1, -(-len(keys) // chunk_count))
+            tasks.extend((category, keys[start : start + chunk_size]) for start in range(0, len(keys), chunk_size))
+
+        print(f"Processing {len(tasks)} chunks with {self.workers} workers...")
+        schemas = {name: getattr(self, name) for name in SCHEMA_FILES}
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_format_worker, initargs=(self.schemas_dir, schemas)
+        ) as executor:
+            for chunk in executor.map(_format_chunk, tasks):
+                yield from chunk
+
+    def _category_keys(self, category: str) -> list[str]:
+        """获取某一类别需要格式化的键"""
+        if category == "sticker_kits":
+            return [sticker_id for sticker_id in self.sticker_kits if sticker_id != "0"]  # 跳过模板项
+        if category == "definitions":
             # 跳过武器类型，因为已经在涂装中处理了
-            if item_type != "weapon":
-                def_item = self._format_definition_item(def_id, def_data)
-                all_items.append(asdict(def_item))
+            return [
+                def_id
+                for def_id, def_data in self.definitions.items()
+                if self._get_item_type(def_data.get("type", "0")) != "weapon"
+            ]
+        return list(getattr(self, category))
+
+    def _format_category(self, category: str, keys: Iterable[str]) -> Iterator[CS2Item]:
+        """格式化某一类别中指定键的物品"""
+        if category == "paints":
+            for paint_id in keys:
+                yield from self._format_paint_item(paint_id, self.paints[paint_id])
+        elif category == "sticker_kits":
+            for sticker_id in keys:
+                yield self._format_sticker_item(sticker_id, self.sticker_kits[sticker_id])
+        elif category == "music_kits":
+            for kit_id in keys:
+                yield self._format_music_kit_item(kit_id, self.music_kits[kit_id])
+        elif category == "definitions":
+            for def_id in keys:
+                yield self._format_definition_item(def_id, self.definitions[def_id])
+        elif category == "containers":
+            for container_id in keys:
+                yield self._format_container_item(container_id, self.containers[container_id])
+        else:
+            raise ValueError(f"Unknown item category: {category}")
 
-        # 格式化容器物品
-        print("Processing container items...")
-        for container_id, container_data in self.containers.items():
-            container_item = self._format_container_item(container_id, container_data)
-            all_items.append(asdict(container_item))
+    def format_all_items(self) -> list[dict]:
+        """
+        格式化所有物品
+
+        返回的字典互相独立、可以修改：与 to_dict 不同，名称字典会被复制为普通 dict，
+        不与其他物品共享只读的 EMPTY_TEXT
+        """
+        all_items = []
+        for item in self.iter_items():
+            record = item.to_dict()
+            for field in ("name", "description", "agent_name"):
+                record[field] = dict(record[field])
+            all_items.append(record)
 
         print(f"Total items processed: {len(all_items)}")
         return all_items
 
-    def save_formatted_items(self, output_file: str | Path | None = None) -> list[dict]:
-        """保存格式化后的物品数据"""
+    def save_formatted_items(
+        self,
+        output_file: str | Path | None = None,
+        output_format: str = "json",
+        items: Iterable[CS2Item] | None = None,
+    ) -> int:
+        """
+        流式保存格式化后的物品数据
+
+        Args:
+            output_file: 输出文件，默认为schemas目录下的formatted_items.json / formatted_items.ndjson
+            output_format: "json"（缩进的JSON数组）或 "ndjson"（每行一个物品）
+            items: 要保存的物品，默认为iter_items()（可传入包装后的迭代器以便同时建立索引）
+
+        Returns:
+            写入的物品数量
+        """
+        if output_format not in OUTPUT_WRITERS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
         if output_file is None:
-            output_file = self.schemas_dir / "formatted_items.json"
+            output_file = self.schemas_dir / f"formatted_items.{output_format}"
         else:
             output_file = Path(output_file)
 
-        items = self.format_all_items()
-
         # 确保输出目录存在
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+            if items is None:
+                items = self.iter_items()
+            count = OUTPUT_WRITERS[output_format]((item.to_dict() for item in items), f)
 
+        print(f"Total items processed: {count}")
         print(f"Formatted items saved to {output_file}")
-        return items
+        return count
+
+
+# 进程池中每个工作进程持有的格式化服务
+_worker_formatter: ItemFormatterService | None = None
+
+
+def _init_format_worker(schemas_dir: Path, schemas: dict[str, dict[str, Any]]) -> None:
+    global _worker_formatter
+    _worker_formatter = ItemFormatterService(schemas_dir, schemas=schemas, unique_slugs=False)
+
+
+def _format_chunk(task: tuple[str, list[str]]) -> list[CS2Item]:
+    if _worker_formatter is None:
+        raise RuntimeError("Format worker is not initialized")
+    category, keys = task
+    return list(_worker_formatter._format_category(category, keys))
@@ -0,0 +1,232 @@
+"""Per-stage cProfile and tracemalloc profiles of the collection pipeline.
+
+A StageProfiler hooks into an Instrumentation and profiles every top-level span (``run/fetch``,
+``run/items``, ``run/sql``, ...) on its own, so the output can be narrowed down to the stage a bug
+report is about. For each stage it writes to the output directory:
+
+* ``NN_<stage>.pstats``: cProfile statistics, readable with ``python -m pstats`` or snakeviz
+* ``NN_<stage>.collapsed``: collapsed stacks in microseconds for flamegraph.pl, speedscope or inferno
+
+plus ``profile.collapsed`` with all stages under one root frame each, and with memory profiling
+``memory.txt``: the top allocation sites by net traced memory growth per stage.
+
+cProfile only sees the thread that runs the stage; work handed to ``asyncio.to_thread`` or to the
+process pool of ``--format-workers`` is not in the profiles. The profiler runs outside the stages'
+memory measurement, so neither its snapshots nor its output are in the instrumentation's peaks.
+
+Example:
+    instrumentation = Instrumentation()
+    profiler = StageProfiler("profiles", memory=True).attach(instrumentation)
+    with instrumentation.activate():
+        ...
+    paths = profiler.close()
+"""
+
+import contextlib
+import cProfile
+import inspect
+import linecache
+import pstats
+import tracemalloc
+from pathlib import Path
+
+from ..exceptions import ConfigurationError
+from .instrumentation import Instrumentation, Span
+
+PROFILE_DIR = "profiles"
+
+# Allocation sites listed per stage in memory.txt
+MEMORY_TOP = 25
+# Call paths below this share of their stage's time are left out of the collapsed stacks
+MIN_STACK_SHARE = 1e-4
+
+# Allocation sites left out of memory.txt: the profiler and the instrumentation spans around the stage, the
+# snapshots themselves and the import machinery. They are dropped from the grouped statistics,
+# Snapshot.filter_traces is too slow on heaps of this size
+_IGNORED_FILES = {
+    __file__,
+    inspect.getfile(Instrumentation),
+    contextlib.__file__,
+    cProfile.__file__,
+    pstats.__file__,
+    tracemalloc.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+}
+
+_Function = tuple[str, int, str]
+
+
+def _frame_label(function: _Function) -> str:
+    filename, lineno, name = function
+    if filename == "~":  # built-ins
+        label = name
+    else:
+        path = Path(filename)
+        try:
+            short = path.relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            short = "/".join(path.parts[-2:])
+        label = f"{name} ({short}:{lineno})"
+    return label.replace(";", ":").replace("\n", " ")
+
+
+def collapsed_stacks(stats: pstats.Stats, min_share: float = MIN_STACK_SHARE) -> dict[str, float]:
+    """
+    Reconstruct call stacks with their self time from a profile's caller/callee graph.
+
+    cProfile only records caller-callee edges, so the time of a function reached over several paths
+    is split between the paths in proportion to the edges, the way flameprof and gprof2dot do.
+    Recursive calls are folded into the outermost frame.
+
+    Returns:
+        Seconds of self time per ``frame;frame;...`` stack, root first
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: dict[_Function, list[tuple[_Function, float]]] = {}
+    for function, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            callees.setdefault(caller, []).append((function, edge_cumulative))
+
+    # Functions first called before profiling started have no callers, or only themselves when recursive
+    roots = [function for function, entry in raw.items() if not entry[4].keys() - {function}]
+    total = sum(raw[root][3] for root in roots)
+    cutoff = total * min_share
+    stacks: dict[str, float] = {}
+
+    def expand(function: _Function, path: list[str], on_stack: set[_Function], seconds: float) -> None:
+        _, _, self_seconds, cumulative, _ = raw[function]
+        if cumulative <= 0:
+            return
+        ratio = seconds / cumulative
+        path = [*path, _frame_label(function)]
+        key = ";".join(path)
+        stacks[key] = stacks.get(key, 0.0) + self_seconds * ratio
+        on_stack.add(function)
+        for callee, edge_cumulative in callees.get(function, ()):
+            if callee not in on_stack and edge_cumulative * ratio >= cutoff:
+                expand(callee, path, on_stack, edge_cumulative * ratio)
+        on_stack.discard(function)
+
+    for root in roots:
+        if raw[root][3] >= cutoff:
+            expand(root, [], set(), raw[root][3])
+    return stacks
+
+
+def _format_collapsed(stacks: dict[str, float], prefix: str = "") -> list[str]:
+    lines = []
+    for stack, seconds in stacks.items():
+        microseconds = round(seconds * 1e6)
+        if microseconds > 0:
+            lines.append(f"{prefix}{stack} {microseconds}")
+    return lines
+
+
+def _format_memory(stage: Span, statistics: list[tracemalloc.StatisticDiff], top: int) -> list[str]:
+    statistics = [statistic for statistic in statistics if statistic.traceback[0].filename not in _IGNORED_FILES]
+    net = sum(statistic.size_diff for statistic in statistics)
+    blocks = sum(statistic.count_diff for statistic in statistics)
+    lines = [f"== {stage.path} ==", f"net {net / 2**20:+.2f} MiB in {blocks:+d} blocks"]
+    for statistic in statistics[:top]:
+        frame = statistic.traceback[0]
+        source = linecache.getline(frame.filename, frame.lineno).strip()
+        lines.append(
+            f"  {statistic.size_diff / 2**10:>+12.1f} KiB {statistic.count_diff:>+9d} blocks  "
+            f"{frame.filename}:{frame.lineno}  {source}"
+        )
+    return lines
+
+
+class StageProfiler:
+    """
+    CPU and/or memory profiles of the top-level spans of an Instrumentation.
+
+    Args:
+        output_dir: Directory for the profile files, created when needed
+        cpu: Profile every stage with cProfile
+        memory: Diff tracemalloc snapshots around every stage (needs tracing, e.g. an
+            Instrumentation with track_memory)
+        top: Allocation sites listed per stage
+    """
+
+    def __init__(
+        self, output_dir: str | Path = PROFILE_DIR, cpu: bool = True, memory: bool = False, top: int = MEMORY_TOP
+    ):
+        self.output_dir = Path(output_dir)
+        self.cpu = cpu
+        self.memory = memory
+        self.top = top
+        self.paths: list[Path] = []
+        self._stage_count = 0
+        self._profiles: dict[int, cProfile.Profile] = {}
+        self._snapshots: dict[int, tracemalloc.Snapshot] = {}
+        self._collapsed: list[str] = []
+        self._memory: list[str] = []
+
+    def attach(self, instrumentation: Instrumentation) -> "StageProfiler":
+        instrumentation.enter_hooks.append(self._enter)
+        instrumentation.exit_hooks.append(self._exit)
+        return self
+
+    @staticmethod
+    def _is_stage(stage: Span) -> bool:
+        return stage.path.count("/") == 1
+
+    def _enter(self, stage: Span) -> None:
+        if not self._is_stage(stage):
+            return
+        if self.memory and tracemalloc.is_tracing():
+            self._snapshots[id(stage)] = tracemalloc.take_snapshot()
+        if self.cpu:
+            profile = cProfile.Profile()
+            self._profiles[id(stage)] = profile
+            profile.enable()
+
+    def _exit(self, stage: Span) -> None:
+        if not self._is_stage(stage):
+            return
+        profile = self._profiles.pop(id(stage), None)
+        if profile is not None:
+            profile.disable()
+        # Snapshot before the profile is converted and saved, so that work is not in the stage's memory
+        before = self._snapshots.pop(id(stage), None)
+        after = tracemalloc.take_snapshot() if before is not None and tracemalloc.is_tracing() else None
+        self._stage_count += 1
+        stem = f"{self._stage_count:02d}_{stage.name}"
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            if profile is not None:
+                stats = pstats.Stats(profile)
+                path = self.output_dir / f"{stem}.pstats"
+                stats.dump_stats(path)
+                self.paths.append(path)
+
+                stacks = collapsed_stacks(stats)
+                path = self.output_dir / f"{stem}.collapsed"
+                path.write_text("".join(line + "\n" for line in _format_collapsed(stacks)), encoding="utf-8")
+                self.paths.append(path)
+                self._collapsed.extend(_format_collapsed(stacks, prefix=f"{stage.name};"))
+        except OSError as e:
+            raise ConfigurationError(f"Failed to save profile: {e}", details={"path": str(self.output_dir)}) from e
+
+        if after is not None:
+            self._memory.extend([*_format_memory(stage, after.compare_to(before, "lineno"), self.top), ""])
+
+    def close(self) -> list[Path]:
+        """Write the run-wide files and return the paths of every file written."""
+        files = []
+        if self._collapsed:
+            files.append(("profile.collapsed", self._collapsed))
+        if self._memory:
+            files.append(("memory.txt", self._memory))
+        try:
+            for filename, lines in files:
+                path = self.output_dir / filename
+                path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+                self.paths.append(path)
+        except OSError as e:
+            raise ConfigurationError(f"Failed to save profile: {e}", details={"path": str(self.output_dir)}) from e
+        return self.paths
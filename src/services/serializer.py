@@ -0,0 +1,137 @@
+"""JSON serialization with optional fast backends (orjson, msgspec) and a stdlib fallback."""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any
+
+from ..config import Settings
+from ..exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+BACKENDS = ("auto", "orjson", "msgspec", "json")
+
+# Encoding errors after which the stdlib encoder gets a chance, e.g. integers beyond 64 bits
+_FAST_ENCODE_ERRORS: tuple[type[Exception], ...] = (TypeError, ValueError, OverflowError)
+if msgspec is not None:
+    _FAST_ENCODE_ERRORS += (msgspec.EncodeError,)
+
+
+def _is_stdlib_only(data: Any) -> bool:
+    """
+    Check for values the fast backends would render differently from the stdlib encoder.
+
+    Those are non-string dictionary keys (sorted and converted differently) and floats that the
+    stdlib prints in exponent form or as NaN/Infinity.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    return True
+                if isinstance(item, (dict, list, tuple, float)):
+                    stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(item for item in value if isinstance(item, (dict, list, tuple, float)))
+        elif isinstance(value, float):
+            if not math.isfinite(value) or "e" in repr(value):
+                return True
+    return False
+
+
+class JsonSerializer:
+    """
+    Serializer producing the same bytes as ``json.dump(..., indent, sort_keys, ensure_ascii)``.
+
+    ``indent=None`` selects the compact form without any whitespace (``separators=(",", ":")``).
+    orjson or msgspec are used when installed and able to reproduce the stdlib output exactly
+    (compact or two-space indent, non-ASCII output), everything else goes through the stdlib ``json`` module.
+    """
+
+    def __init__(
+        self, indent: int | None = 2, sort_keys: bool = True, ensure_ascii: bool = False, backend: str = "auto"
+    ):
+        if backend not in BACKENDS:
+            raise ConfigurationError(f"Unknown JSON backend: {backend}", details={"backends": list(BACKENDS)})
+
+        self.indent = indent
+        self.sort_keys = sort_keys
+        self.ensure_ascii = ensure_ascii
+        self.backend = self._resolve_backend(backend)
+
+        if self.backend == "msgspec":
+            self._msgspec_encoder = msgspec.json.Encoder(order="sorted" if sort_keys else None)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "JsonSerializer":
+        return cls(
+            indent=settings.json_indent,
+            sort_keys=settings.sort_keys,
+            ensure_ascii=settings.ensure_ascii,
+            backend=settings.json_backend,
+        )
+
+    def _resolve_backend(self, backend: str) -> str:
+        compatible = self.indent in (None, 2) and not self.ensure_ascii
+        available = {"orjson": orjson is not None, "msgspec": msgspec is not None, "json": True}
+
+        if backend == "auto":
+            if compatible:
+                for candidate in ("orjson", "msgspec"):
+                    if available[candidate]:
+                        return candidate
+            return "json"
+
+        if not available[backend]:
+            raise ConfigurationError(f"JSON backend {backend} is not installed")
+        if backend != "json" and not compatible:
+            logger.warning(f"JSON backend {backend} cannot reproduce indent={self.indent}, using json")
+            return "json"
+        return backend
+
+    def dumps(self, data: Any) -> bytes:
+        """Serialize data to UTF-8 encoded JSON."""
+        if self.backend != "json" and not _is_stdlib_only(data):
+            try:
+                if self.backend == "orjson":
+                    option = (orjson.OPT_INDENT_2 if self.indent else 0) | (
+                        orjson.OPT_SORT_KEYS if self.sort_keys else 0
+                    )
+                    return orjson.dumps(data, option=option)
+                encoded = self._msgspec_encoder.encode(data)
+                return msgspec.json.format(encoded, indent=2) if self.indent else encoded
+            except _FAST_ENCODE_ERRORS:
+                pass
+
+        separators = (",", ":") if self.indent is None else None
+        return json.dumps(
+            data, sort_keys=self.sort_keys, indent=self.indent, separators=separators, ensure_ascii=self.ensure_ascii
+        ).encode("utf-8")
+
+    def loads(self, raw: bytes | str) -> Any:
+        """Deserialize JSON from bytes or text."""
+        if self.backend == "orjson":
+            return orjson.loads(raw)
+        if self.backend == "msgspec":
+            return msgspec.json.decode(raw)
+        return json.loads(raw)
+
+    def dump_file(self, path: Path, data: Any) -> None:
+        path.write_bytes(self.dumps(data))
+
+    def load_file(self, path: Path) -> Any:
+        return self.loads(path.read_bytes())
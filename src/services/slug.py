@@ -0,0 +1,62 @@
+"""Slug generation and collision handling for formatted items."""
+
+import re
+import string
+from functools import lru_cache
+
+# ASCII characters allowed in a slug are kept, spaces and underscores become dashes, the rest is dropped
+_SLUG_TABLE = str.maketrans(
+    {
+        **{chr(code): None for code in range(128) if chr(code) not in string.ascii_letters + string.digits + "-"},
+        " ": "-",
+        "_": "-",
+    }
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
+@lru_cache(maxsize=32768)
+def slugify(text: str) -> str:
+    """Lowercase the text and keep only ASCII letters, digits and single dashes."""
+    if not text:
+        return ""
+
+    text = text.lower().translate(_SLUG_TABLE)
+    if not text.isascii():
+        text = text.encode("ascii", "ignore").decode("ascii")
+    if "--" in text:
+        text = _DASH_RUN_RE.sub("-", text)
+
+    return text.strip("-")
+
+
+class SlugRegistry:
+    """Hands out unique slugs, appending -2, -3, ... to repeated ones in the order they are claimed."""
+
+    def __init__(self) -> None:
+        # slug -> next numeric suffix to try when the slug is claimed again
+        self._next_suffix: dict[str, int] = {}
+        self.collisions = 0
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self._next_suffix
+
+    def __len__(self) -> int:
+        return len(self._next_suffix)
+
+    def claim(self, slug: str) -> str:
+        """Register a slug and return it, or a suffixed variant if it is already taken."""
+        suffix = self._next_suffix.get(slug)
+        if suffix is None:
+            self._next_suffix[slug] = 2
+            return slug
+
+        candidate = f"{slug}-{suffix}" if slug else str(suffix)
+        while candidate in self._next_suffix:
+            suffix += 1
+            candidate = f"{slug}-{suffix}" if slug else str(suffix)
+
+        self._next_suffix[slug] = suffix + 1
+        self._next_suffix[candidate] = 2
+        self.collisions += 1
+        return candidate
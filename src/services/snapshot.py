@@ -0,0 +1,422 @@
+"""Memory-mappable binary snapshot of the schema tables and a reader that answers lookups in place.
+
+``schema.bin`` holds every table written as JSON (``items``, ``paints``, ``definitions``, ...) in a form
+that can be queried straight from a read-only ``mmap``: nothing is parsed when the file is opened, and
+processes mapping the same file share its pages through the page cache.
+
+Layout (little-endian, sections aligned to 8 bytes)::
+
+    header        magic "CS2SNAP\\0", version, table count, string pool and list pool location
+    tables        one descriptor per table: name, flags, field count, record count and size,
+                  offsets of its field descriptors, records and hash index
+    fields        per table: name, kind (str, int, float, str list) and offset inside the record
+    records       per table: fixed-width rows of key ref, presence bitmask and one 8-byte slot per field
+    index         per table: open-addressing hash table of record numbers + 1 (0 marks an empty slot),
+                  probed linearly from the 64-bit FNV-1a hash of the key
+    lists         string refs referenced by str list fields as (start, count)
+    strings       UTF-8 string pool referenced as (offset, length), shared and deduplicated
+
+Tables whose values are plain strings (``types``) are stored with a single unnamed field and read back
+as scalars. Records come back as dicts with the fields in sorted order, equal to the JSON values.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import ConfigurationError, DataValidationError
+
+SNAPSHOT_FILE = "schema.bin"
+SNAPSHOT_MAGIC = b"CS2SNAP\0"
+SNAPSHOT_VERSION = 1
+
+# Field kinds
+KIND_STR = 0
+KIND_INT = 1
+KIND_FLOAT = 2
+KIND_STR_LIST = 3
+
+# Table flags
+FLAG_SCALAR = 1
+
+_HEADER = struct.Struct("<8sII4Q")  # magic, version, table count, strings offset/size, lists offset/count
+_TABLE = struct.Struct("<2I4I3QI4x")  # name ref, flags, field count, record count, record size, offsets, capacity
+_FIELD = struct.Struct("<2I2I")  # name ref, kind, offset in record
+_REF = struct.Struct("<2I")  # (offset, length) into the string pool, (start, count) into the list pool
+_SLOT = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_MASK = struct.Struct("<Q")
+
+_RECORD_HEADER_SIZE = _REF.size + _MASK.size
+_MAX_FIELDS = 64
+
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def fnv1a(data: bytes) -> int:
+    """64-bit FNV-1a hash used by the snapshot indexes."""
+    h = _FNV_OFFSET
+    for byte in data:
+        h = ((h ^ byte) * _FNV_PRIME) & _MASK64
+    return h
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _index_capacity(count: int) -> int:
+    """Power of two keeping the load factor at or below one half."""
+    capacity = 8
+    while capacity < count * 2:
+        capacity *= 2
+    return capacity
+
+
+def _field_kind(table: str, field: str, values: list[Any]) -> int:
+    kinds = set()
+    for value in values:
+        if isinstance(value, str):
+            kinds.add(KIND_STR)
+        elif isinstance(value, bool):
+            kinds.add(None)
+        elif isinstance(value, int):
+            kinds.add(KIND_INT)
+        elif isinstance(value, float):
+            kinds.add(KIND_FLOAT)
+        elif isinstance(value, list) and all(isinstance(v, str) for v in value):
+            kinds.add(KIND_STR_LIST)
+        else:
+            kinds.add(None)
+
+    # Whole-number floats come out of JSON as ints, so a mix is stored as float
+    if kinds == {KIND_INT, KIND_FLOAT}:
+        return KIND_FLOAT
+    if len(kinds) != 1 or None in kinds:
+        raise DataValidationError(
+            f"Field {field!r} of table {table!r} cannot be stored in the snapshot",
+            details={"types": sorted({type(v).__name__ for v in values})},
+        )
+    return kinds.pop()
+
+
+class _StringPool:
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.refs: dict[str, tuple[int, int]] = {}
+
+    def add(self, value: str) -> tuple[int, int]:
+        ref = self.refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = self.refs[value] = (len(self.data), len(encoded))
+            self.data += encoded
+        return ref
+
+
+def build_snapshot(tables: Mapping[str, Mapping[str, Any]]) -> bytes:
+    """Encode schema tables (table name -> {key: record}) into the snapshot format.
+
+    Records are dicts of str, int, float or list of str values, or plain strings for scalar tables.
+    """
+    strings = _StringPool()
+    list_refs: list[tuple[int, int]] = []
+    blocks: list[tuple[bytes, bytes, bytes]] = []  # fields, records, index per table
+    descriptors: list[tuple[Any, ...]] = []
+
+    for name, table in tables.items():
+        keys = list(table)
+        values = list(table.values())
+        scalar = any(not isinstance(value, dict) for value in values)
+        if scalar:
+            field_names = [""]
+            rows = [{"": value} for value in values]
+        else:
+            field_names = sorted({field for value in values for field in value})
+            rows = values
+        if len(field_names) > _MAX_FIELDS:
+            raise DataValidationError(f"Table {name!r} has more than {_MAX_FIELDS} fields")
+
+        kinds = [_field_kind(name, field, [row[field] for row in rows if field in row]) for field in field_names]
+        record_size = _RECORD_HEADER_SIZE + 8 * len(field_names)
+
+        fields = bytearray()
+        for position, (field, kind) in enumerate(zip(field_names, kinds, strict=True)):
+            fields += _FIELD.pack(*strings.add(field), kind, _RECORD_HEADER_SIZE + 8 * position)
+
+        records = bytearray(record_size * len(rows))
+        capacity = _index_capacity(len(rows))
+        slots = [0] * capacity
+        for number, (key, row) in enumerate(zip(keys, rows, strict=True)):
+            key = str(key)
+            base = number * record_size
+            _REF.pack_into(records, base, *strings.add(key))
+            mask = 0
+            for position, (field, kind) in enumerate(zip(field_names, kinds, strict=True)):
+                if field not in row:
+                    continue
+                mask |= 1 << position
+                value = row[field]
+                offset = base + _RECORD_HEADER_SIZE + 8 * position
+                if kind == KIND_STR:
+                    _REF.pack_into(records, offset, *strings.add(value))
+                elif kind == KIND_INT:
+                    _INT.pack_into(records, offset, value)
+                elif kind == KIND_FLOAT:
+                    _FLOAT.pack_into(records, offset, value)
+                else:
+                    _REF.pack_into(records, offset, len(list_refs), len(value))
+                    list_refs.extend(strings.add(v) for v in value)
+            _MASK.pack_into(records, base + _REF.size, mask)
+
+            slot = fnv1a(key.encode("utf-8")) & (capacity - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (capacity - 1)
+            slots[slot] = number + 1
+
+        blocks.append((bytes(fields), bytes(records), struct.pack(f"<{capacity}I", *slots)))
+        descriptors.append(
+            (strings.add(name), FLAG_SCALAR if scalar else 0, len(field_names), len(rows), record_size, capacity)
+        )
+
+    # Lay the sections out after the header and table descriptors
+    offset = _align(_HEADER.size + _TABLE.size * len(tables))
+    body = bytearray()
+    table_entries = bytearray()
+    for (name_ref, flags, field_count, record_count, record_size, capacity), block in zip(
+        descriptors, blocks, strict=True
+    ):
+        section_offsets = []
+        for section in block:
+            section_offsets.append(offset + len(body))
+            body += section
+            body += b"\0" * (_align(len(body)) - len(body))
+        table_entries += _TABLE.pack(
+            *name_ref, flags, field_count, record_count, record_size, *section_offsets, capacity
+        )
+
+    lists_offset = offset + len(body)
+    for ref in list_refs:
+        body += _REF.pack(*ref)
+    strings_offset = offset + len(body)
+    body += strings.data
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(tables), strings_offset, len(strings.data), lists_offset, len(list_refs)
+    )
+    head = header + table_entries
+    return head + b"\0" * (offset - len(head)) + body
+
+
+@dataclass(frozen=True, slots=True)
+class _Table:
+    """Decoded table descriptor; the records themselves stay in the mapping."""
+
+    name: str
+    scalar: bool
+    fields: list[tuple[str, int, int]]  # (name, kind, offset in record)
+    record_count: int
+    record_size: int
+    records_offset: int
+    index_offset: int
+    capacity: int
+
+
+class SchemaReader:
+    """Read-only view over a ``schema.bin`` snapshot backed by ``mmap``.
+
+    Opening a snapshot only reads the header and table descriptors. Lookups hash the key, probe the
+    table index and decode the one record they return.
+
+    Example:
+        with SchemaReader("schemas/schema.bin") as schema:
+            schema.get("paints", "44")["name"]
+            schema.get_field("items", "[44]7", "image")
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        try:
+            with self.path.open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ConfigurationError(f"Failed to open schema snapshot: {e}", details={"path": str(self.path)}) from e
+
+        self._buffer = memoryview(self._mmap)
+        try:
+            self._read_header()
+        except (struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise ConfigurationError(f"Corrupt schema snapshot: {e}", details={"path": str(self.path)}) from e
+
+    def _read_header(self) -> None:
+        magic, version, table_count, strings_offset, strings_size, lists_offset, _ = _HEADER.unpack_from(
+            self._buffer, 0
+        )
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ConfigurationError(
+                "Unsupported schema snapshot", details={"path": str(self.path), "version": version}
+            )
+        if strings_offset + strings_size > len(self._buffer):
+            raise ConfigurationError("Truncated schema snapshot", details={"path": str(self.path)})
+
+        self._strings_offset = strings_offset
+        self._lists_offset = lists_offset
+        self._tables: dict[str, _Table] = {}
+        for number in range(table_count):
+            (
+                name_offset,
+                name_size,
+                flags,
+                field_count,
+                record_count,
+                record_size,
+                fields_offset,
+                records_offset,
+                index_offset,
+                capacity,
+            ) = _TABLE.unpack_from(self._buffer, _HEADER.size + number * _TABLE.size)
+            fields = []
+            for position in range(field_count):
+                field_offset, field_size, kind, offset = _FIELD.unpack_from(
+                    self._buffer, fields_offset + position * _FIELD.size
+                )
+                fields.append((self._string(field_offset, field_size), kind, offset))
+            name = self._string(name_offset, name_size)
+            self._tables[name] = _Table(
+                name=name,
+                scalar=bool(flags & FLAG_SCALAR),
+                fields=fields,
+                record_count=record_count,
+                record_size=record_size,
+                records_offset=records_offset,
+                index_offset=index_offset,
+                capacity=capacity,
+            )
+
+    def close(self) -> None:
+        """Release the mapping. Values already returned stay valid."""
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "SchemaReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def tables(self) -> list[str]:
+        """Names of the tables in the snapshot."""
+        return list(self._tables)
+
+    def fields(self, table: str) -> list[str]:
+        """Field names of a table (empty for scalar tables)."""
+        descriptor = self._table(table)
+        return [] if descriptor.scalar else [name for name, _, _ in descriptor.fields]
+
+    def count(self, table: str) -> int:
+        """Number of records in a table."""
+        return self._table(table).record_count
+
+    def contains(self, table: str, key: str) -> bool:
+        """Whether a table holds a record for a key."""
+        return self._find(self._table(table), key) is not None
+
+    def get(self, table: str, key: str, default: Any = None) -> Any:
+        """Record of a key as a dict (or the value of a scalar table), or ``default`` if absent."""
+        descriptor = self._table(table)
+        base = self._find(descriptor, key)
+        if base is None:
+            return default
+        return self._decode(descriptor, base)
+
+    def get_many(self, table: str, keys: list[str]) -> list[Any]:
+        """Records of several keys, ``None`` for the absent ones."""
+        descriptor = self._table(table)
+        results = []
+        for key in keys:
+            base = self._find(descriptor, key)
+            results.append(None if base is None else self._decode(descriptor, base))
+        return results
+
+    def get_field(self, table: str, key: str, field: str, default: Any = None) -> Any:
+        """One field of a record without decoding the others."""
+        descriptor = self._table(table)
+        base = self._find(descriptor, key)
+        if base is None:
+            return default
+        mask = _MASK.unpack_from(self._buffer, base + _REF.size)[0]
+        for position, (name, kind, offset) in enumerate(descriptor.fields):
+            if name == field:
+                return self._value(kind, base + offset) if mask >> position & 1 else default
+        raise KeyError(field)
+
+    def keys(self, table: str) -> Iterator[str]:
+        """Keys of a table in their original order."""
+        descriptor = self._table(table)
+        for number in range(descriptor.record_count):
+            base = descriptor.records_offset + number * descriptor.record_size
+            yield self._string(*_REF.unpack_from(self._buffer, base))
+
+    def items(self, table: str) -> Iterator[tuple[str, Any]]:
+        """(key, record) pairs of a table in their original order."""
+        descriptor = self._table(table)
+        for number in range(descriptor.record_count):
+            base = descriptor.records_offset + number * descriptor.record_size
+            yield self._string(*_REF.unpack_from(self._buffer, base)), self._decode(descriptor, base)
+
+    def _table(self, table: str) -> _Table:
+        try:
+            return self._tables[table]
+        except KeyError:
+            raise KeyError(f"Unknown snapshot table: {table}") from None
+
+    def _find(self, descriptor: _Table, key: str) -> int | None:
+        """Offset of the record for a key, found through the table's hash index."""
+        encoded = key.encode("utf-8")
+        buffer = self._buffer
+        mask = descriptor.capacity - 1
+        slot = fnv1a(encoded) & mask
+        while True:
+            number = _SLOT.unpack_from(buffer, descriptor.index_offset + slot * _SLOT.size)[0]
+            if not number:
+                return None
+            base = descriptor.records_offset + (number - 1) * descriptor.record_size
+            offset, size = _REF.unpack_from(buffer, base)
+            start = self._strings_offset + offset
+            if size == len(encoded) and buffer[start : start + size] == encoded:
+                return base
+            slot = (slot + 1) & mask
+
+    def _decode(self, descriptor: _Table, base: int) -> Any:
+        mask = _MASK.unpack_from(self._buffer, base + _REF.size)[0]
+        if descriptor.scalar:
+            _, kind, offset = descriptor.fields[0]
+            return self._value(kind, base + offset)
+        return {
+            name: self._value(kind, base + offset)
+            for position, (name, kind, offset) in enumerate(descriptor.fields)
+            if mask >> position & 1
+        }
+
+    def _value(self, kind: int, offset: int) -> Any:
+        if kind == KIND_STR:
+            return self._string(*_REF.unpack_from(self._buffer, offset))
+        if kind == KIND_INT:
+            return _INT.unpack_from(self._buffer, offset)[0]
+        if kind == KIND_FLOAT:
+            return _FLOAT.unpack_from(self._buffer, offset)[0]
+        start, count = _REF.unpack_from(self._buffer, offset)
+        refs = self._lists_offset + start * _REF.size
+        return [self._string(*_REF.unpack_from(self._buffer, refs + i * _REF.size)) for i in range(count)]
+
+    def _string(self, offset: int, size: int) -> str:
+        start = self._strings_offset + offset
+        return str(self._buffer[start : start + size], "utf-8")
@@ -1,11 +1,32 @@
+import hashlib
+import importlib
+import json
+import logging
+import os
+import tempfile
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
+import sqlalchemy
 from sqlalchemy import Column, ForeignKey, Index, MetaData, Table, UniqueConstraint, create_mock_engine
-from sqlalchemy.dialects import mssql, mysql, oracle, postgresql, sqlite
 from sqlalchemy.engine.interfaces import Dialect
-from sqlalchemy.types import Float, SmallInteger, String, TypeEngine
+from sqlalchemy.types import Boolean, Float, SmallInteger, String, TypeEngine
+
+from ..services.instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+# (dialect module, file suffix) pairs for 'create' scripts; modules are imported on demand
+DDL_DIALECTS: list[tuple[str, str]] = [
+    ("postgresql", "postgre"),
+    ("mysql", "mysql"),
+    ("sqlite", "sqlite"),
+    ("mssql", "mssql"),
+    ("oracle", "oracle"),
+]
 
 metadata = MetaData()
 
@@ -146,6 +167,21 @@ ItemsContainersJunction = Table(
     Index("idx_item_container", "item", "container", unique=True),
 )
 
+# One row per container and droppable item; special (knife and gloves) rows have no rarity and may
+# reference unpainted definitions that are not in the items table
+ContainerDrops = Table(
+    "container_drops",
+    metadata,
+    Column("container", SmallInteger, ForeignKey(Containers.c.defindex), primary_key=True, nullable=False),
+    Column("item", String(16), primary_key=True, nullable=False),
+    Column("rarity", SmallInteger, ForeignKey(Rarities.c.id)),
+    Column("special", Boolean, nullable=False),
+    Column("odds", Float, nullable=False),
+    Column("stattrak", Boolean, nullable=False),
+    Column("souvenir", Boolean, nullable=False),
+    Index("idx_container_drops_rarity", "container", "rarity"),
+)
+
 MusicsMusicKitsJunction = Table(
     "musics_music_kits",
     metadata,
@@ -165,6 +201,58 @@ StickerKitsContainersJunction = Table(
 )
 
 
+def _load_dialect(name: str) -> Dialect:
+    """Import a SQLAlchemy dialect module lazily and instantiate its dialect."""
+    module = importlib.import_module(f"sqlalchemy.dialects.{name}")
+    return module.dialect()
+
+
+def _sqlite_dialect() -> Dialect:
+    return _load_dialect("sqlite")
+
+
+def metadata_fingerprint(meta: MetaData = metadata) -> str:
+    """Hash the table definitions together with the SQLAlchemy version.
+
+    Only names, types, keys, constraints and indexes take part, so the digest is stable between runs
+    and changes whenever the generated DDL could change.
+    """
+    parts: list[str] = [f"sqlalchemy={sqlalchemy.__version__}"]
+    for table in meta.sorted_tables:
+        parts.append(f"table {table.name}")
+        for column in table.columns:
+            fks = ",".join(sorted(fk.target_fullname for fk in column.foreign_keys))
+            parts.append(
+                f"  column {column.name} {column.type!r} pk={column.primary_key} "
+                f"nullable={column.nullable} autoincrement={column.autoincrement} fk={fks}"
+            )
+        for constraint in sorted(table.constraints, key=lambda c: (type(c).__name__, str(c.name))):
+            columns = ",".join(column.name for column in constraint.columns)
+            parts.append(f"  constraint {type(constraint).__name__} {constraint.name} ({columns})")
+        for index in sorted(table.indexes, key=lambda i: str(i.name)):
+            columns = ",".join(column.name for column in index.columns)
+            parts.append(f"  index {index.name} unique={index.unique} ({columns})")
+
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _compile_create_script(dialect_name: str) -> str:
+    """Compile the 'create' script of the whole metadata for a single dialect."""
+    dialect = _load_dialect(dialect_name)
+    script_arr: list[str] = []
+
+    def dump(sql: TypeEngine, *multiparams: Any, **params: Any) -> None:
+        exp = sql.compile(dialect=dialect)
+        script_arr.append(str(exp))
+
+    engine = create_mock_engine("sqlite:///:memory:", dump)
+    metadata.create_all(engine, checkfirst=False)
+
+    script_arr.append("\n")
+
+    return ";".join(script_arr)
+
+
 @dataclass(eq=False, repr=False)
 class SQLCreator:
     types: dict[str, str]
@@ -174,6 +262,7 @@ class SQLCreator:
     musics: dict[str, dict[str, str]]
     rarities: dict[str, dict[str, Any]]
     containers: dict[str, dict[str, Any]]
+    container_drops: dict[str, dict[str, Any]]
     sticker_kit_containers: dict[str, dict[str, Any]]
     items: dict[str, dict[str, Any]]
     sticker_kits: dict[str, dict[str, Any]]
@@ -183,43 +272,62 @@ class SQLCreator:
     origins: dict[str, str]
     wears: list[dict[str, Any]]
 
-    dialect: Dialect = field(default_factory=sqlite.dialect)
+    dialect: Dialect = field(default_factory=_sqlite_dialect)
+    # Directory for cached 'create' scripts, caching is disabled when None
+    cache_dir: Path | None = None
 
     def _create_expression(self) -> list[tuple[str, str]]:
-        # create 'create' scripts
-
-        scripts = []
-        for dialect, file_suffix in [
-            (postgresql.dialect(), "postgre"),
-            (mysql.dialect(), "mysql"),
-            (sqlite.dialect(), "sqlite"),
-            (mssql.dialect(), "mssql"),
-            (oracle.dialect(), "oracle"),
-        ]:
-            file = f"create_{file_suffix}.sql"
-
-            script_arr: list[str] = []
-
-            def dump(
-                sql: TypeEngine,
-                *multiparams: Any,
-                dialect: Dialect = dialect,
-                script_arr: list[str] = script_arr,
-                **params: Any,
-            ) -> None:
-                exp = sql.compile(dialect=dialect)
-                script_arr.append(str(exp))
-
-            engine = create_mock_engine("sqlite:///:memory:", dump)
-            metadata.create_all(engine, checkfirst=False)
-
-            script_arr.append("\n")
-
-            script_joined = ";".join(script_arr)
-            scripts.append((file, script_joined))
+        # create 'create' scripts, reusing cached output while the metadata is unchanged
+        cache_file = None
+        if self.cache_dir is not None:
+            cache_file = self.cache_dir / f"ddl-{metadata_fingerprint()}.json"
+            if cached := self._read_ddl_cache(cache_file):
+                return cached
+
+        dialect_names = [name for name, _ in DDL_DIALECTS]
+        with ThreadPoolExecutor(max_workers=len(dialect_names)) as executor:
+            compiled = list(executor.map(_compile_create_script, dialect_names))
+
+        scripts = [(f"create_{suffix}.sql", script) for (_, suffix), script in zip(DDL_DIALECTS, compiled, strict=True)]
 
+        if cache_file is not None:
+            self._write_ddl_cache(cache_file, scripts)
+
+        return scripts
+
+    @staticmethod
+    def _read_ddl_cache(cache_file: Path) -> list[tuple[str, str]] | None:
+        try:
+            with cache_file.open("r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable DDL cache {cache_file}: {e}")
+            return None
+
+        scripts = [(f"create_{suffix}.sql", cached.get(suffix)) for _, suffix in DDL_DIALECTS]
+        if not all(isinstance(script, str) for _, script in scripts):
+            return None
+
+        logger.debug(f"Using cached DDL from {cache_file}")
         return scripts
 
+    @staticmethod
+    def _write_ddl_cache(cache_file: Path, scripts: list[tuple[str, str]]) -> None:
+        payload = {file[len("create_") : -len(".sql")]: script for file, script in scripts}
+        tmp_path = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=".ddl-", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write DDL cache {cache_file}: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
     def _base_field(self, table: Table, source: Mapping[str, str | dict[str, str]]) -> list[str]:
         statements = []
         for type_id, type_data in source.items():
@@ -379,6 +487,34 @@ class SQLCreator:
 
         return containers, junctions
 
+    def _populate_container_drops(self) -> list[str]:
+        drops = []
+        for defindex, drop_data in self.container_drops.items():
+            groups = [(rarity, False, group) for rarity, group in drop_data["rarities"].items()]
+            if "special" in drop_data:
+                groups.append((None, True, drop_data["special"]))
+
+            for rarity, special, group in groups:
+                # Odds of a single item: the group's odds are shared evenly between its items
+                odds = round(group["odds"] / len(group["items"]), 8)
+                for item_id in group["items"]:
+                    drops.append(
+                        ContainerDrops.insert()
+                        .values(
+                            container=int(defindex),
+                            item=item_id,
+                            rarity=int(rarity) if rarity is not None else None,
+                            special=special,
+                            odds=odds,
+                            stattrak=drop_data["stattrak"],
+                            souvenir=drop_data["souvenir"],
+                        )
+                        .compile(dialect=self.dialect, compile_kwargs={"literal_binds": True})
+                        .string
+                    )
+
+        return drops
+
     def _populate_sticker_kit_containers(self) -> tuple[list[str], list[str]]:
         containers = []
         junctions = []
@@ -432,24 +568,26 @@ class SQLCreator:
         return containers, junctions
 
     def create(self) -> list[tuple[str, str]]:
-        create_scripts = self._create_expression()
+        with span("ddl"):
+            create_scripts = self._create_expression()
 
-        types, origins, musics, qualities, phases, tints = self._populate_base_fields()
+        with span("populate") as stage:
+            types, origins, musics, qualities, phases, tints = self._populate_base_fields()
 
-        rarities = self._populate_rarities()
-        wears = self._populate_wears()
-        defs = self._populate_defs()
-        paints = self._populate_paints()
+            rarities = self._populate_rarities()
+            wears = self._populate_wears()
+            defs = self._populate_defs()
+            paints = self._populate_paints()
 
-        items = self._populate_items()
-        sticker_kits = self._populate_sticker_kits()
+            items = self._populate_items()
+            sticker_kits = self._populate_sticker_kits()
 
-        containers, items_junc = self._populate_containers()
-        sticker_kit_container, stick_junc = self._populate_sticker_kit_containers()
-        music_kits, music_junc = self._populate_music_kits()
+            containers, items_junc = self._populate_containers()
+            container_drops = self._populate_container_drops()
+            sticker_kit_container, stick_junc = self._populate_sticker_kit_containers()
+            music_kits, music_junc = self._populate_music_kits()
 
-        populate = ";\n".join(
-            [
+            statements = [
                 *types,
                 *origins,
                 *musics,
@@ -464,11 +602,14 @@ class SQLCreator:
                 *sticker_kits,
                 *containers,
                 *items_junc,
+                *container_drops,
                 *music_kits,
                 *music_junc,
                 *sticker_kit_container,
                 *stick_junc,
             ]
-        )
+            stage.set_records(len(statements))
+
+        populate = ";\n".join(statements)
 
         return [*create_scripts, ("populate.sql", populate + ";\n")]